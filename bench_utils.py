@@ -0,0 +1,98 @@
+"""
+Measurement helpers shared by the benchmarks.
+
+Latency histograms with fixed buckets, log-log scaling plots (when
+matplotlib is installed) and resident set size sampling, read from /proc
+by a background thread so short peaks inside a measured call are seen.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+# Upper bounds of the latency histogram buckets, in seconds
+HISTOGRAM_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+RSS_INTERVAL = 0.005
+
+
+def histogram(values: list[float], bounds: tuple = HISTOGRAM_BOUNDS) -> dict:
+    """
+    Count values per bucket. Keys are "<=bound" labels in seconds, plus
+    ">last" for values above the last bound.
+    """
+    counts = {f"<={bound}": 0 for bound in bounds}
+    counts[f">{bounds[-1]}"] = 0
+    for value in values:
+        index = bisect.bisect_left(bounds, value)
+        label = f"<={bounds[index]}" if index < len(bounds) else f">{bounds[-1]}"
+        counts[label] += 1
+    return counts
+
+
+def plot_scaling(
+    panels: dict[str, dict[str, tuple[list[float], list[float]]]],
+    x_label: str,
+    path: Path,
+) -> bool:
+    """
+    Plot one log-log panel per title, each with named (x, y) series, into
+    an image at path. Return False if matplotlib is not installed.
+    """
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+
+    fig, axes = plt.subplots(
+        1, len(panels), figsize=(5 * len(panels), 4), squeeze=False
+    )
+    for ax, (title, series) in zip(axes[0], panels.items()):
+        for label, (xs, ys) in series.items():
+            ax.plot(xs, ys, marker="o", label=label)
+        ax.set(title=title, xlabel=x_label, xscale="log", yscale="log")
+        ax.grid(True, which="both", alpha=0.3)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+    return True
+
+
+def current_rss() -> int:
+    """Return the resident set size of this process in bytes (Linux)."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class RssSampler:
+    """Context manager tracking the peak RSS of the process in a thread."""
+
+    def __init__(self, interval: float = RSS_INTERVAL):
+        self.interval = interval
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self) -> RssSampler:
+        self.baseline = self.peak = current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
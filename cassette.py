@@ -0,0 +1,244 @@
+"""
+HTTP record/replay for the SDK traffic of a scenario.
+
+In record mode every exchange that goes through requests (Core API calls,
+token refreshes) is captured into a gzipped JSON-lines cassette, one per
+scenario. In replay mode the same responses are served from the cassette
+without touching the network, optionally with their recorded latency, so
+client-side code paths (entity construction, YAML export/import, spec
+validation) can be profiled in isolation.
+
+Configured through the environment:
+
+    CASSETTE_MODE     record | replay (unset: disabled)
+    CASSETTE_DIR      directory of the cassettes (default: <repo>/cassettes)
+    CASSETTE_LATENCY  replay latency factor, 0 = no delay, 1 = recorded speed
+
+Requests are matched by method and URL path/query with entity ids masked,
+since the SDK generates new ids on every run. Repeated requests, such as
+waiter polls, are answered in recorded order and the last answer is reused
+once they are exhausted. Object storage traffic (boto3) is not captured.
+
+Bodies are stored as text when they are UTF-8 and base64 otherwise, so
+binary responses replay byte for byte. Credentials are redacted when
+recording: token fields of JSON bodies, every value returned by the
+secrets data endpoint and sensitive query parameters of kept headers.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+import typing
+from collections import defaultdict, deque
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+if typing.TYPE_CHECKING:
+    from requests import PreparedRequest, Response
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_DIR = BASE_DIR / "cassettes"
+# Response headers worth keeping, everything else is dropped
+KEPT_HEADERS = ("Content-Type", "Location")
+REDACTED = "<redacted>"
+# JSON fields and query parameters whose values are credentials
+_SENSITIVE = re.compile(
+    r"token|secret|password|passwd|credential|access_key|api_key|^code$",
+    re.IGNORECASE,
+)
+_ID = re.compile(
+    r"[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def request_key(method: str, url: str) -> str:
+    """Return the matching key of a request: method, path and sorted query."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    target = f"{parts.path}?{query}" if query else parts.path
+    return f"{method.upper()} {_ID.sub('{id}', target)}"
+
+
+def _redact_json(value: typing.Any, redact_all: bool = False) -> typing.Any:
+    """Replace the string values of sensitive fields, or all of them."""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED
+            if isinstance(v, str) and (redact_all or _SENSITIVE.search(k))
+            else _redact_json(v, redact_all)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_json(v, redact_all) for v in value]
+    return value
+
+
+def _redact_url(url: str) -> str:
+    """Replace the values of sensitive query parameters of a URL."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = [
+        (k, REDACTED if _SENSITIVE.search(k) else v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def redact(key: str, headers: dict[str, str], body: bytes) -> tuple[dict, bytes]:
+    """Return the headers and body of a response with credentials removed."""
+    if "Location" in headers:
+        headers = {**headers, "Location": _redact_url(headers["Location"])}
+    if "json" not in headers.get("Content-Type", ""):
+        return headers, body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return headers, body
+    # The secrets data endpoint returns secret values keyed by secret name
+    redact_all = "/secrets/data" in key.split("?")[0]
+    return headers, json.dumps(_redact_json(data, redact_all)).encode()
+
+
+def encode_body(body: bytes) -> dict:
+    """Return a body as UTF-8 text if it is text, base64 otherwise."""
+    try:
+        return {"body": body.decode("utf-8"), "text": True}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(body).decode("ascii"), "text": False}
+
+
+def decode_body(exchange: dict) -> bytes:
+    """Return the recorded body bytes of an exchange."""
+    if exchange.get("text", True):
+        return exchange["body"].encode("utf-8")
+    return base64.b64decode(exchange["body"])
+
+
+class Cassette:
+    """Recorded HTTP exchanges of one scenario."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.exchanges: list[dict] = []
+        self._queues: dict[str, deque[dict]] = defaultdict(deque)
+        self._last: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        cassette = cls(path)
+        with gzip.open(path, "rt") as f:
+            for line in f:
+                exchange = json.loads(line)
+                cassette.exchanges.append(exchange)
+                cassette._queues[exchange["key"]].append(exchange)
+        return cassette
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt") as f:
+            for exchange in self.exchanges:
+                f.write(json.dumps(exchange, separators=(",", ":")) + "\n")
+        logger.info("Recorded %s exchanges to %s", len(self.exchanges), self.path)
+
+    def record(self, request: PreparedRequest, response: Response, elapsed: float):
+        key = request_key(request.method, request.url)
+        headers, body = redact(
+            key,
+            {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers},
+            response.content,
+        )
+        exchange = {
+            "key": key,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+            **encode_body(body),
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def next(self, request: PreparedRequest) -> dict:
+        key = request_key(request.method, request.url)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            elif key not in self._last:
+                raise CassetteMiss(f"No recorded response for {key}")
+            return self._last[key]
+
+
+def _build_response(request: PreparedRequest, exchange: dict) -> Response:
+    response = requests.Response()
+    response.status_code = exchange["status"]
+    response.reason = exchange["reason"]
+    response.headers.update(exchange["headers"])
+    response._content = decode_body(exchange)
+    if exchange.get("text", True):
+        response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def install(mode: str, path: Path, latency: float = 0.0) -> Cassette:
+    """
+    Patch requests so that every exchange is recorded to, or replayed from,
+    the cassette at path. Recordings are saved when the process exits.
+    """
+    original_send = requests.Session.send
+
+    if mode == "record":
+        cassette = Cassette(path)
+
+        def send(self, request, **kwargs):
+            start = time.monotonic()
+            response = original_send(self, request, **kwargs)
+            cassette.record(request, response, time.monotonic() - start)
+            return response
+
+        atexit.register(cassette.save)
+    elif mode == "replay":
+        cassette = Cassette.load(path)
+
+        def send(self, request, **kwargs):
+            exchange = cassette.next(request)
+            if latency:
+                time.sleep(exchange["elapsed"] * latency)
+            return _build_response(request, exchange)
+
+    else:
+        raise ValueError(f"Unknown cassette mode: {mode!r}")
+
+    requests.Session.send = send
+    logger.info("Cassette %s mode on %s", mode, path)
+    return cassette
+
+
+def install_from_env(name: str) -> Cassette | None:
+    """Install the cassette named after the scenario if CASSETTE_MODE is set."""
+    mode = os.environ.get("CASSETTE_MODE")
+    if not mode:
+        return None
+    directory = Path(os.environ.get("CASSETTE_DIR", DEFAULT_DIR))
+    latency = float(os.environ.get("CASSETTE_LATENCY", "0"))
+    return install(mode, directory / f"{name}.jsonl.gz", latency)
@@ -0,0 +1,78 @@
+"""
+Bulk deletion of backend entities.
+
+Deletes are issued concurrently through a bounded thread pool and the
+outcome is confirmed with a single listing, polled by the waiter only if
+the backend has not caught up yet.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from waiter import wait_until
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+DEFAULT_WORKERS = 8
+logger = logging.getLogger(__name__)
+
+
+def bulk_delete(
+    delete_fn: Callable[..., typing.Any],
+    keys: Iterable[str],
+    list_fn: Callable[[], Iterable[typing.Any]] | None = None,
+    workers: int = DEFAULT_WORKERS,
+    **delete_kwargs: typing.Any,
+) -> dict:
+    """
+    Delete every key with delete_fn(key, **delete_kwargs) using at most
+    workers concurrent calls.
+
+    Flags such as cascade or delete_all_versions are forwarded as
+    delete_kwargs. If list_fn is given, wait until none of the deleted keys
+    is listed anymore. Return deletion statistics, including throughput in
+    deletes per second. The first delete error, if any, is re-raised once
+    every other delete has completed.
+    """
+    keys = list(dict.fromkeys(keys))
+    stats = {"deleted": 0, "failed": 0, "elapsed_s": 0.0, "throughput": 0.0}
+    if not keys:
+        return stats
+
+    start = time.monotonic()
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(keys)))) as pool:
+        futures = [pool.submit(delete_fn, key, **delete_kwargs) for key in keys]
+        for future in futures:
+            try:
+                future.result()
+                stats["deleted"] += 1
+            except Exception as e:
+                stats["failed"] += 1
+                errors.append(e)
+
+    if list_fn is not None and not errors:
+        pending = set(keys)
+        wait_until(
+            lambda: not pending.intersection(e.key for e in list_fn()),
+            description=f"deletion of {len(keys)} entities",
+        )
+
+    elapsed = time.monotonic() - start
+    stats["elapsed_s"] = round(elapsed, 3)
+    stats["throughput"] = round(stats["deleted"] / elapsed, 2) if elapsed else 0.0
+    logger.info(
+        "Deleted %s entities in %.2fs (%.1f deletes/s, %s failed)",
+        stats["deleted"],
+        elapsed,
+        stats["throughput"],
+        stats["failed"],
+    )
+    if errors:
+        raise errors[0]
+    return stats
@@ -2,7 +2,8 @@
 # Execute main.py in the specified test folder
 # Usage: ./execute.sh <folder_name> [additional args...]
 # Example: ./execute.sh s0-crud --verbose --config=test.yaml
-# If no folder is specified, all tests will be executed
+# If no folder is specified, all tests will be executed concurrently by
+# scheduler.py (set SCHEDULER_PARALLELISM to limit how many run at once)
 
 set -e
 
@@ -11,18 +12,8 @@ export PROJECT_NAME="${PROJECT_NAME:-digitalhub-tests}"
 
 if [ -z "$1" ]; then
     echo "No test folder specified - executing all tests..."
-    for TEST_FOLDER in $(ls -d s*/ | tr -d '/'); do
-        MAIN_FILE="/app/${TEST_FOLDER}/main.py"
-        if [ -f "$MAIN_FILE" ]; then
-            echo "========================================"
-            echo "Executing tests in ${TEST_FOLDER}..."
-            echo "========================================"
-            cd "/app/${TEST_FOLDER}"
-            python main.py || echo "Warning: ${TEST_FOLDER} failed"
-            cd /app
-        fi
-    done
-    exit 0
+    cd /app
+    exec python scheduler.py
 fi
 
 TEST_FOLDER="$1"
@@ -0,0 +1,147 @@
+"""
+Import-time budget check for the scenario entry points.
+
+Each target module is imported in a fresh interpreter with -X importtime
+and the total import time is compared against a budget. The slowest
+direct imports of each target are reported so regressions can be traced
+to the package that caused them. The exit status is 1 if any target is
+over budget.
+
+    python importtime.py --budget 2.5 s0-crud s1-etl:main
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from logging_utils import configure_logging
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_BUDGET = float(os.environ.get("IMPORT_BUDGET_S", "3.0"))
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$")
+logger = configure_logging(__name__)
+
+
+def parse_importtime(output: str) -> list[dict]:
+    """
+    Parse -X importtime output into entries with the module name, its own
+    and cumulative import time in seconds and its nesting depth.
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append(
+            {
+                "module": name,
+                "self_s": int(self_us) / 1e6,
+                "cumulative_s": int(cumulative_us) / 1e6,
+                "depth": (len(indent) - 1) // 2,
+            }
+        )
+    return entries
+
+
+def measure(folder: str, module: str) -> dict:
+    """Import module from the folder in a fresh interpreter and time it."""
+    start = time.monotonic()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR / folder,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.monotonic() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed in {folder}:\n{proc.stderr}")
+    entries = parse_importtime(proc.stderr)
+    # The target is the last top-level entry, its children follow it directly
+    target = max(i for i, e in enumerate(entries) if e["depth"] == 0)
+    first = target
+    while first > 0 and entries[first - 1]["depth"] > 0:
+        first -= 1
+    children = [e for e in entries[first:target] if e["depth"] == 1]
+    return {
+        "total_s": sum(e["self_s"] for e in entries),
+        "target_s": entries[target]["cumulative_s"],
+        "wall_s": wall,
+        "children": sorted(children, key=lambda e: -e["cumulative_s"]),
+    }
+
+
+def parse_target(spec: str) -> tuple[str, str]:
+    """Split "folder[:module]" into the folder and module (default main)."""
+    folder, _, module = spec.partition(":")
+    return folder, module or "main"
+
+
+def main(argv=None) -> None:
+    """Measure the import time of every target and enforce the budget."""
+    parser = argparse.ArgumentParser(description="Check the import-time budget.")
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="folder[:module] to import (default: main of every scenario).",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET,
+        help=f"Maximum import time in seconds (default: {DEFAULT_BUDGET}).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Imports per target; the fastest one is kept, the first warms caches.",
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="Slowest direct imports to report."
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+
+    targets = args.targets or sorted(
+        p.parent.name for p in BASE_DIR.glob("s*/main.py")
+    )
+    results = {}
+    for spec in targets:
+        folder, module = parse_target(spec)
+        runs = [measure(folder, module) for _ in range(max(args.repeat, 1))]
+        best = min(runs, key=lambda r: r["total_s"])
+        best["over_budget"] = best["total_s"] > args.budget
+        best["children"] = best["children"][: args.top]
+        results[f"{folder}:{module}"] = best
+        logger.info(
+            "%s %s:%s imports in %.3fs (budget %.3fs, wall %.3fs)",
+            "✗" if best["over_budget"] else "✓",
+            folder,
+            module,
+            best["total_s"],
+            args.budget,
+            best["wall_s"],
+        )
+        for child in best["children"]:
+            logger.info("    %8.3fs  %s", child["cumulative_s"], child["module"])
+
+    if args.report is not None:
+        report = {"budget_s": args.budget, "targets": results}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+    over = [t for t, r in results.items() if r["over_budget"]]
+    if over:
+        logger.error("Over the import-time budget: %s", ", ".join(over))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Pool of pre-created, pre-shared test projects.
+
+Instead of deleting and re-creating a project for every suite, projects are
+created and shared once, kept across runs, and reset by wiping their
+entities in bulk before they are handed out again.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import digitalhub as dh
+from cleanup import DEFAULT_WORKERS, bulk_delete
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from digitalhub.entities.project._base.entity import Project
+
+# Entity types wiped on reset, dependents first, with their delete flags
+RESET_PLAN = (
+    ("run", {}),
+    ("trigger", {}),
+    ("task", {}),
+    ("workflow", {"delete_all_versions": True}),
+    ("function", {"delete_all_versions": True}),
+    ("artifact", {"delete_all_versions": True, "cascade": False}),
+    ("dataitem", {"delete_all_versions": True, "cascade": False}),
+    ("model", {"delete_all_versions": True, "cascade": False}),
+    ("containerimage", {"delete_all_versions": True, "cascade": False}),
+    ("secret", {}),
+)
+logger = logging.getLogger(__name__)
+
+
+def wipe_project(project: Project, workers: int = DEFAULT_WORKERS) -> int:
+    """Delete every entity of the project in bulk and return how many."""
+    deleted = 0
+    for entity_type, flags in RESET_PLAN:
+        list_fn = getattr(project, f"list_{entity_type}s")
+        keys = [e.key for e in list_fn()]
+        stats = bulk_delete(
+            getattr(dh, f"delete_{entity_type}"),
+            keys,
+            list_fn,
+            workers=workers,
+            **flags,
+        )
+        deleted += stats["deleted"]
+    return deleted
+
+
+def prepare_project(name: str, existing: set[str] | None = None) -> Project:
+    """
+    Return the project, creating and sharing it only if it does not exist.
+    """
+    if existing is None:
+        existing = {p.name for p in dh.list_projects()}
+    if name in existing:
+        return dh.get_project(name)
+    project = dh.new_project(name)
+    project.share("*")
+    return project
+
+
+class ProjectPool:
+    """
+    Fixed set of named projects handed out to suites one at a time.
+
+    Projects are wiped when the pool is warmed and whenever they are
+    released, so acquire() always returns a clean project without waiting
+    for a teardown.
+    """
+
+    def __init__(self, names: list[str], workers: int = DEFAULT_WORKERS):
+        self.names = list(names)
+        self.workers = workers
+        self._free: queue.Queue[Project] = queue.Queue()
+
+    def _warm_one(self, name: str, existing: set[str]) -> Project:
+        project = prepare_project(name, existing)
+        deleted = wipe_project(project, self.workers)
+        logger.info("Project %s ready (%s leftover entities wiped)", name, deleted)
+        return project
+
+    def warm(self) -> None:
+        """Create missing projects and reset all of them concurrently."""
+        existing = {p.name for p in dh.list_projects()}
+        with ThreadPoolExecutor(max_workers=len(self.names) or 1) as executor:
+            projects = executor.map(
+                lambda name: self._warm_one(name, existing), self.names
+            )
+            for project in projects:
+                self._free.put(project)
+
+    def acquire(self, timeout: float | None = None) -> Project:
+        """Take a clean project from the pool, blocking until one is free."""
+        return self._free.get(timeout=timeout)
+
+    def release(self, project: Project) -> None:
+        """Wipe the project and return it to the pool."""
+        try:
+            wipe_project(project, self.workers)
+        finally:
+            self._free.put(project)
+
+    @contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[Project]:
+        """Context manager that acquires a project and releases it on exit."""
+        project = self.acquire(timeout)
+        try:
+            yield project
+        finally:
+            self.release(project)
@@ -0,0 +1,285 @@
+"""
+Batch export and import of a project's entities as YAML.
+
+Every version of the project's artifacts, dataitems, models, container
+images, functions and workflows is exported to a directory, one YAML file
+per entity under <type>/, or to a single .tar.gz archive with the same
+layout. An export is imported back, possibly into another project or
+another Core. Each phase (collect, serialise, write, read, create) runs
+on a thread pool and is timed, so throughput in entities per second is
+reported for each of them.
+
+    python project_transfer.py export my-project /tmp/my-project.tar.gz
+    python project_transfer.py import /tmp/my-project.tar.gz --project copy
+    python project_transfer.py roundtrip my-project --project copy
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import typing
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import digitalhub as dh
+import yaml
+
+from logging_utils import configure_logging
+from project_pool import prepare_project
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Runs, tasks and triggers are left out, Core would execute them again
+TRANSFER_TYPES = (
+    "artifact",
+    "dataitem",
+    "model",
+    "containerimage",
+    "function",
+    "workflow",
+)
+DEFAULT_WORKERS = 16
+ARCHIVE_SUFFIX = ".tar.gz"
+logger = configure_logging(__name__)
+
+
+def _phase(
+    name: str,
+    fn: Callable[[typing.Any], typing.Any],
+    items: Iterable[typing.Any],
+    workers: int,
+    stats: dict,
+) -> list[typing.Any]:
+    """Map fn over items on a thread pool and record the phase throughput."""
+    items = list(items)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(fn, items))
+    elapsed = time.monotonic() - start
+    stats[name] = {
+        "entities": len(items),
+        "elapsed_s": round(elapsed, 3),
+        "entities_per_s": round(len(items) / elapsed, 1) if elapsed else 0.0,
+    }
+    logger.info(
+        "%-9s %6s entities in %6.2fs (%.1f entities/s)",
+        name,
+        len(items),
+        elapsed,
+        stats[name]["entities_per_s"],
+    )
+    return results
+
+
+def _relative_path(entity_type: str, entity: dict) -> str:
+    return f"{entity_type}/{entity['name']}-{entity['id']}.yaml"
+
+
+def export_project(
+    project_name: str, dest: Path, workers: int = DEFAULT_WORKERS
+) -> dict:
+    """
+    Export every version of the project's entities to dest, a directory or
+    a path ending in .tar.gz. Return the phase statistics.
+    """
+    stats: dict = {}
+
+    def _versions(item: tuple[str, str]) -> list[tuple[str, typing.Any]]:
+        entity_type, name = item
+        get_versions = getattr(dh, f"get_{entity_type}_versions")
+        return [(entity_type, v) for v in get_versions(name, project=project_name)]
+
+    names = [
+        (entity_type, e.name)
+        for entity_type in TRANSFER_TYPES
+        for e in getattr(dh, f"list_{entity_type}s")(project_name)
+    ]
+    versions = _phase("collect", _versions, names, workers, stats)
+    entities = [item for group in versions for item in group]
+
+    def _serialise(item: tuple[str, typing.Any]) -> tuple[str, str]:
+        entity_type, entity = item
+        data = entity.to_dict()
+        return _relative_path(entity_type, data), yaml.safe_dump(data, sort_keys=False)
+
+    documents = _phase("serialise", _serialise, entities, workers, stats)
+
+    if dest.name.endswith(ARCHIVE_SUFFIX):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with tarfile.open(dest, "w:gz") as archive:
+
+            def _add(document: tuple[str, str]) -> None:
+                path, text = document
+                data = text.encode()
+                info = tarfile.TarInfo(path)
+                info.size = len(data)
+                info.mtime = int(time.time())
+                archive.addfile(info, io.BytesIO(data))
+
+            # A tar stream is sequential, it is written from a single thread
+            _phase("write", _add, documents, 1, stats)
+    else:
+
+        def _write(document: tuple[str, str]) -> None:
+            path, text = document
+            target = dest / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text)
+
+        _phase("write", _write, documents, workers, stats)
+    return stats
+
+
+def _retarget(data: dict, entity_type: str, project_name: str, new_id: bool) -> dict:
+    """Move an exported entity to another project, optionally with a new id."""
+    metadata = data.setdefault("metadata", {})
+    data["project"] = metadata["project"] = project_name
+    if new_id:
+        data["id"] = uuid.uuid4().hex
+        if "version" in metadata:
+            metadata["version"] = data["id"]
+    data["key"] = (
+        f"store://{project_name}/{entity_type}/{data['kind']}/"
+        f"{data['name']}:{data['id']}"
+    )
+    return data
+
+
+def import_project(
+    src: Path,
+    project_name: str | None = None,
+    workers: int = DEFAULT_WORKERS,
+    new_ids: bool = False,
+) -> dict:
+    """
+    Import an export made by export_project, into project_name if given or
+    into the project recorded in the files otherwise. Return the phase
+    statistics, with the number of entities that failed to be created.
+
+    Entity ids are kept unless new_ids is set, which is needed to copy a
+    project within the same Core.
+    """
+    stats: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        if src.name.endswith(ARCHIVE_SUFFIX):
+            start = time.monotonic()
+            with tarfile.open(src, "r:gz") as archive:
+                archive.extractall(staging, filter="data")
+            logger.info("Extracted %s in %.2fs", src, time.monotonic() - start)
+            root = staging
+        else:
+            root = src
+
+        def _read(path: Path) -> tuple[str, Path]:
+            entity_type = path.parent.name
+            data = yaml.safe_load(path.read_text())
+            if project_name is None and not new_ids:
+                return entity_type, path
+            data = _retarget(
+                data, entity_type, project_name or data["project"], new_ids
+            )
+            staged = staging / "retarget" / path.relative_to(root)
+            staged.parent.mkdir(parents=True, exist_ok=True)
+            staged.write_text(yaml.safe_dump(data, sort_keys=False))
+            return entity_type, staged
+
+        paths = [
+            p for t in TRANSFER_TYPES for p in sorted((root / t).glob("*.yaml"))
+        ]
+        documents = _phase("read", _read, paths, workers, stats)
+
+        errors = []
+
+        def _create(document: tuple[str, Path]) -> None:
+            entity_type, path = document
+            try:
+                getattr(dh, f"import_{entity_type}")(file=str(path))
+            except Exception as e:
+                errors.append((str(path.relative_to(path.parents[1])), repr(e)))
+
+        _phase("create", _create, documents, workers, stats)
+        stats["failed"] = len(errors)
+        for path, error in errors[:10]:
+            logger.error("✗ %s: %s", path, error)
+    return stats
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export and import projects.")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS, help="Thread pool size."
+    )
+    parser.add_argument("--report", type=Path, help="Write the statistics as JSON.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="Export a project.")
+    export.add_argument("source_project")
+    export.add_argument("dest", type=Path, help=f"Directory or *{ARCHIVE_SUFFIX}.")
+
+    imp = commands.add_parser("import", help="Import an export.")
+    imp.add_argument("src", type=Path, help=f"Directory or *{ARCHIVE_SUFFIX}.")
+    imp.add_argument("--project", help="Import into this project instead.")
+    imp.add_argument(
+        "--new-ids",
+        action="store_true",
+        help="Give entities new ids, to copy them within the same Core.",
+    )
+
+    roundtrip = commands.add_parser(
+        "roundtrip", help="Export a project and import it into another one."
+    )
+    roundtrip.add_argument("source_project")
+    roundtrip.add_argument("--project", required=True, help="Target project.")
+    roundtrip.add_argument(
+        "--archive", action="store_true", help="Go through a single archive."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Run the requested transfer and report its throughput."""
+    args = parse_args(argv)
+    if args.command == "export":
+        stats = {"export": export_project(args.source_project, args.dest, args.workers)}
+    elif args.command == "import":
+        if args.project is not None:
+            prepare_project(args.project)
+        stats = {
+            "import": import_project(
+                args.src, args.project, args.workers, args.new_ids
+            )
+        }
+    else:
+        prepare_project(args.project)
+        tmp = Path(tempfile.mkdtemp())
+        dest = tmp / f"{args.source_project}{ARCHIVE_SUFFIX}" if args.archive else tmp
+        try:
+            stats = {
+                "export": export_project(args.source_project, dest, args.workers),
+                "import": import_project(
+                    dest, args.project, args.workers, new_ids=True
+                ),
+            }
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    if args.report is not None:
+        args.report.write_text(json.dumps(stats, indent=2))
+        logger.info("Report written to %s", args.report)
+    if stats.get("import", {}).get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,13 @@ Unit tests for the entity Artifact
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.artifact._base.entity import Artifact
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -48,14 +49,14 @@ class TestArtifactCRUD:
         """Test creation and deletion via different methods."""
 
         # Create and delete artifacts using different approaches
-        for i in ARTIFACT_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             d = dh.new_artifact(self.project.name, **i)
             assert isinstance(d, Artifact)
             assert d.name == i["name"]
             assert d.kind == i["kind"]
             dh.delete_artifact(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_artifacts, entity_id=d.id)
 
             # Test module-level create + delete by name and id
             d = dh.new_artifact(self.project.name, **i)
@@ -65,7 +66,7 @@ class TestArtifactCRUD:
                 entity_id=d.id,
                 cascade=False,
             )
-            time.sleep(2)
+            wait_until_absent(self.project.list_artifacts, entity_id=d.id)
 
             # Test project-level create + delete
             d = self.project.new_artifact(**i)
@@ -73,15 +74,16 @@ class TestArtifactCRUD:
                 d.key,
                 cascade=False,
             )
-            time.sleep(2)
+            wait_until_absent(self.project.list_artifacts, entity_id=d.id)
+
+        map_items(_create_and_delete, ARTIFACT_DICTS)
 
         assert dh.list_artifacts(self.project.name) == []
 
     def test_list(self):
         assert dh.list_artifacts(self.project.name) == []
 
-        for i in ARTIFACT_DICTS:
-            dh.new_artifact(self.project.name, **i)
+        map_items(lambda i: dh.new_artifact(self.project.name, **i), ARTIFACT_DICTS)
 
         # List artifacts
         l_obj = dh.list_artifacts(self.project.name)
@@ -91,13 +93,15 @@ class TestArtifactCRUD:
             assert isinstance(i, Artifact)
 
         # Delete all artifacts - test delete_all_versions
-        for obj in l_obj:
-            dh.delete_artifact(
+        map_items(
+            lambda obj: dh.delete_artifact(
                 obj.key,
                 delete_all_versions=True,
                 cascade=False,
-            )
-            time.sleep(2)
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_artifacts)
 
         assert len(dh.list_artifacts(self.project.name)) == 0
 
@@ -126,7 +130,7 @@ class TestArtifactCRUD:
 
         # Cleanup
         dh.delete_artifact(art.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, entity_id=art.id)
 
     def test_versions(self):
         """Test versioning functionality."""
@@ -167,7 +171,7 @@ class TestArtifactCRUD:
             delete_all_versions=True,
             cascade=False,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, name=name)
         assert len(dh.list_artifacts(self.project.name)) == 0
 
     def test_import_export(self):
@@ -189,7 +193,7 @@ class TestArtifactCRUD:
 
         # Delete original
         dh.delete_artifact(art.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, entity_id=art.id)
         assert len(dh.list_artifacts(self.project.name)) == 0
 
         # Import back
@@ -201,7 +205,7 @@ class TestArtifactCRUD:
 
         # Cleanup
         dh.delete_artifact(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -229,11 +233,11 @@ class TestArtifactCRUD:
 
         # Delete via project
         self.project.delete_artifact(art.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, entity_id=art.id)
         assert len(self.project.list_artifacts()) == 0
 
     def test_get(self):
-        for i in ARTIFACT_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_artifact(self.project.name, **i)
             assert isinstance(o1, Artifact)
 
@@ -247,10 +251,11 @@ class TestArtifactCRUD:
             assert isinstance(o3, Artifact)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, ARTIFACT_DICTS)
+
         # delete listed objects
         l_obj = dh.list_artifacts(self.project.name)
-        for obj in l_obj:
-            dh.delete_artifact(obj.key, cascade=False)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_artifact(obj.key, cascade=False), l_obj)
+        wait_until_absent(self.project.list_artifacts)
 
         assert len(dh.list_artifacts(self.project.name)) == 0
@@ -0,0 +1,99 @@
+"""
+asyncio-based execution for the CRUD tests.
+
+Test classes run concurrently, each in its own worker thread, and the
+independent per-item loops inside test methods (one iteration per fixture
+dict or per listed entity) are fanned out on the event loop through
+asyncio.to_thread. A semaphore caps the number of item calls in flight, so
+the blocking SDK round-trips overlap without flooding the backend.
+
+Item calls run in a copy of the caller's context, so the time they spend
+in waiters is added to the caller's waited_time.
+
+Outside of run_concurrently, map_items degrades to a plain sequential loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from waiter import waited_time
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+_loop: asyncio.AbstractEventLoop | None = None
+_semaphore: asyncio.Semaphore | None = None
+
+
+async def _limited(
+    context: contextvars.Context,
+    fn: Callable[[typing.Any], typing.Any],
+    item: typing.Any,
+):
+    async with _semaphore:
+        return await asyncio.to_thread(context.run, fn, item)
+
+
+def map_items(
+    fn: Callable[[typing.Any], typing.Any],
+    items: Iterable[typing.Any],
+) -> list[typing.Any]:
+    """
+    Apply fn to every item and return the results in order.
+
+    Under the async runner the calls overlap, otherwise they run one after
+    the other. The first exception raised by fn is propagated.
+    """
+    items = list(items)
+    if _loop is None:
+        return [fn(item) for item in items]
+
+    # The wait counter must exist before the copies are taken to be shared
+    waited_time()
+    contexts = [contextvars.copy_context() for _ in items]
+
+    async def _gather() -> list[typing.Any]:
+        return await asyncio.gather(
+            *(_limited(c, fn, item) for c, item in zip(contexts, items))
+        )
+
+    return asyncio.run_coroutine_threadsafe(_gather(), _loop).result()
+
+
+async def _run_all(
+    calls: list[Callable[[], typing.Any]],
+    workers: int,
+    max_in_flight: int,
+) -> list[typing.Any]:
+    global _loop, _semaphore
+    loop = asyncio.get_running_loop()
+    # Item calls use the default executor, sized to the semaphore; top-level
+    # calls get their own threads so they can never starve item calls.
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=max_in_flight))
+    _loop, _semaphore = loop, asyncio.Semaphore(max_in_flight)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, call) for call in calls),
+                return_exceptions=True,
+            )
+    finally:
+        _loop, _semaphore = None, None
+
+
+def run_concurrently(
+    calls: list[Callable[[], typing.Any]],
+    workers: int,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+) -> list[typing.Any]:
+    """
+    Run the calls on at most workers threads under an event loop that
+    serves map_items, and return their results or raised exceptions.
+    """
+    return asyncio.run(_run_all(calls, workers, max_in_flight))
@@ -0,0 +1,175 @@
+"""
+Benchmark of log_croissant on large multi-file croissant datasets.
+
+A synthetic dataset of sample.csv-shaped records split over partitioned
+parquet files and described by a croissant fileSet is generated (or an
+existing metadata.json is used), then the benchmark times each phase and
+samples its peak RSS:
+
+- validate: footer-only check of the files against the record sets;
+- scan: reading every record set row group by row group, memory-mapped
+  and projected on the referenced columns;
+- log_croissant: logging the dataset as a dataitem, which uploads the
+  metadata and every FileObject distribution.
+
+Generated datasets list each parquet part as a FileObject, with the
+checksum computed during generation, so the log_croissant phase moves
+all of the data. log_croissant does not upload fileSets: with a --source
+that only has fileSet distributions, the phase measures the metadata.
+
+RSS includes the file-backed pages of memory-mapped files, which the
+kernel can drop at any time; the increase over the baseline stays bounded
+by the batch size otherwise.
+
+    python bench_croissant.py --rows 200000000 --files 64
+    python bench_croissant.py --source /data/croissant/metadata.json --no-log
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+import digitalhub as dh
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from bench_utils import RssSampler
+from croissant_files import DEFAULT_BATCH_ROWS, iter_batches, validate
+from logging_utils import configure_logging
+from project_pool import prepare_project
+from synthetic_data import write_croissant
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+logger = configure_logging(__name__)
+
+
+def timed(phase: str, fn: Callable[[], typing.Any], records: list[dict]):
+    """Run fn, record its elapsed time and RSS under phase, return its result."""
+    with RssSampler() as rss:
+        start = time.monotonic()
+        result = fn()
+        elapsed = time.monotonic() - start
+    records.append(
+        {
+            "phase": phase,
+            "elapsed_s": round(elapsed, 4),
+            "peak_rss_bytes": rss.peak,
+            "rss_increase_bytes": rss.peak - rss.baseline,
+        }
+    )
+    logger.info(
+        "%-13s %8.2fs, peak RSS %.0f MiB (+%.0f MiB)",
+        phase,
+        elapsed,
+        rss.peak / 2**20,
+        (rss.peak - rss.baseline) / 2**20,
+    )
+    return result
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark log_croissant.")
+    parser.add_argument("--source", type=Path, help="Existing croissant metadata.")
+    parser.add_argument(
+        "--rows", type=int, default=100_000_000, help="Synthetic dataset size."
+    )
+    parser.add_argument(
+        "--files", type=int, default=32, help="Parquet files of the dataset."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed.")
+    parser.add_argument(
+        "--workdir", type=Path, help="Generate the dataset here and keep it."
+    )
+    parser.add_argument(
+        "--batch-rows", type=int, default=DEFAULT_BATCH_ROWS, help="Scan batch size."
+    )
+    parser.add_argument(
+        "--no-log", action="store_true", help="Only validate and scan locally."
+    )
+    parser.add_argument(
+        "--project",
+        default=f"{PROJECT_NAME}-bench",
+        help="Project the dataset is logged in.",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    if args.source is not None and args.workdir is not None:
+        parser.error("--workdir only applies to generated datasets")
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the log_croissant benchmark."""
+    args = parse_args(argv)
+    records: list[dict] = []
+    workdir = None
+    if args.source is None:
+        workdir = args.workdir or Path(tempfile.mkdtemp(prefix="bench-croissant-"))
+    try:
+        if workdir is not None:
+            metadata = timed(
+                "generate",
+                lambda: write_croissant(workdir, args.rows, args.files, args.seed),
+                records,
+            )
+        else:
+            metadata = args.source
+        stats = timed("validate", lambda: validate(metadata), records)
+        for name, totals in stats.items():
+            logger.info(
+                "%s: %s rows, %s row groups, %s files, %.1f MB",
+                name,
+                totals["rows"],
+                totals["row_groups"],
+                totals["files"],
+                totals["bytes"] / 1e6,
+            )
+
+        def _scan() -> int:
+            return sum(
+                len(batch)
+                for name in stats
+                for batch in iter_batches(metadata, name, args.batch_rows)
+            )
+
+        rows = timed("scan", _scan, records)
+        records[-1]["rows_per_s"] = round(rows / max(records[-1]["elapsed_s"], 1e-9))
+
+        if not args.no_log:
+            project = prepare_project(args.project)
+            name = "bench-croissant"
+            di = timed(
+                "log_croissant",
+                lambda: dh.log_croissant(project.name, name, source=str(metadata)),
+                records,
+            )
+            dh.delete_dataitem(di.key, delete_all_versions=True)
+    finally:
+        if workdir is not None and args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.report is not None:
+        report = {
+            "source": str(args.source) if args.source else None,
+            "rows": args.rows if args.source is None else None,
+            "files": args.files if args.source is None else None,
+            "datasets": stats,
+            "phases": records,
+        }
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
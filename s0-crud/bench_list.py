@@ -0,0 +1,275 @@
+"""
+Pagination benchmark for dh.list_* on projects with many entities.
+
+The project is bulk-populated with increasing numbers of entities of each
+type (1k, 10k, 100k by default) and at each step the benchmark measures:
+
+- full dh.list_* latency;
+- memory retained by the returned list and peak memory while listing;
+- time-to-first-entity, which for dh.list_* is the full latency since
+  every page is fetched before returning, compared with a streaming
+  iterator that yields the raw entities of each Core page as it arrives.
+
+    python bench_list.py --counts 1000,10000 --types artifact,dataitem
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import digitalhub as dh
+import requests
+from digitalhub.stores.client import get_client
+from digitalhub.stores.client.http.request import BackendReq
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from artifact import ARTIFACT_DICTS
+from dataitem import DATAITEM_DICTS
+from fake_core import FakeCore
+from fault_profiles import load_profile
+from function import FUNCTION_DICTS
+from logging_utils import configure_logging
+from model import MODEL_DICTS
+from project_pool import prepare_project, wipe_project
+from report import summarize
+from workflow import WORKFLOW_DICTS
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+FIXTURES = {
+    "artifact": ARTIFACT_DICTS[0],
+    "dataitem": DATAITEM_DICTS[0],
+    "model": MODEL_DICTS[0],
+    "function": FUNCTION_DICTS[0],
+    "workflow": WORKFLOW_DICTS[0],
+}
+# Runs are executed by Core once created, so they are only benchmarked on demand
+ENTITY_TYPES = (*FIXTURES, "run")
+DEFAULT_COUNTS = "1000,10000,100000"
+DEFAULT_TYPES = "artifact,dataitem,model,function"
+DEFAULT_PAGE_SIZE = 100
+logger = configure_logging(__name__)
+
+
+def make_creator(project, entity_type: str) -> typing.Callable[[int], None]:
+    """Return a function creating the i-th benchmark entity of a type."""
+    if entity_type == "run":
+        function = dh.new_function(
+            project=project.name,
+            name="bench-list-run-function",
+            kind="python",
+            code="def handler(): pass",
+            handler="handler",
+            python_version="PYTHON3_10",
+        )
+        task = function.new_task(action="job")
+        return lambda i: task.run(run_kind="python+job:run")
+
+    payload = {k: v for k, v in FIXTURES[entity_type].items() if k != "uuid"}
+    create = getattr(dh, f"new_{entity_type}")
+    return lambda i: create(project.name, **{**payload, "name": f"bench-list-{i}"})
+
+
+def populate(creator, start: int, stop: int, workers: int) -> float:
+    """Create entities start..stop-1 concurrently and return the elapsed time."""
+    begin = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(creator, range(start, stop)):
+            pass
+    return time.monotonic() - begin
+
+
+def iter_entities(
+    project_name: str, entity_type: str, page_size: int = DEFAULT_PAGE_SIZE
+) -> Iterator[dict]:
+    """
+    Yield the raw entities of a project page by page, as a streaming
+    alternative to dh.list_*, which materialises all of them first.
+
+    The endpoint and credentials are those of the SDK client, whatever
+    their source (environment, configuration file or profile).
+    """
+    configurator = get_client()._configurator
+    endpoint = configurator.get_endpoint().rstrip("/")
+    url = f"{endpoint}/api/v1/-/{project_name}/{entity_type}s"
+    with requests.Session() as session:
+        page = 0
+        while True:
+            # Authenticated per page, so a token refreshed meanwhile is used
+            request = configurator.authenticate(
+                BackendReq.get(
+                    url, params={"page": page, "size": page_size}, timeout=60
+                )
+            )
+            response = session.get(url, **request.to_transport_kwargs())
+            response.raise_for_status()
+            body = response.json()
+            yield from body["content"]
+            page += 1
+            if page >= body["totalPages"]:
+                return
+
+
+def measure_list(project_name: str, entity_type: str, samples: int) -> dict:
+    """Measure latency and memory of dh.list_* for one entity type."""
+    list_fn = getattr(dh, f"list_{entity_type}s")
+    latencies = []
+    for _ in range(samples):
+        start = time.monotonic()
+        entities = list_fn(project_name)
+        latencies.append(time.monotonic() - start)
+    count = len(entities)
+    del entities
+
+    # Traced separately, tracemalloc slows allocations down
+    tracemalloc.start()
+    entities = list_fn(project_name)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return {
+        "listed": count,
+        "list_s": summarize(latencies),
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "bytes_per_entity": round(retained / count, 1) if count else 0.0,
+    }
+
+
+def measure_stream(
+    project_name: str, entity_type: str, samples: int, page_size: int
+) -> dict:
+    """Measure time-to-first-entity, total time and peak memory of streaming."""
+    first, total = [], []
+    for _ in range(samples):
+        start = time.monotonic()
+        stream = iter_entities(project_name, entity_type, page_size)
+        if next(stream, None) is not None:
+            first.append(time.monotonic() - start)
+        for _ in stream:
+            pass
+        total.append(time.monotonic() - start)
+
+    tracemalloc.start()
+    for _ in iter_entities(project_name, entity_type, page_size):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "first_entity_s": summarize(first),
+        "total_s": summarize(total),
+        "peak_bytes": peak,
+    }
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark dh.list_* pagination.")
+    parser.add_argument(
+        "--counts",
+        default=DEFAULT_COUNTS,
+        help=f"Increasing entity counts per type (default: {DEFAULT_COUNTS}).",
+    )
+    parser.add_argument(
+        "--types",
+        default=DEFAULT_TYPES,
+        help=(
+            f"Comma-separated entity types among {', '.join(ENTITY_TYPES)} "
+            f"(default: {DEFAULT_TYPES}). Runs are executed by Core."
+        ),
+    )
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent creations.")
+    parser.add_argument("--samples", type=int, default=3, help="Listings per step.")
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="Page size of the streaming iterator.",
+    )
+    parser.add_argument(
+        "--project",
+        default=f"{PROJECT_NAME}-bench-list",
+        help="Project the benchmark populates; it is wiped at the end.",
+    )
+    parser.add_argument(
+        "--fake-core-profile",
+        metavar="PROFILE",
+        help="Run against an in-process fake Core with this profile.",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    try:
+        args.counts = [int(c) for c in args.counts.split(",")]
+        if args.fake_core_profile is not None:
+            args.fake_core_profile = load_profile(args.fake_core_profile)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.counts != sorted(set(args.counts)) or args.counts[0] < 1:
+        parser.error("--counts must be strictly increasing positive integers")
+    args.types = [t.strip() for t in args.types.split(",") if t.strip()]
+    if set(args.types) - set(ENTITY_TYPES):
+        parser.error(f"--types must be among {', '.join(ENTITY_TYPES)}")
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the pagination benchmark."""
+    args = parse_args(argv)
+    if args.fake_core_profile is not None:
+        core = FakeCore(profile=args.fake_core_profile).start()
+        os.environ["DHCORE_ENDPOINT"] = core.endpoint
+
+    project = prepare_project(args.project)
+    wipe_project(project)
+    records = []
+    try:
+        for entity_type in args.types:
+            creator = make_creator(project, entity_type)
+            current = 0
+            for count in args.counts:
+                elapsed = populate(creator, current, count, args.workers)
+                logger.info(
+                    "Created %s %ss in %.1fs", count - current, entity_type, elapsed
+                )
+                current = count
+                record = {
+                    "entity_type": entity_type,
+                    "count": count,
+                    "sdk": measure_list(project.name, entity_type, args.samples),
+                    "stream": measure_stream(
+                        project.name, entity_type, args.samples, args.page_size
+                    ),
+                }
+                records.append(record)
+                sdk, stream = record["sdk"], record["stream"]
+                logger.info(
+                    "%-9s %7s: list p50 %.3fs, %.1f MiB retained | "
+                    "stream first entity p50 %.3fs, peak %.1f MiB",
+                    entity_type,
+                    count,
+                    sdk["list_s"]["p50"],
+                    sdk["retained_bytes"] / 2**20,
+                    stream["first_entity_s"]["p50"],
+                    stream["peak_bytes"] / 2**20,
+                )
+    finally:
+        wipe_project(project)
+
+    if args.report is not None:
+        report = {"counts": args.counts, "records": records}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Throughput benchmark for log_table across table sizes and data engines.
+
+For every size (10k to 50M rows by default) a synthetic sample.csv-shaped
+table is built and logged with log_table from a pandas dataframe, a polars
+dataframe, a CSV file and a parquet file. For each case the benchmark
+records:
+
+- serialisation time: writing the dataframe to in-memory parquet, which
+  log_table does before uploading, or writing the source file;
+- upload throughput in MB/s of the serialised payload, from the log_table
+  time minus the serialisation time for dataframes;
+- peak RSS during log_table, sampled from /proc, and its increase over
+  the RSS before the call.
+
+Each case runs in a fresh process so RSS peaks do not leak between cases.
+
+    python bench_log_table.py --rows 10000,1000000 --engines polars,parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import digitalhub as dh
+import pandas as pd
+import polars as pl
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from bench_utils import RssSampler
+from logging_utils import configure_logging
+from project_pool import prepare_project
+from synthetic_data import sample_columns
+
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+ENGINES = ("pandas", "polars", "csv", "parquet")
+DEFAULT_ROWS = "10000,100000,1000000,10000000,50000000"
+logger = configure_logging(__name__)
+
+
+def prepare(engine: str, rows: int, seed: int, workdir: Path) -> dict:
+    """
+    Build the log_table input for an engine and time its serialisation.
+    Return the log_table keyword arguments, the serialisation time and the
+    payload size in bytes.
+    """
+    columns = sample_columns(rows, seed)
+    if engine in ("csv", "parquet"):
+        path = workdir / f"table-{rows}.{engine}"
+        frame = pl.DataFrame(columns)
+        del columns
+        start = time.monotonic()
+        if engine == "csv":
+            frame.write_csv(path)
+        else:
+            frame.write_parquet(path)
+        serialise_s = time.monotonic() - start
+        return {
+            "kwargs": {"source": str(path)},
+            "serialise_s": serialise_s,
+            "payload_bytes": path.stat().st_size,
+        }
+
+    frame = pd.DataFrame(columns) if engine == "pandas" else pl.DataFrame(columns)
+    del columns
+    buffer = io.BytesIO()
+    start = time.monotonic()
+    if engine == "pandas":
+        frame.to_parquet(buffer, index=False)
+    else:
+        frame.write_parquet(buffer)
+    serialise_s = time.monotonic() - start
+    return {
+        "kwargs": {"data": frame},
+        "serialise_s": serialise_s,
+        "payload_bytes": buffer.getbuffer().nbytes,
+    }
+
+
+def run_case(project_name: str, engine: str, rows: int, seed: int) -> dict:
+    """Log one table and return its measurements. Runs in a worker process."""
+    with tempfile.TemporaryDirectory() as tmp:
+        case = prepare(engine, rows, seed, Path(tmp))
+        name = f"bench-log-table-{engine}-{rows}"
+        with RssSampler() as rss:
+            start = time.monotonic()
+            di = dh.log_table(project_name, name, **case["kwargs"])
+            log_s = time.monotonic() - start
+    dh.delete_dataitem(di.key, delete_all_versions=True)
+
+    # Dataframes are serialised again inside log_table, files are uploaded as is
+    upload_s = log_s if engine in ("csv", "parquet") else log_s - case["serialise_s"]
+    upload_s = max(upload_s, 1e-9)
+    return {
+        "engine": engine,
+        "rows": rows,
+        "payload_bytes": case["payload_bytes"],
+        "serialise_s": round(case["serialise_s"], 4),
+        "log_table_s": round(log_s, 4),
+        "upload_mb_s": round(case["payload_bytes"] / 1e6 / upload_s, 2),
+        "peak_rss_bytes": rss.peak,
+        "rss_increase_bytes": rss.peak - rss.baseline,
+    }
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark log_table throughput.")
+    parser.add_argument(
+        "--rows",
+        default=DEFAULT_ROWS,
+        help=f"Comma-separated table sizes (default: {DEFAULT_ROWS}).",
+    )
+    parser.add_argument(
+        "--engines",
+        default=",".join(ENGINES),
+        help=f"Comma-separated sources among {', '.join(ENGINES)}.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed.")
+    parser.add_argument(
+        "--project",
+        default=f"{PROJECT_NAME}-bench",
+        help="Project the tables are logged in.",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    try:
+        args.rows = [int(r) for r in args.rows.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+    args.engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    if set(args.engines) - set(ENGINES):
+        parser.error(f"--engines must be among {', '.join(ENGINES)}")
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the log_table benchmark."""
+    args = parse_args(argv)
+    project = prepare_project(args.project)
+    context = multiprocessing.get_context("spawn")
+    records = []
+    for rows in args.rows:
+        for engine in args.engines:
+            try:
+                with ProcessPoolExecutor(1, mp_context=context) as executor:
+                    record = executor.submit(
+                        run_case, project.name, engine, rows, args.seed
+                    ).result()
+            except Exception as e:
+                logger.exception("✗ %s with %s rows failed", engine, rows)
+                records.append({"engine": engine, "rows": rows, "error": repr(e)})
+                continue
+            records.append(record)
+            logger.info(
+                "%-7s %9s rows: serialise %.2fs, log_table %.2fs, %.1f MB/s, "
+                "peak RSS %.0f MiB (+%.0f MiB)",
+                engine,
+                rows,
+                record["serialise_s"],
+                record["log_table_s"],
+                record["upload_mb_s"],
+                record["peak_rss_bytes"] / 2**20,
+                record["rss_increase_bytes"] / 2**20,
+            )
+
+    if args.report is not None:
+        report = {"seed": args.seed, "records": records}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Version-growth benchmark for artifacts, dataitems and models.
+
+A single entity name is grown to increasing numbers of versions (10, 100,
+1k, 10k by default). At each step the benchmark records the latency of the
+calls that added the versions (log_* or new_*), the latency of
+get_*_versions and the size of the returned versions, then plots how they
+scale with the number of versions.
+
+    python bench_versions.py --steps 10,100,1000 --plot versions.png
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import digitalhub as dh
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from artifact import ARTIFACT_DICTS
+from bench_utils import plot_scaling
+from dataitem import DATAITEM_DICTS
+from fake_core import FakeCore
+from fault_profiles import load_profile
+from logging_utils import configure_logging
+from model import MODEL_DICTS
+from project_pool import prepare_project
+from report import summarize
+from waiter import wait_until_absent
+
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+ENTITY_TYPES = ("artifact", "dataitem", "model")
+FIXTURES = {
+    "artifact": ARTIFACT_DICTS[0],
+    "dataitem": DATAITEM_DICTS[0],
+    "model": MODEL_DICTS[0],
+}
+DEFAULT_STEPS = "10,100,1000,10000"
+SOURCE = str(Path(__file__).parent / "data" / "sample.csv")
+logger = configure_logging(__name__)
+
+
+def add_version(project_name: str, entity_type: str, name: str, method: str):
+    """Add one version of name, uploading sample.csv with log_*."""
+    if method == "log":
+        log = getattr(dh, f"log_{entity_type}")
+        return log(project_name, name, source=SOURCE, description="benchmark")
+    fixture = FIXTURES[entity_type]
+    new = getattr(dh, f"new_{entity_type}")
+    return new(project_name, name, kind=fixture["kind"], path=fixture["path"])
+
+
+def grow(
+    project_name: str,
+    entity_type: str,
+    name: str,
+    method: str,
+    count: int,
+    workers: int,
+) -> list[float]:
+    """Add count versions concurrently and return the latency of each call."""
+
+    def _timed(_):
+        start = time.monotonic()
+        add_version(project_name, entity_type, name, method)
+        return time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_timed, range(count)))
+
+
+def measure_versions(
+    project_name: str, entity_type: str, name: str, samples: int
+) -> tuple[list[float], int, int]:
+    """
+    Fetch all versions samples times. Return the latencies, the number of
+    versions and the size in bytes of their serialised form.
+    """
+    get_versions = getattr(dh, f"get_{entity_type}_versions")
+    latencies = []
+    for _ in range(samples):
+        start = time.monotonic()
+        versions = get_versions(name, project=project_name)
+        latencies.append(time.monotonic() - start)
+    payload = json.dumps([v.to_dict() for v in versions], default=str)
+    return latencies, len(versions), len(payload.encode())
+
+
+def bench_entity(
+    project,
+    entity_type: str,
+    steps: list[int],
+    method: str,
+    workers: int,
+    samples: int,
+) -> list[dict]:
+    """Grow one entity through the steps and return a record per step."""
+    name = f"bench-versions-{entity_type}"
+    list_fn = getattr(project, f"list_{entity_type}s")
+    delete_fn = getattr(project, f"delete_{entity_type}")
+    if any(e.name == name for e in list_fn()):
+        delete_fn(name, delete_all_versions=True, cascade=False)
+        wait_until_absent(list_fn, name=name)
+
+    records = []
+    current = 0
+    for step in steps:
+        add = grow(project.name, entity_type, name, method, step - current, workers)
+        current = step
+        latencies, count, size = measure_versions(
+            project.name, entity_type, name, samples
+        )
+        record = {
+            "entity_type": entity_type,
+            "versions": step,
+            "listed_versions": count,
+            "add_s": summarize(add),
+            "get_versions_s": summarize(latencies),
+            "payload_bytes": size,
+            "bytes_per_version": round(size / count, 1) if count else 0.0,
+        }
+        records.append(record)
+        logger.info(
+            "%-9s %6s versions: %s p50 %.4fs, get_versions p50 %.4fs, %.1f KiB",
+            entity_type,
+            step,
+            method,
+            record["add_s"]["p50"],
+            record["get_versions_s"]["p50"],
+            size / 1024,
+        )
+        if count != step:
+            logger.warning("Expected %s versions, %s listed", step, count)
+
+    delete_fn(name, delete_all_versions=True, cascade=False)
+    return records
+
+
+def plot(records: list[dict], method: str, path: Path) -> bool:
+    """Plot add latency, get_versions latency and payload size per step."""
+    metrics = {
+        f"{method}_* p50 latency (s)": lambda r: r["add_s"]["p50"],
+        "get_*_versions p50 latency (s)": lambda r: r["get_versions_s"]["p50"],
+        "versions payload (bytes)": lambda r: r["payload_bytes"],
+    }
+    panels = {}
+    for title, value in metrics.items():
+        panels[title] = {
+            t: (
+                [r["versions"] for r in records if r["entity_type"] == t],
+                [value(r) for r in records if r["entity_type"] == t],
+            )
+            for t in {r["entity_type"] for r in records}
+        }
+    return plot_scaling(panels, "versions", path)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark version growth.")
+    parser.add_argument(
+        "--steps",
+        default=DEFAULT_STEPS,
+        help=f"Increasing version counts to measure (default: {DEFAULT_STEPS}).",
+    )
+    parser.add_argument(
+        "--types",
+        default=",".join(ENTITY_TYPES),
+        help="Comma-separated entity types to benchmark.",
+    )
+    parser.add_argument(
+        "--method",
+        choices=("log", "new"),
+        default="log",
+        help="Add versions with log_* (uploads a file) or new_* (metadata only).",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Concurrent calls while growing."
+    )
+    parser.add_argument(
+        "--samples", type=int, default=3, help="get_*_versions calls per step."
+    )
+    parser.add_argument(
+        "--project",
+        default=f"{PROJECT_NAME}-bench",
+        help="Project the benchmark runs in.",
+    )
+    parser.add_argument(
+        "--fake-core-profile",
+        metavar="PROFILE",
+        help="Run against an in-process fake Core with this profile (--method new).",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    parser.add_argument("--plot", type=Path, help="Write a PNG plot here.")
+    args = parser.parse_args(argv)
+    try:
+        args.steps = [int(s) for s in args.steps.split(",")]
+        if args.fake_core_profile is not None:
+            args.fake_core_profile = load_profile(args.fake_core_profile)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.steps != sorted(set(args.steps)) or args.steps[0] < 1:
+        parser.error("--steps must be strictly increasing positive integers")
+    if args.samples < 1 or args.workers < 1:
+        parser.error("--samples and --workers must be >= 1")
+    args.types = [t.strip() for t in args.types.split(",") if t.strip()]
+    if set(args.types) - set(ENTITY_TYPES):
+        parser.error(f"--types must be among {', '.join(ENTITY_TYPES)}")
+    if args.fake_core_profile is not None and args.method == "log":
+        parser.error("the fake Core stores no files, use --method new")
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the version-growth benchmark."""
+    args = parse_args(argv)
+    if args.fake_core_profile is not None:
+        core = FakeCore(profile=args.fake_core_profile).start()
+        os.environ["DHCORE_ENDPOINT"] = core.endpoint
+
+    project = prepare_project(args.project)
+    records = []
+    for entity_type in args.types:
+        records.extend(
+            bench_entity(
+                project,
+                entity_type,
+                args.steps,
+                args.method,
+                args.workers,
+                args.samples,
+            )
+        )
+
+    if args.report is not None:
+        report = {"method": args.method, "steps": args.steps, "records": records}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+    if args.plot is not None:
+        if plot(records, args.method, args.plot):
+            logger.info("Plot written to %s", args.plot)
+        else:
+            logger.warning("matplotlib is not installed, no plot written")
+
+
+if __name__ == "__main__":
+    main()
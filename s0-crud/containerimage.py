@@ -7,12 +7,14 @@ Unit tests for the entity Containerimage
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from cleanup import bulk_delete
+from async_runner import map_items
 from digitalhub.entities.containerimage._base.entity import Containerimage
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -37,22 +39,26 @@ class TestContainerimageCRUD:
         self.project = project
 
     def _cleanup_containerimages(self) -> None:
-        for obj in self.project.list_containerimages():
-            self.project.delete_containerimage(obj.key, cascade=False)
-            time.sleep(1)
+        keys = [obj.key for obj in self.project.list_containerimages()]
+        bulk_delete(
+            self.project.delete_containerimage,
+            keys,
+            self.project.list_containerimages,
+            cascade=False,
+        )
 
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
         self._cleanup_containerimages()
 
-        for i in CONTAINERIMAGE_DICTS:
+        def _create_and_delete(i):
             d = dh.new_containerimage(self.project.name, **i)
             assert isinstance(d, Containerimage)
             assert d.name == i["name"]
             assert d.kind == i["kind"]
             dh.delete_containerimage(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_containerimages, entity_id=d.id)
 
             d = dh.new_containerimage(self.project.name, **i)
             dh.delete_containerimage(
@@ -61,7 +67,7 @@ class TestContainerimageCRUD:
                 entity_id=d.id,
                 cascade=False,
             )
-            time.sleep(2)
+            wait_until_absent(self.project.list_containerimages, entity_id=d.id)
 
             d = self.project.new_containerimage(
                 name=i["name"],
@@ -69,7 +75,9 @@ class TestContainerimageCRUD:
                 image=i["image"],
             )
             self.project.delete_containerimage(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_containerimages, entity_id=d.id)
+
+        map_items(_create_and_delete, CONTAINERIMAGE_DICTS)
 
         self._cleanup_containerimages()
         assert dh.list_containerimages(self.project.name) == []
@@ -80,8 +88,10 @@ class TestContainerimageCRUD:
         self._cleanup_containerimages()
         assert dh.list_containerimages(self.project.name) == []
 
-        for i in CONTAINERIMAGE_DICTS:
-            dh.new_containerimage(self.project.name, **i)
+        map_items(
+            lambda i: dh.new_containerimage(self.project.name, **i),
+            CONTAINERIMAGE_DICTS,
+        )
 
         l_obj = dh.list_containerimages(self.project.name)
         assert isinstance(l_obj, list)
@@ -89,14 +99,16 @@ class TestContainerimageCRUD:
         for i in l_obj:
             assert isinstance(i, Containerimage)
 
-        for obj in l_obj:
-            dh.delete_containerimage(
+        map_items(
+            lambda obj: dh.delete_containerimage(
                 obj.name,
                 project=self.project.name,
                 delete_all_versions=True,
                 cascade=False,
-            )
-            time.sleep(2)
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_containerimages)
 
         self._cleanup_containerimages()
         assert len(dh.list_containerimages(self.project.name)) == 0
@@ -106,7 +118,7 @@ class TestContainerimageCRUD:
 
         self._cleanup_containerimages()
 
-        for i in CONTAINERIMAGE_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_containerimage(self.project.name, **i)
             assert isinstance(o1, Containerimage)
 
@@ -120,10 +132,11 @@ class TestContainerimageCRUD:
             assert isinstance(o3, Containerimage)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, CONTAINERIMAGE_DICTS)
+
         l_obj = dh.list_containerimages(self.project.name)
-        for obj in l_obj:
-            dh.delete_containerimage(obj.key, cascade=False)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_containerimage(obj.key, cascade=False), l_obj)
+        wait_until_absent(self.project.list_containerimages)
 
         self._cleanup_containerimages()
         assert len(dh.list_containerimages(self.project.name)) == 0
@@ -153,7 +166,7 @@ class TestContainerimageCRUD:
         assert ci.metadata.description == description
 
         dh.delete_containerimage(ci.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_containerimages, entity_id=ci.id)
         self._cleanup_containerimages()
 
     def test_versions(self):
@@ -191,7 +204,7 @@ class TestContainerimageCRUD:
             delete_all_versions=True,
             cascade=False,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_containerimages, name=name)
         self._cleanup_containerimages()
         assert len(dh.list_containerimages(self.project.name)) == 0
 
@@ -213,7 +226,7 @@ class TestContainerimageCRUD:
         assert Path(export_path).exists()
 
         dh.delete_containerimage(ci.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_containerimages, entity_id=ci.id)
         assert len(dh.list_containerimages(self.project.name)) == 0
 
         imported = dh.import_containerimage(file=export_path)
@@ -234,6 +247,6 @@ class TestContainerimageCRUD:
             delete_all_versions=True,
             cascade=False,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_containerimages, name=loaded.name)
         Path(export_path).unlink()
         self._cleanup_containerimages()
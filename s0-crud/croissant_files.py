@@ -0,0 +1,274 @@
+"""
+Lazy access to the parquet files described by croissant metadata.
+
+Distributions are resolved locally: a FileObject to its contentUrl and a
+FileSet to every file matched by its includes globs, minus its excludes,
+relative to the metadata file or to the local directory it is contained
+in. Parquet files are opened memory-mapped, so validation only reads
+their footers: the columns a record set extracts must exist in every file
+of its distribution with a type matching the field dataType. Records are
+read row group by row group, projected on the referenced columns, so the
+rest of the data is never touched.
+
+    python croissant_files.py data/croissant/metadata.json --scan
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import typing
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from logging_utils import configure_logging
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+PARQUET_FORMATS = {"application/x-parquet", "application/vnd.apache.parquet"}
+DEFAULT_BATCH_ROWS = 65_536
+logger = configure_logging(__name__)
+
+
+class CroissantError(ValueError):
+    """Raised when croissant metadata does not match the files it describes."""
+
+
+def _as_list(value: typing.Any) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _ref(value: typing.Any) -> str:
+    return value["@id"] if isinstance(value, dict) else value
+
+
+def _node_id(node: dict) -> str:
+    return node.get("@id", node.get("name"))
+
+
+def _type_check(data_type: str) -> typing.Callable[[pa.DataType], bool] | None:
+    """Return a predicate on Arrow types for a croissant dataType, if known."""
+    import pyarrow as pa
+
+    def _text(t: pa.DataType) -> bool:
+        if pa.types.is_dictionary(t):
+            t = t.value_type
+        return pa.types.is_string(t) or pa.types.is_large_string(t)
+
+    checks = {
+        "Integer": pa.types.is_integer,
+        "Float": lambda t: pa.types.is_floating(t) or pa.types.is_decimal(t),
+        "Text": _text,
+        "Boolean": pa.types.is_boolean,
+        "Date": lambda t: pa.types.is_date(t) or pa.types.is_timestamp(t),
+    }
+    name = data_type.rsplit("/", 1)[-1].rsplit(":", 1)[-1]
+    return checks.get(name)
+
+
+def load_metadata(path: str | Path) -> dict:
+    """Read croissant metadata from a JSON file."""
+    return json.loads(Path(path).read_text())
+
+
+def resolve_distribution(metadata: dict, base: Path) -> dict[str, list[Path]]:
+    """Return the local files of every distribution, keyed by its id."""
+    nodes = {_node_id(n): n for n in _as_list(metadata.get("distribution"))}
+    files = {}
+    for node_id, node in nodes.items():
+        root = base
+        for container in _as_list(node.get("containedIn")):
+            parent = nodes.get(_ref(container), {})
+            if parent.get("encodingFormat") == "local_directory":
+                root = base / parent["contentUrl"]
+        if node.get("@type") == "cr:FileSet":
+            excluded = {p for g in _as_list(node.get("excludes")) for p in root.glob(g)}
+            matched = {p for g in _as_list(node.get("includes")) for p in root.glob(g)}
+            files[node_id] = sorted(p for p in matched - excluded if p.is_file())
+        elif "contentUrl" in node and "://" not in node["contentUrl"]:
+            files[node_id] = [root / node["contentUrl"]]
+    return files
+
+
+def _fields(fields: list) -> Iterator[dict]:
+    for field in fields:
+        yield field
+        yield from _fields(_as_list(field.get("subField")))
+
+
+def referenced_columns(
+    metadata: dict, record_set: str | None = None
+) -> dict[str, dict[str, dict[str, str]]]:
+    """
+    Return, for every record set (or only record_set), the columns it
+    extracts from each distribution, keyed by distribution id and column
+    name, with the field name and dataType.
+    """
+    references = {}
+    for node in _as_list(metadata.get("recordSet")):
+        if record_set is not None and record_set not in (node.get("@id"), node["name"]):
+            continue
+        columns: dict[str, dict[str, dict[str, str]]] = {}
+        for field in _fields(_as_list(node.get("field"))):
+            source = field.get("source", {})
+            distribution = source.get("fileObject") or source.get("fileSet")
+            column = source.get("extract", {}).get("column")
+            if distribution is None or column is None:
+                continue
+            columns.setdefault(_ref(distribution), {})[column] = {
+                "field": field["name"],
+                "dataType": _ref(_as_list(field.get("dataType"))[0])
+                if field.get("dataType")
+                else "",
+            }
+        references[node["name"]] = columns
+    if record_set is not None and not references:
+        raise CroissantError(f"Record set {record_set} not found")
+    return references
+
+
+def open_parquet(path: Path) -> pq.ParquetFile:
+    """Open a parquet file memory-mapped; only its footer is read."""
+    import pyarrow.parquet as pq
+
+    return pq.ParquetFile(path, memory_map=True)
+
+
+def validate(path: str | Path, record_set: str | None = None) -> dict:
+    """
+    Check that the parquet files of the metadata at path provide every
+    column its record sets extract, with matching types. Only the file
+    footers are read. Return per record set statistics, raise
+    CroissantError listing every problem found.
+    """
+    path = Path(path)
+    metadata = load_metadata(path)
+    files = resolve_distribution(metadata, path.parent)
+    formats = {
+        _node_id(n): n.get("encodingFormat")
+        for n in _as_list(metadata.get("distribution"))
+    }
+    problems = []
+    stats = {}
+    for name, columns in referenced_columns(metadata, record_set).items():
+        totals = {"files": 0, "rows": 0, "row_groups": 0, "bytes": 0}
+        for distribution, fields in columns.items():
+            if distribution not in files:
+                problems.append(f"{name}: unknown distribution {distribution}")
+                continue
+            if not files[distribution]:
+                problems.append(f"{name}: {distribution} matches no file")
+                continue
+            if formats.get(distribution) not in PARQUET_FORMATS:
+                continue
+            for file in files[distribution]:
+                if not file.is_file():
+                    problems.append(f"{name}: {file} does not exist")
+                    continue
+                parquet = open_parquet(file)
+                schema = parquet.schema_arrow
+                for column, field in fields.items():
+                    if column not in schema.names:
+                        problems.append(f"{field['field']}: {column} missing in {file}")
+                        continue
+                    check = _type_check(field["dataType"])
+                    arrow_type = schema.field(column).type
+                    if check is not None and not check(arrow_type):
+                        problems.append(
+                            f"{field['field']}: {column} is {arrow_type} in {file}, "
+                            f"expected {field['dataType']}"
+                        )
+                totals["files"] += 1
+                totals["rows"] += parquet.metadata.num_rows
+                totals["row_groups"] += parquet.metadata.num_row_groups
+                totals["bytes"] += file.stat().st_size
+        stats[name] = totals
+    if problems:
+        raise CroissantError("\n".join(problems))
+    return stats
+
+
+def iter_batches(
+    path: str | Path,
+    record_set: str,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    limit: int | None = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the records of record_set as Arrow batches with one column per
+    field. Files are read row group by row group, projected on the fields'
+    columns, and reading stops once limit rows have been yielded.
+    """
+    path = Path(path)
+    metadata = load_metadata(path)
+    columns = referenced_columns(metadata, record_set)
+    ((name, sources),) = columns.items()
+    if len(sources) != 1:
+        raise CroissantError(f"{name} joins {len(sources)} distributions")
+    ((distribution, fields),) = sources.items()
+    files = resolve_distribution(metadata, path.parent).get(distribution, [])
+    names = [f["field"] for f in fields.values()]
+    remaining = limit
+    for file in files:
+        parquet = open_parquet(file)
+        for batch in parquet.iter_batches(batch_rows, columns=list(fields)):
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= len(batch)
+            yield batch.rename_columns(names)
+            if remaining is not None and remaining <= 0:
+                return
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Validate croissant parquet files.")
+    parser.add_argument("metadata", type=Path, help="Croissant metadata.json.")
+    parser.add_argument("--record-set", help="Only this record set.")
+    parser.add_argument(
+        "--scan", action="store_true", help="Also read every record of the set."
+    )
+    parser.add_argument(
+        "--batch-rows", type=int, default=DEFAULT_BATCH_ROWS, help="Scan batch size."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    """Validate croissant metadata and optionally scan its record sets."""
+    args = parse_args(argv)
+    start = time.monotonic()
+    try:
+        stats = validate(args.metadata, args.record_set)
+    except CroissantError as e:
+        logger.error("✗ %s", e)
+        sys.exit(1)
+    for name, totals in stats.items():
+        logger.info(
+            "✓ %s: %s rows, %s row groups, %s files (%.1f MB), validated in %.3fs",
+            name,
+            totals["rows"],
+            totals["row_groups"],
+            totals["files"],
+            totals["bytes"] / 1e6,
+            time.monotonic() - start,
+        )
+        if args.scan:
+            scan_start = time.monotonic()
+            batches = iter_batches(args.metadata, name, args.batch_rows)
+            rows = sum(len(b) for b in batches)
+            logger.info(
+                "  scanned %s rows in %.2fs", rows, time.monotonic() - scan_start
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,13 @@ Unit tests for the entity Dataitem
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.dataitem._base.entity import Dataitem
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -53,14 +54,14 @@ class TestDataitemCRUD:
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
-        for i in DATAITEM_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             d = dh.new_dataitem(self.project.name, **i)
             assert isinstance(d, Dataitem)
             assert d.name == i["name"]
             assert d.kind == i["kind"]
             dh.delete_dataitem(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_dataitems, entity_id=d.id)
 
             # Test module-level create + delete by name and id
             d = dh.new_dataitem(self.project.name, **i)
@@ -70,11 +71,13 @@ class TestDataitemCRUD:
                 entity_id=d.id,
                 cascade=False,
             )
-            time.sleep(2)
+            wait_until_absent(self.project.list_dataitems, entity_id=d.id)
             # Test project-level create + delete
             d = self.project.new_dataitem(**i)
             self.project.delete_dataitem(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_dataitems, entity_id=d.id)
+
+        map_items(_create_and_delete, DATAITEM_DICTS)
 
         assert dh.list_dataitems(self.project.name) == []
 
@@ -83,8 +86,7 @@ class TestDataitemCRUD:
 
         assert dh.list_dataitems(self.project.name) == []
 
-        for i in DATAITEM_DICTS:
-            dh.new_dataitem(self.project.name, **i)
+        map_items(lambda i: dh.new_dataitem(self.project.name, **i), DATAITEM_DICTS)
 
         l_obj = dh.list_dataitems(self.project.name)
         assert isinstance(l_obj, list)
@@ -92,21 +94,23 @@ class TestDataitemCRUD:
         for i in l_obj:
             assert isinstance(i, Dataitem)
 
-        for obj in l_obj:
-            dh.delete_dataitem(
+        map_items(
+            lambda obj: dh.delete_dataitem(
                 obj.name,
                 project=self.project.name,
                 delete_all_versions=True,
                 cascade=False,
-            )
-            time.sleep(2)
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_dataitems)
 
         assert len(dh.list_dataitems(self.project.name)) == 0
 
     def test_get(self):
         """Test getting dataitems by different identifiers."""
 
-        for i in DATAITEM_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_dataitem(self.project.name, **i)
             assert isinstance(o1, Dataitem)
 
@@ -120,10 +124,11 @@ class TestDataitemCRUD:
             assert isinstance(o3, Dataitem)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, DATAITEM_DICTS)
+
         l_obj = dh.list_dataitems(self.project.name)
-        for obj in l_obj:
-            dh.delete_dataitem(obj.key, cascade=False)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_dataitem(obj.key, cascade=False), l_obj)
+        wait_until_absent(self.project.list_dataitems)
 
         assert len(dh.list_dataitems(self.project.name)) == 0
 
@@ -152,7 +157,7 @@ class TestDataitemCRUD:
 
         # Cleanup
         dh.delete_dataitem(di.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, entity_id=di.id)
 
     def test_versions(self):
         """Test versioning functionality."""
@@ -187,7 +192,7 @@ class TestDataitemCRUD:
             delete_all_versions=True,
             cascade=False,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, name=name)
         assert len(dh.list_dataitems(self.project.name)) == 0
 
     def test_import_export(self):
@@ -207,7 +212,7 @@ class TestDataitemCRUD:
         assert Path(export_path).exists()
 
         dh.delete_dataitem(di.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, entity_id=di.id)
         assert len(dh.list_dataitems(self.project.name)) == 0
 
         imported = dh.import_dataitem(file=export_path)
@@ -217,7 +222,7 @@ class TestDataitemCRUD:
         assert imported.metadata.description == description
 
         dh.delete_dataitem(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -240,5 +245,5 @@ class TestDataitemCRUD:
         assert updated.metadata.description == description
 
         self.project.delete_dataitem(di.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, entity_id=di.id)
         assert len(self.project.list_dataitems()) == 0
@@ -0,0 +1,579 @@
+"""
+In-process stand-in for the DigitalHub Core REST API.
+
+Implements the project and context entity endpoints the SDK uses in the
+CRUD tests (artifacts, dataitems, models, functions, tasks, runs,
+workflows, triggers, secrets, containerimages) on top of in-memory storage
+indexed by project, entity type, id and name. It is meant for offline runs
+and as a zero-latency baseline for SDK-side overhead; it does not execute
+runs nor store files.
+
+    server = FakeCore()
+    server.start()
+    os.environ["DHCORE_ENDPOINT"] = server.endpoint
+
+A fault_profiles.FaultProfile adds request latency, injected 5xx errors
+and delayed visibility of creations and deletions.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import logging
+import random
+import re
+import threading
+import time
+import typing
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from fault_profiles import FaultProfile
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+
+API_BASE = "/api/v1"
+API_CONTEXT = "/api/v1/-"
+
+# Entity types served under /api/v1/-/{project}/{type}s
+CONTEXT_TYPES = {
+    "artifact",
+    "dataitem",
+    "model",
+    "function",
+    "task",
+    "run",
+    "workflow",
+    "trigger",
+    "secret",
+    "containerimage",
+}
+# Entity types listed by latest version unless versions=all is requested
+VERSIONED_TYPES = {
+    "artifact",
+    "dataitem",
+    "model",
+    "function",
+    "workflow",
+    "secret",
+    "containerimage",
+}
+# State reached right after creation, since nothing is built or executed
+INITIAL_STATES = {"run": "READY"}
+# Query parameters that never filter entities
+RESERVED_PARAMS = {"page", "size", "sort", "versions", "cascade", "keys"}
+DEFAULT_PAGE_SIZE = 20
+
+logger = logging.getLogger(__name__)
+
+
+class FakeCoreError(Exception):
+    """Error mapped to an HTTP status code by the request handler."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _lookup(entity: dict, field: str) -> typing.Any:
+    """Return a filterable field from the entity, its metadata, spec or status."""
+    for section in (entity, entity.get("metadata", {}), entity.get("spec", {})):
+        if field in section:
+            return section[field]
+    if field == "state":
+        return entity.get("status", {}).get("state")
+    return None
+
+
+class Storage:
+    """
+    Thread-safe in-memory entity storage.
+
+    Entities live in per (project, type) tables keyed by id, with a name
+    index that keeps ids in creation order so the latest version and the
+    version history are found without scanning the table.
+
+    With a create delay, new entities can be read by id but are not listed
+    until the delay has passed. With a delete delay, deletions are
+    acknowledged at once and applied when the delay has passed.
+    """
+
+    def __init__(self, create_delay: float = 0.0, delete_delay: float = 0.0):
+        self.lock = threading.RLock()
+        self.projects: dict[str, dict] = {}
+        self.tables: dict[tuple[str, str], dict[str, dict]] = {}
+        self.names: dict[tuple[str, str], dict[str, list[str]]] = {}
+        self.secrets: dict[str, dict[str, str]] = {}
+        self.create_delay = create_delay
+        self.delete_delay = delete_delay
+        self._hidden: dict[tuple[str, str, str], float] = {}
+        self._pending: list[tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+
+    def _settle(self) -> None:
+        """Apply the deferred deletions that are due."""
+        now = time.monotonic()
+        while self._pending and self._pending[0][0] <= now:
+            _, _, apply = heapq.heappop(self._pending)
+            try:
+                apply()
+            except FakeCoreError:
+                # Already gone, e.g. deleted twice or with its project
+                pass
+
+    def _defer(self, apply: Callable[[], None]) -> None:
+        deadline = time.monotonic() + self.delete_delay
+        heapq.heappush(self._pending, (deadline, next(self._counter), apply))
+
+    def _visible(self, project: str, entity_type: str, entity_id: str) -> bool:
+        key = (project, entity_type, entity_id)
+        if key not in self._hidden:
+            return True
+        if self._hidden[key] > time.monotonic():
+            return False
+        del self._hidden[key]
+        return True
+
+    # Projects
+
+    def create_project(self, body: dict) -> dict:
+        with self.lock:
+            name = body.get("name")
+            if not name:
+                raise FakeCoreError(400, "project name is required")
+            if name in self.projects:
+                raise FakeCoreError(409, f"project {name} already exists")
+            project = {
+                **body,
+                "id": name,
+                "kind": body.get("kind", "project"),
+                "metadata": {
+                    **body.get("metadata", {}),
+                    "project": name,
+                    "created": _now(),
+                    "updated": _now(),
+                },
+                "spec": body.get("spec", {}),
+                "status": {"state": "CREATED"},
+            }
+            self.projects[name] = project
+            return self.read_project(name)
+
+    def read_project(self, name: str) -> dict:
+        with self.lock:
+            if name not in self.projects:
+                raise FakeCoreError(404, f"project {name} not found")
+            project = json.loads(json.dumps(self.projects[name]))
+            for (p, entity_type), _ in self.tables.items():
+                if p == name:
+                    project["spec"][f"{entity_type}s"] = self.list(
+                        name, entity_type, {}
+                    )
+            return project
+
+    def update_project(self, name: str, body: dict) -> dict:
+        with self.lock:
+            if name not in self.projects:
+                raise FakeCoreError(404, f"project {name} not found")
+            stored = self.projects[name]
+            stored["metadata"] = {
+                **body.get("metadata", {}),
+                "project": name,
+                "created": stored["metadata"]["created"],
+                "updated": _now(),
+            }
+            # Embedded entity lists are rebuilt from storage on read
+            embedded = {f"{entity_type}s" for _, entity_type in self.tables}
+            stored["spec"] = {
+                k: v for k, v in body.get("spec", {}).items() if k not in embedded
+            }
+            return self.read_project(name)
+
+    def delete_project(self, name: str) -> None:
+        with self.lock:
+            if self.projects.pop(name, None) is None:
+                raise FakeCoreError(404, f"project {name} not found")
+            for key in [k for k in self.tables if k[0] == name]:
+                del self.tables[key]
+                del self.names[key]
+            self.secrets.pop(name, None)
+
+    def list_projects(self) -> list[dict]:
+        with self.lock:
+            return [self.read_project(name) for name in self.projects]
+
+    # Context entities
+
+    def _table(self, project: str, entity_type: str) -> dict[str, dict]:
+        if project not in self.projects:
+            raise FakeCoreError(404, f"project {project} not found")
+        self.names.setdefault((project, entity_type), {})
+        return self.tables.setdefault((project, entity_type), {})
+
+    def create(self, project: str, entity_type: str, body: dict) -> dict:
+        with self.lock:
+            table = self._table(project, entity_type)
+            entity_id = body.get("id") or uuid.uuid4().hex
+            if entity_id in table:
+                raise FakeCoreError(409, f"{entity_type} {entity_id} already exists")
+            name = body.get("name") or entity_id
+            kind = body.get("kind", entity_type)
+            metadata = {
+                **body.get("metadata", {}),
+                "project": project,
+                "name": name,
+                "created": _now(),
+                "updated": _now(),
+            }
+            if entity_type in VERSIONED_TYPES:
+                metadata["version"] = entity_id
+            status = {**body.get("status", {})}
+            if status.get("state") in (None, "CREATED"):
+                status["state"] = INITIAL_STATES.get(entity_type, "CREATED")
+            entity = {
+                **body,
+                "id": entity_id,
+                "name": name,
+                "kind": kind,
+                "project": project,
+                "key": f"store://{project}/{entity_type}/{kind}/{name}:{entity_id}",
+                "metadata": metadata,
+                "spec": body.get("spec", {}),
+                "status": status,
+            }
+            table[entity_id] = entity
+            if self.create_delay:
+                visible_at = time.monotonic() + self.create_delay
+                self._hidden[(project, entity_type, entity_id)] = visible_at
+            self.names[(project, entity_type)].setdefault(name, []).append(entity_id)
+            return entity
+
+    def read(self, project: str, entity_type: str, entity_id: str) -> dict:
+        with self.lock:
+            self._settle()
+            entity = self._table(project, entity_type).get(entity_id)
+            if entity is None:
+                raise FakeCoreError(404, f"{entity_type} {entity_id} not found")
+            return entity
+
+    def update(self, project: str, entity_type: str, entity_id: str, body: dict):
+        with self.lock:
+            stored = self.read(project, entity_type, entity_id)
+            for section in ("metadata", "spec", "status"):
+                if section in body:
+                    stored[section] = {**stored[section], **body[section]}
+            stored["metadata"]["updated"] = _now()
+            return stored
+
+    def list(self, project: str, entity_type: str, params: dict) -> list[dict]:
+        with self.lock:
+            self._settle()
+            table = self._table(project, entity_type)
+            names = self.names[(project, entity_type)]
+            name = params.get("name")
+            all_versions = params.get("versions") == "all"
+            if name is not None:
+                ids = list(names.get(name, []))
+                if not all_versions and entity_type in VERSIONED_TYPES:
+                    ids = ids[-1:]
+            elif all_versions or entity_type not in VERSIONED_TYPES:
+                ids = list(table)
+            else:
+                ids = [versions[-1] for versions in names.values() if versions]
+            entities = [
+                table[i] for i in ids if self._visible(project, entity_type, i)
+            ]
+            filters = {
+                k: v
+                for k, v in params.items()
+                if k not in RESERVED_PARAMS and k != "name"
+            }
+            entities = [
+                e
+                for e in entities
+                if all(str(_lookup(e, k)) == v for k, v in filters.items())
+            ]
+            return sorted(
+                entities, key=lambda e: e["metadata"]["created"], reverse=True
+            )
+
+    def _remove(self, project: str, entity_type: str, entity_id: str) -> dict:
+        table = self._table(project, entity_type)
+        entity = table.pop(entity_id, None)
+        if entity is None:
+            raise FakeCoreError(404, f"{entity_type} {entity_id} not found")
+        versions = self.names[(project, entity_type)][entity["name"]]
+        versions.remove(entity_id)
+        if not versions:
+            del self.names[(project, entity_type)][entity["name"]]
+        return entity
+
+    def _cascade(self, project: str, entity_type: str, entity: dict) -> None:
+        """Delete tasks, runs and triggers that reference a deleted entity."""
+        if entity_type == "function" or entity_type == "workflow":
+            field, ref = "function", f"/{entity['name']}:{entity['id']}"
+            dependents = ("trigger", "task", "run")
+        elif entity_type == "task":
+            field, ref = "task", entity["id"]
+            dependents = ("run",)
+        else:
+            return
+        for dependent in dependents:
+            table = self.tables.get((project, dependent), {})
+            for child in list(table.values()):
+                value = str(child.get("spec", {}).get(field, ""))
+                if value.endswith(ref) and child["id"] in table:
+                    self._remove(project, dependent, child["id"])
+                    self._cascade(project, dependent, child)
+
+    def delete(
+        self, project: str, entity_type: str, entity_id: str, cascade: bool
+    ) -> None:
+        with self.lock:
+            self._settle()
+            if self.delete_delay:
+                self.read(project, entity_type, entity_id)
+                self._defer(
+                    lambda: self._delete(project, entity_type, entity_id, cascade)
+                )
+            else:
+                self._delete(project, entity_type, entity_id, cascade)
+
+    def _delete(
+        self, project: str, entity_type: str, entity_id: str, cascade: bool
+    ) -> None:
+        entity = self._remove(project, entity_type, entity_id)
+        self._hidden.pop((project, entity_type, entity_id), None)
+        if cascade:
+            self._cascade(project, entity_type, entity)
+
+    def delete_versions(
+        self, project: str, entity_type: str, name: str, cascade: bool
+    ) -> None:
+        with self.lock:
+            ids = list(self.names.get((project, entity_type), {}).get(name, []))
+            for entity_id in ids:
+                self.delete(project, entity_type, entity_id, cascade)
+
+    # Secret values
+
+    def read_secret_values(self, project: str, keys: list[str]) -> dict:
+        with self.lock:
+            values = self.secrets.get(project, {})
+            return {k: values[k] for k in keys if k in values}
+
+    def write_secret_values(self, project: str, values: dict) -> dict:
+        with self.lock:
+            self.secrets.setdefault(project, {}).update(values)
+            return values
+
+
+def _page(entities: list[dict], params: dict) -> dict:
+    """Wrap a listing into a Spring-style page, as Core does."""
+    size = max(int(params.get("size", DEFAULT_PAGE_SIZE)), 1)
+    page = max(int(params.get("page", 0)), 0)
+    total = len(entities)
+    total_pages = (total + size - 1) // size
+    content = entities[page * size : (page + 1) * size]
+    return {
+        "content": content,
+        "pageable": {"pageNumber": page, "pageSize": size},
+        "totalElements": total,
+        "totalPages": total_pages,
+        "number": page,
+        "size": size,
+        "numberOfElements": len(content),
+        "first": page == 0,
+        "last": page >= total_pages - 1,
+        "empty": not content,
+    }
+
+
+_CONTEXT_PATH = re.compile(
+    rf"^{API_CONTEXT}/(?P<project>[^/]+)/(?P<type>[a-z]+)s"
+    r"(?:/(?P<id>[^/]+)(?:/(?P<sub>.+))?)?$"
+)
+_PROJECT_PATH = re.compile(rf"^{API_BASE}/projects(?:/(?P<name>[^/]+))?$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        logger.debug(format, *args)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send(self, status: int, payload: typing.Any) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            body = self._body() if method in ("POST", "PUT") else {}
+            status, payload = self.server.respond(method, url.path, params, body)
+        except FakeCoreError as e:
+            status, payload = e.status, {"status": e.status, "message": str(e)}
+        except (ValueError, KeyError) as e:
+            status, payload = 400, {"status": 400, "message": str(e)}
+        self._send(status, payload)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], storage: Storage, profile: FaultProfile
+    ):
+        super().__init__(address, _Handler)
+        self.storage = storage
+        self.profile = profile
+        self.stats = {"requests": 0, "injected_errors": 0, "injected_latency_s": 0.0}
+        self._rng = random.Random(profile.seed)
+        self._stats_lock = threading.Lock()
+
+    def respond(self, method: str, path: str, params: dict, body: dict):
+        """Apply the fault profile, then route the request."""
+        with self._stats_lock:
+            delay = self.profile.sample_latency(self._rng, method)
+            fail = self.profile.should_fail(self._rng)
+            self.stats["requests"] += 1
+            self.stats["injected_latency_s"] += delay
+            self.stats["injected_errors"] += fail
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise FakeCoreError(self.profile.error_status, "injected failure")
+        return self.route(method, path, params, body)
+
+    def route(self, method: str, path: str, params: dict, body: dict):
+        """Return (status, payload) for a request."""
+        storage = self.storage
+        path = path.rstrip("/")
+        cascade = params.get("cascade", "true").lower() == "true"
+
+        if match := _PROJECT_PATH.match(path):
+            name = match["name"]
+            if name is None:
+                if method == "POST":
+                    return 200, storage.create_project(body)
+                if method == "GET":
+                    return 200, _page(storage.list_projects(), params)
+            elif method == "GET":
+                return 200, storage.read_project(name)
+            elif method == "PUT":
+                return 200, storage.update_project(name, body)
+            elif method == "DELETE":
+                storage.delete_project(name)
+                return 200, True
+            raise FakeCoreError(405, f"{method} not allowed on {path}")
+
+        match = _CONTEXT_PATH.match(path)
+        if match and match["type"] in CONTEXT_TYPES:
+            project, entity_type = match["project"], match["type"]
+            entity_id, sub = match["id"], match["sub"]
+            if entity_type == "secret" and entity_id == "data":
+                if method == "GET":
+                    keys = params.get("keys", "").split(",")
+                    return 200, storage.read_secret_values(project, keys)
+                return 200, storage.write_secret_values(project, body)
+            if entity_id is None:
+                if method == "POST":
+                    return 200, storage.create(project, entity_type, body)
+                if method == "GET":
+                    entities = storage.list(project, entity_type, params)
+                    return 200, _page(entities, params)
+                if method == "DELETE" and "name" in params:
+                    storage.delete_versions(
+                        project, entity_type, params["name"], cascade
+                    )
+                    return 200, True
+            elif sub is not None:
+                # Logs, files, metrics, stop/resume: nothing is executed here
+                storage.read(project, entity_type, entity_id)
+                return 200, [] if method == "GET" else {}
+            elif method == "GET":
+                return 200, storage.read(project, entity_type, entity_id)
+            elif method == "PUT":
+                return 200, storage.update(project, entity_type, entity_id, body)
+            elif method == "DELETE":
+                storage.delete(project, entity_type, entity_id, cascade)
+                return 200, True
+            raise FakeCoreError(405, f"{method} not allowed on {path}")
+
+        if path.startswith(API_CONTEXT) and method in ("POST", "PUT"):
+            # Sharing and other project-level settings are accepted as no-ops
+            return 200, body
+        raise FakeCoreError(404, f"no route for {method} {path}")
+
+
+class FakeCore:
+    """Fake Core server running on a background thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        profile: FaultProfile | None = None,
+    ):
+        profile = profile or FaultProfile()
+        self.storage = Storage(
+            create_delay=profile.create_visibility_ms / 1000,
+            delete_delay=profile.delete_visibility_ms / 1000,
+        )
+        self._server = _Server((host, port), self.storage, profile)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def stats(self) -> dict:
+        """Number of requests served and faults injected so far."""
+        return dict(self._server.stats)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeCore:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-core", daemon=True
+        )
+        self._thread.start()
+        logger.info("Fake Core listening on %s", self.endpoint)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
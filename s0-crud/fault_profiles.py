@@ -0,0 +1,111 @@
+"""
+Latency and fault injection profiles for the fake Core.
+
+A profile describes how the stand-in backend misbehaves: how long each
+request takes, which share of requests fails with a 5xx status, and how
+long creations and deletions take to become visible in listings. Profiles
+are selected by preset name or loaded from a JSON file with the same
+fields, e.g.
+
+    {"latency_ms": 40, "distribution": "lognormal", "jitter": 0.5,
+     "error_rate": 0.02, "delete_visibility_ms": 1500}
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+
+DISTRIBUTIONS = ("constant", "uniform", "lognormal")
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Backend behaviour injected by the fake Core.
+
+    latency_ms is the median request latency, overridden per HTTP method
+    by method_latency_ms. With the uniform distribution jitter is the
+    relative half-width of the interval, with lognormal it is the sigma
+    of the underlying normal distribution. error_rate is the probability
+    that a request is rejected with error_status before it is applied.
+    """
+
+    latency_ms: float = 0.0
+    distribution: str = "constant"
+    jitter: float = 0.0
+    method_latency_ms: dict[str, float] = field(default_factory=dict)
+    error_rate: float = 0.0
+    error_status: int = 503
+    create_visibility_ms: float = 0.0
+    delete_visibility_ms: float = 0.0
+    seed: int | None = None
+
+    def __post_init__(self):
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+
+    def sample_latency(self, rng: random.Random, method: str) -> float:
+        """Return a request latency in seconds."""
+        median = self.method_latency_ms.get(method, self.latency_ms)
+        if median <= 0:
+            return 0.0
+        if self.distribution == "uniform":
+            low = max(median * (1 - self.jitter), 0.0)
+            sample = rng.uniform(low, median * (1 + self.jitter))
+        elif self.distribution == "lognormal":
+            sample = rng.lognormvariate(math.log(median), self.jitter)
+        else:
+            sample = median
+        return sample / 1000
+
+    def should_fail(self, rng: random.Random) -> bool:
+        """Return True if the request has to be rejected."""
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+
+PROFILES = {
+    "none": FaultProfile(),
+    "lan": FaultProfile(latency_ms=5, distribution="lognormal", jitter=0.3),
+    "wan": FaultProfile(latency_ms=80, distribution="lognormal", jitter=0.5),
+    "eventual": FaultProfile(
+        latency_ms=5,
+        distribution="lognormal",
+        jitter=0.3,
+        create_visibility_ms=200,
+        delete_visibility_ms=1000,
+    ),
+    "flaky": FaultProfile(
+        latency_ms=5, distribution="lognormal", jitter=0.3, error_rate=0.05
+    ),
+    "degraded": FaultProfile(
+        latency_ms=80,
+        distribution="lognormal",
+        jitter=0.5,
+        error_rate=0.02,
+        create_visibility_ms=500,
+        delete_visibility_ms=2000,
+    ),
+}
+
+
+def load_profile(spec: str) -> FaultProfile:
+    """Return the preset named spec, or the profile stored in the JSON file spec."""
+    if spec in PROFILES:
+        return PROFILES[spec]
+    path = Path(spec)
+    if not path.is_file():
+        raise ValueError(
+            f"Unknown fault profile {spec!r}, expected one of "
+            f"{', '.join(PROFILES)} or a JSON file"
+        )
+    data = json.loads(path.read_text())
+    unknown = set(data) - {f.name for f in fields(FaultProfile)}
+    if unknown:
+        raise ValueError(f"Unknown fault profile fields: {', '.join(sorted(unknown))}")
+    return FaultProfile(**data)
@@ -0,0 +1,80 @@
+"""
+Shared, lazily loaded test datasets.
+
+Datasets (CSV or parquet files) are read into an Arrow table the first
+time a test asks for them and memoized by path, modification time and
+size, so every test class shares one copy and an edited file is reloaded.
+pandas and polars views are built from the same Arrow buffers without
+copying the data and are memoized alongside the table. pyarrow, pandas
+and polars are only imported when a dataset is first requested.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import typing
+from pathlib import Path
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+_cache: dict[str, tuple[tuple[int, int], dict[str, typing.Any]]] = {}
+_lock = threading.Lock()
+
+
+def _entry(path: str | Path) -> dict[str, typing.Any]:
+    """Return the cache entry of a dataset, loading it if needed."""
+    resolved = str(Path(path).resolve())
+    stat = os.stat(resolved)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _cache.get(resolved)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        if resolved.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(resolved, memory_map=True)
+        else:
+            import pyarrow.csv as pa_csv
+
+            table = pa_csv.read_csv(resolved)
+        entry = {"arrow": table}
+        _cache[resolved] = (stamp, entry)
+        return entry
+
+
+def _view(path: str | Path, name: str, build: typing.Callable[[pa.Table], typing.Any]):
+    entry = _entry(path)
+    with _lock:
+        if name not in entry:
+            entry[name] = build(entry["arrow"])
+        return entry[name]
+
+
+def arrow_table(path: str | Path) -> pa.Table:
+    """Return the dataset at path as an Arrow table."""
+    return _entry(path)["arrow"]
+
+
+def pandas_frame(path: str | Path) -> pd.DataFrame:
+    """Return the dataset at path as a pandas dataframe with Arrow dtypes."""
+    import pandas as pd
+
+    return _view(path, "pandas", lambda t: t.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def polars_frame(path: str | Path) -> pl.DataFrame:
+    """Return the dataset at path as a polars dataframe."""
+    import polars as pl
+
+    return _view(path, "polars", pl.from_arrow)
+
+
+def clear() -> None:
+    """Drop every cached dataset."""
+    with _lock:
+        _cache.clear()
@@ -7,12 +7,13 @@ Unit tests for the entity Function
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.function._base.entity import Function
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -51,24 +52,26 @@ class TestFunctionCRUD:
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
-        for i in FUNCTION_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             f = dh.new_function(self.project.name, **i)
             assert isinstance(f, Function)
             assert f.name == i["name"]
             assert f.kind == i["kind"]
             dh.delete_function(f.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_functions, entity_id=f.id)
 
             # Test module-level create + delete by name and id
             f = dh.new_function(self.project.name, **i)
             dh.delete_function(f.name, project=self.project.name, entity_id=f.id)
-            time.sleep(2)
+            wait_until_absent(self.project.list_functions, entity_id=f.id)
 
             # Test project-level create + delete
             f = self.project.new_function(**i)
             self.project.delete_function(f.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_functions, entity_id=f.id)
+
+        map_items(_create_and_delete, FUNCTION_DICTS)
 
         assert dh.list_functions(self.project.name) == []
 
@@ -77,8 +80,7 @@ class TestFunctionCRUD:
 
         assert dh.list_functions(self.project.name) == []
 
-        for i in FUNCTION_DICTS:
-            dh.new_function(self.project.name, **i)
+        map_items(lambda i: dh.new_function(self.project.name, **i), FUNCTION_DICTS)
 
         l_obj = dh.list_functions(self.project.name)
         assert isinstance(l_obj, list)
@@ -86,19 +88,22 @@ class TestFunctionCRUD:
         for i in l_obj:
             assert isinstance(i, Function)
 
-        for obj in l_obj:
-            dh.delete_function(
-                obj.name, project=self.project.name, delete_all_versions=True
-            )
-            time.sleep(2)
-        time.sleep(2)
+        map_items(
+            lambda obj: dh.delete_function(
+                obj.name,
+                project=self.project.name,
+                delete_all_versions=True,
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_functions)
 
         assert len(dh.list_functions(self.project.name)) == 0
 
     def test_get(self):
         """Test getting functions by different identifiers."""
 
-        for i in FUNCTION_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_function(self.project.name, **i)
             assert isinstance(o1, Function)
 
@@ -112,13 +117,12 @@ class TestFunctionCRUD:
             assert isinstance(o3, Function)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, FUNCTION_DICTS)
+
         l_obj = dh.list_functions(self.project.name)
 
-        time.sleep(2)
-        for obj in l_obj:
-            dh.delete_function(obj.key)
-            time.sleep(2)
-        time.sleep(2)
+        map_items(lambda obj: dh.delete_function(obj.key), l_obj)
+        wait_until_absent(self.project.list_functions)
 
         assert len(dh.list_functions(self.project.name)) == 0
 
@@ -147,7 +151,7 @@ class TestFunctionCRUD:
 
         # Cleanup
         dh.delete_function(func.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=func.id)
 
     def test_versions(self):
         """Test versioning functionality."""
@@ -185,7 +189,7 @@ class TestFunctionCRUD:
             project=self.project.name,
             delete_all_versions=True,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, name=name)
         assert len(dh.list_functions(self.project.name)) == 0
 
     def test_import_export(self):
@@ -205,7 +209,7 @@ class TestFunctionCRUD:
         assert Path(export_path).exists()
 
         dh.delete_function(func.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=func.id)
         assert len(dh.list_functions(self.project.name)) == 0
 
         imported = dh.import_function(file=export_path)
@@ -215,7 +219,7 @@ class TestFunctionCRUD:
         assert imported.metadata.description == description
 
         dh.delete_function(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -238,5 +242,5 @@ class TestFunctionCRUD:
         assert updated.metadata.description == description
 
         self.project.delete_function(func.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=func.id)
         assert len(self.project.list_functions()) == 0
@@ -0,0 +1,312 @@
+"""
+Load generator for DigitalHub Core built from the CRUD entity fixtures.
+
+N workers (threads or processes) replay a weighted mix of create, get,
+list, update and delete operations against a project, using the fixture
+dicts of the CRUD tests as payloads. Each worker only reads, updates and
+deletes the entities it created itself. The outcome is reported as
+operations per second and latency statistics and histograms per operation.
+
+    python loadgen.py --workers 16 --duration 60 --mix create=1,get=4,list=2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import digitalhub as dh
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from artifact import ARTIFACT_DICTS
+from bench_utils import histogram
+from containerimage import CONTAINERIMAGE_DICTS
+from dataitem import DATAITEM_DICTS
+from fake_core import FakeCore
+from fault_profiles import load_profile
+from function import FUNCTION_DICTS
+from logging_utils import configure_logging
+from model import MODEL_DICTS
+from project_pool import prepare_project, wipe_project
+from report import summarize
+from workflow import WORKFLOW_DICTS
+
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+FIXTURES = {
+    "artifact": ARTIFACT_DICTS,
+    "dataitem": DATAITEM_DICTS,
+    "model": MODEL_DICTS,
+    "function": FUNCTION_DICTS,
+    "workflow": WORKFLOW_DICTS,
+    "containerimage": CONTAINERIMAGE_DICTS,
+}
+OPERATIONS = ("create", "get", "list", "update", "delete")
+DEFAULT_MIX = "create=2,get=4,list=2,update=1,delete=1"
+logger = configure_logging(__name__)
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse "op=weight,..." into a weight per operation."""
+    weights = {}
+    for item in mix.split(","):
+        op, _, weight = item.partition("=")
+        op = op.strip()
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown operation {op!r} in mix, expected {OPERATIONS}")
+        weights[op] = float(weight or 1)
+    if not any(weights.values()):
+        raise ValueError("The operation mix must have a positive weight")
+    return weights
+
+
+class Worker:
+    """Runs operations against a project and collects their latencies."""
+
+    def __init__(self, project_name: str, index: int, types: list[str], seed: int):
+        self.project = dh.get_project(project_name)
+        self.index = index
+        self.types = types
+        self.rng = random.Random(seed + index)
+        self.owned: dict[str, list] = {t: [] for t in types}
+        self.created = 0
+
+    def _payload(self, entity_type: str) -> dict:
+        # Fixtures carry fixed ids, every created entity needs its own
+        payload = dict(self.rng.choice(FIXTURES[entity_type]))
+        payload.pop("uuid", None)
+        payload["name"] = f"load-{self.index}-{self.created}"
+        self.created += 1
+        return payload
+
+    def run_operation(self, op: str, entity_type: str) -> str:
+        """Run one operation, return the operation actually run."""
+        owned = self.owned[entity_type]
+        if op in ("get", "update", "delete") and not owned:
+            op = "create"
+        if op == "create":
+            payload = self._payload(entity_type)
+            create = getattr(dh, f"new_{entity_type}")
+            owned.append(create(self.project.name, **payload))
+        elif op == "get":
+            getattr(dh, f"get_{entity_type}")(self.rng.choice(owned).key)
+        elif op == "list":
+            getattr(dh, f"list_{entity_type}s")(self.project.name)
+        elif op == "update":
+            entity = self.rng.choice(owned)
+            entity.metadata.description = f"updated at {time.time()}"
+            getattr(self.project, f"update_{entity_type}")(entity)
+        else:
+            entity = owned.pop(self.rng.randrange(len(owned)))
+            getattr(dh, f"delete_{entity_type}")(entity.key)
+        return op
+
+    def run(self, weights: dict[str, float], duration: float, ops: int) -> dict:
+        """Run operations until duration elapses or ops are done."""
+        names, op_weights = list(weights), list(weights.values())
+        samples = []
+        errors = Counter()
+        start = time.monotonic()
+        deadline = start + duration if duration else None
+        while (not ops or len(samples) < ops) and (
+            deadline is None or time.monotonic() < deadline
+        ):
+            op = self.rng.choices(names, op_weights)[0]
+            entity_type = self.rng.choice(self.types)
+            op_start = time.monotonic()
+            try:
+                op = self.run_operation(op, entity_type)
+                ok = True
+            except Exception as e:
+                errors[f"{op}: {type(e).__name__}"] += 1
+                ok = False
+            samples.append((op, entity_type, time.monotonic() - op_start, ok))
+        return {
+            "samples": samples,
+            "errors": dict(errors),
+            "elapsed_s": time.monotonic() - start,
+        }
+
+
+def run_worker(
+    project_name: str,
+    index: int,
+    types: list[str],
+    weights: dict[str, float],
+    duration: float,
+    ops: int,
+    seed: int,
+) -> dict:
+    """Entry point of a worker thread or process."""
+    try:
+        worker = Worker(project_name, index, types, seed)
+        return worker.run(weights, duration, ops)
+    except Exception:
+        return {"samples": [], "errors": {traceback.format_exc(): 1}, "elapsed_s": 0}
+
+
+def build_report(results: list[dict], workers: int, mode: str) -> dict:
+    """Aggregate worker results into ops/s and latency per operation."""
+    elapsed = max((r["elapsed_s"] for r in results), default=0.0) or 1e-9
+    samples = [s for r in results for s in r["samples"]]
+    errors = Counter()
+    for r in results:
+        errors.update(r["errors"])
+    operations = {}
+    for op in OPERATIONS:
+        latencies = [s[2] for s in samples if s[0] == op and s[3]]
+        failed = sum(1 for s in samples if s[0] == op and not s[3])
+        if not latencies and not failed:
+            continue
+        operations[op] = {
+            "ok": len(latencies),
+            "failed": failed,
+            "ops_per_s": round(len(latencies) / elapsed, 2),
+            "latency_s": summarize(latencies),
+            "histogram": histogram(latencies),
+        }
+    ok = sum(1 for s in samples if s[3])
+    return {
+        "workers": workers,
+        "mode": mode,
+        "elapsed_s": round(elapsed, 3),
+        "operations_total": len(samples),
+        "ops_per_s": round(ok / elapsed, 2),
+        "errors": dict(errors),
+        "operations": operations,
+    }
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate load on DigitalHub Core.")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent workers.")
+    parser.add_argument(
+        "--mode",
+        choices=("thread", "process"),
+        default="thread",
+        help="Run workers as threads or as processes.",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="Seconds of load per worker."
+    )
+    parser.add_argument(
+        "--ops",
+        type=int,
+        default=0,
+        help="Stop each worker after this many operations (0: no limit).",
+    )
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"Operation weights (default: {DEFAULT_MIX}).",
+    )
+    parser.add_argument(
+        "--types",
+        default=",".join(FIXTURES),
+        help="Comma-separated entity types to exercise.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--project",
+        default=f"{PROJECT_NAME}-load",
+        help="Project the load is generated against.",
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Do not wipe the project afterwards."
+    )
+    parser.add_argument(
+        "--fake-core-profile",
+        metavar="PROFILE",
+        help="Generate load against an in-process fake Core with this profile.",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    try:
+        args.mix = parse_mix(args.mix)
+        if args.fake_core_profile is not None:
+            args.fake_core_profile = load_profile(args.fake_core_profile)
+    except ValueError as e:
+        parser.error(str(e))
+    args.types = [t.strip() for t in args.types.split(",") if t.strip()]
+    unknown = set(args.types) - set(FIXTURES)
+    if unknown:
+        parser.error(f"unknown entity types: {', '.join(sorted(unknown))}")
+    if not args.duration and not args.ops:
+        parser.error("one of --duration and --ops must be positive")
+    return args
+
+
+def main(argv=None) -> None:
+    """Generate load and report the throughput."""
+    args = parse_args(argv)
+    if args.fake_core_profile is not None:
+        core = FakeCore(profile=args.fake_core_profile).start()
+        # Inherited by worker processes
+        os.environ["DHCORE_ENDPOINT"] = core.endpoint
+
+    project = prepare_project(args.project)
+    if args.mode == "thread":
+        executor_class = ThreadPoolExecutor
+    else:
+        executor_class = ProcessPoolExecutor
+    logger.info(
+        "Running %s %s workers on %s (%s)",
+        args.workers,
+        args.mode,
+        args.project,
+        ", ".join(f"{op}={w:g}" for op, w in args.mix.items()),
+    )
+    with executor_class(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(
+                run_worker,
+                args.project,
+                i,
+                args.types,
+                args.mix,
+                args.duration,
+                args.ops,
+                args.seed,
+            )
+            for i in range(args.workers)
+        ]
+        results = [f.result() for f in futures]
+
+    report = build_report(results, args.workers, args.mode)
+    logger.info(
+        "%s operations in %.1fs: %.1f ops/s",
+        report["operations_total"],
+        report["elapsed_s"],
+        report["ops_per_s"],
+    )
+    for op, stats in report["operations"].items():
+        latency = stats["latency_s"]
+        logger.info(
+            "  %-7s %7.1f ops/s  p50 %.4fs  p95 %.4fs  max %.4fs  (%s failed)",
+            op,
+            stats["ops_per_s"],
+            latency["p50"],
+            latency["p95"],
+            latency["max"],
+            stats["failed"],
+        )
+    for error, count in report["errors"].items():
+        logger.error("%s x %s", error, count)
+
+    if args.report is not None:
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+    if not args.keep:
+        wipe_project(project)
+
+
+if __name__ == "__main__":
+    main()
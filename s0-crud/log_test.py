@@ -7,27 +7,52 @@ Unit tests for the entity Artifact
 
 from __future__ import annotations
 
-import time
+import atexit
+import os
+import shutil
+import tempfile
 import typing
+from functools import cache, partial
 from pathlib import Path
 
 import digitalhub as dh
-import pandas as pd
-import polars as pl
+from croissant_files import validate as validate_croissant
+from fixture_cache import pandas_frame, polars_frame
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
 
+# Replace data/ with synthetic copies of this many rows, 0 keeps data/
+SCALED_ROWS = int(os.environ.get("LOG_TEST_ROWS", "0"))
+SCALED_FILES = int(os.environ.get("LOG_TEST_FILES", "1"))
+
+
+@cache
+def data_dir() -> Path:
+    """Return the directory holding sample.csv and croissant/metadata.json."""
+    if not SCALED_ROWS:
+        return Path(__file__).parent / "data"
+    from synthetic_data import write_fixtures
+
+    directory = Path(tempfile.mkdtemp(prefix="log-test-"))
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    return write_fixtures(directory, SCALED_ROWS, SCALED_FILES)
+
 
 class TestLogCRUD:
     def __init__(self, project: Project):
         self.project = project
-        self.path = str(Path(__file__).parent / "data" / "sample.csv")
-        self.dfpl = pl.read_csv(self.path)
-        self.dfpd = pd.read_csv(self.path)
-        self.cr_path = str(
-            Path(__file__).parent / "data" / "croissant" / "metadata.json"
-        )
+        self.path = str(data_dir() / "sample.csv")
+        self.cr_path = str(data_dir() / "croissant" / "metadata.json")
+
+    @property
+    def dfpl(self):
+        return polars_frame(self.path)
+
+    @property
+    def dfpd(self):
+        return pandas_frame(self.path)
 
     def test_log_methods(self):
         """Test all log methods for different entities."""
@@ -41,7 +66,7 @@ class TestLogCRUD:
         for list_fn, delete_fn in cleanup_steps:
             if any(entity.name == name for entity in list_fn()):
                 delete_fn(name, delete_all_versions=True, cascade=False)
-                time.sleep(2)
+                wait_until_absent(list_fn, name=name)
 
         # Log artifacts
         common_artifact_kwargs = {
@@ -55,7 +80,7 @@ class TestLogCRUD:
         self.project.log_artifact(name, **common_artifact_kwargs)
         assert len(dh.get_artifact_versions(name, project=self.project.name)) == 4
         self.project.delete_artifact(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, name=name)
 
         # Log generic artifacts
         dh.log_generic_artifact(
@@ -68,7 +93,7 @@ class TestLogCRUD:
         self.project.log_generic_artifact(name, "artifact", **common_artifact_kwargs)
         assert len(dh.get_artifact_versions(name, project=self.project.name)) == 4
         self.project.delete_artifact(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_artifacts, name=name)
 
         # Log dataitems
         common_dataitem_kwargs = {
@@ -83,6 +108,8 @@ class TestLogCRUD:
         dh.log_dataitem(
             self.project.name, name, source=self.path, **common_dataitem_kwargs
         )
+        # Footer-only check that the croissant files match the metadata
+        validate_croissant(self.cr_path)
         dh.log_croissant(
             self.project.name, name, source=self.cr_path, **common_dataitem_kwargs
         )
@@ -93,7 +120,7 @@ class TestLogCRUD:
         self.project.log_croissant(name, source=self.cr_path, **common_dataitem_kwargs)
         assert len(dh.get_dataitem_versions(name, project=self.project.name)) == 10
         self.project.delete_dataitem(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, name=name)
 
         # Log generic dataitems
         dh.log_generic_dataitem(
@@ -124,7 +151,7 @@ class TestLogCRUD:
         )
         assert len(dh.get_dataitem_versions(name, project=self.project.name)) == 4
         self.project.delete_dataitem(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_dataitems, name=name)
 
         # Log models
         common_model_kwargs = {
@@ -144,7 +171,7 @@ class TestLogCRUD:
         self.project.log_model(name, **common_model_kwargs)
         assert len(dh.get_model_versions(name, project=self.project.name)) == 16
         self.project.delete_model(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, name=name)
 
         # Log generic models
         dh.log_generic_model(self.project.name, name, "model", **common_model_kwargs)
@@ -153,7 +180,7 @@ class TestLogCRUD:
         self.project.log_generic_model(name, "model", **common_model_kwargs)
         assert len(dh.get_model_versions(name, project=self.project.name)) == 4
         self.project.delete_model(name, delete_all_versions=True, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, name=name)
 
     def test_drop_existing(self):
         """Test overwrite functionality for log methods."""
@@ -236,4 +263,6 @@ class TestLogCRUD:
                 log_fn(name, source=self.path, drop_existing=True)
             assert len(get_versions_fn(name, project=self.project.name)) == 1
             delete_fn(name, delete_all_versions=True, cascade=False)
-            time.sleep(2)
+            wait_until_absent(
+                partial(get_versions_fn, name, project=self.project.name)
+            )
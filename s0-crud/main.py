@@ -2,66 +2,330 @@
 Main test runner for CRUD tests.
 """
 
+import argparse
 import os
 import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
-import digitalhub as dh
-from registry import TEST_CLASSES
-
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+from async_runner import DEFAULT_MAX_IN_FLIGHT, run_concurrently
+from cassette import install_from_env
+from fake_core import FakeCore
+from fault_profiles import PROFILES, load_profile
 from logging_utils import configure_logging
+from project_pool import ProjectPool
+from registry import REQUIRES_STORAGE, TEST_CLASSES, load_test_class, test_methods
+from report import write_json, write_junit
+from sharding import keyword_matcher, load_durations, select_tests
+from waiter import waited_time
 
 PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
 logger = configure_logging(__name__)
 
 
-def run_test_class(test_class, class_name, project):
-    """Run all test methods in a test class."""
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the DigitalHub CRUD tests.")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of test classes to run concurrently. With more than one "
+            "worker each class leases its own project from a pool of "
+            "PROJECT_NAME-<n> projects."
+        ),
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help=(
+            "Drive test classes and their per-item loops concurrently on an "
+            "asyncio event loop (uses --workers projects)."
+        ),
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Maximum concurrent per-item SDK calls in --async mode.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Number of times each test method is executed.",
+    )
+    parser.add_argument(
+        "--report-json", type=Path, help="Write a JSON latency report here."
+    )
+    parser.add_argument(
+        "--report-junit", type=Path, help="Write a JUnit XML report here."
+    )
+    parser.add_argument(
+        "-k",
+        dest="keyword",
+        help=(
+            "Only run tests whose <class>.<method> id matches the expression, "
+            'e.g. "artifact and not versions".'
+        ),
+    )
+    parser.add_argument(
+        "--shard-index", type=int, default=0, help="Index of the shard to run."
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="Total number of shards; each shard runs in its own projects.",
+    )
+    parser.add_argument(
+        "--fake-core",
+        action="store_true",
+        help=(
+            "Run against an in-process fake Core instead of DHCORE_ENDPOINT. "
+            "Tests that need object storage are skipped."
+        ),
+    )
+    parser.add_argument(
+        "--fake-core-profile",
+        metavar="PROFILE",
+        help=(
+            "Latency/fault profile of the fake Core, implies --fake-core: one "
+            f"of {', '.join(PROFILES)} or a JSON file."
+        ),
+    )
+    parser.add_argument(
+        "--durations",
+        type=Path,
+        help="JSON report of a previous run used to balance shards by duration.",
+    )
+    args = parser.parse_args(argv)
+    if args.shard_count < 1 or not 0 <= args.shard_index < args.shard_count:
+        parser.error("--shard-index must be in [0, --shard-count)")
+    if args.fake_core_profile is not None:
+        try:
+            args.fake_core_profile = load_profile(args.fake_core_profile)
+        except ValueError as e:
+            parser.error(str(e))
+        args.fake_core = True
+    if args.keyword:
+        try:
+            keyword_matcher(args.keyword)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+
+def run_test_method(instance, class_name, method_name, repeat=0):
+    """Run a single test method and return its timing record."""
+    logger.info("  ▶ %s.%s...", class_name, method_name)
+    error = None
+    waited = waited_time()
+    start = time.monotonic()
+    try:
+        getattr(instance, method_name)()
+    except Exception:
+        logger.exception("✗ FAILED %s.%s", class_name, method_name)
+        error = traceback.format_exc()
+    duration = time.monotonic() - start
+    # Waits of concurrent item calls overlap, their sum can exceed the duration
+    waited = min(waited_time() - waited, duration)
+    return {
+        "class": class_name,
+        "method": method_name,
+        "repeat": repeat,
+        "passed": error is None,
+        "error": error,
+        "duration_s": round(duration, 4),
+        "sdk_s": round(duration - waited, 4),
+        "wait_s": round(waited, 4),
+    }
+
+
+def run_test_class(test_class, class_name, project, test_methods, repeat=1):
+    """Run the given test methods of a test class and return their records."""
     logger.info("Running %s", class_name)
 
     instance = test_class(project)
-    test_methods = [m for m in dir(instance) if m.startswith("test_")]
 
-    passed = 0
-    failed = 0
+    records = [
+        run_test_method(instance, class_name, method_name, i)
+        for i in range(repeat)
+        for method_name in test_methods
+    ]
+
+    passed = sum(r["passed"] for r in records)
+    failed = len(records) - passed
+    logger.info("  %s results: %s passed, %s failed", class_name, passed, failed)
+    return records
+
+
+def failure_record(class_name, error):
+    """Return the record of a test class that could not be run at all."""
+    return {
+        "class": class_name,
+        "method": "setup",
+        "repeat": 0,
+        "passed": False,
+        "error": error,
+        "duration_s": 0.0,
+        "sdk_s": 0.0,
+        "wait_s": 0.0,
+    }
 
-    for method_name in test_methods:
-        try:
-            logger.info("  ▶ %s...", method_name)
-            getattr(instance, method_name)()
-            passed += 1
-        except Exception:
-            logger.exception("✗ FAILED")
-            failed += 1
 
-    logger.info("  Results: %s passed, %s failed", passed, failed)
-    return passed, failed
+def run_isolated(pool, test_class, class_name, test_methods, repeat=1):
+    """Run a test class against a clean project leased from the pool."""
+    with pool.lease() as project:
+        return run_test_class(test_class, class_name, project, test_methods, repeat)
 
 
-def main():
+def project_names(workers=None, shard_index=0, shard_count=1):
+    """
+    Return the names of the pool projects: PROJECT_NAME alone without
+    workers, one per worker otherwise. With several shards the shard index
+    is added, so shards running at once never share a project.
+    """
+    prefix = PROJECT_NAME if shard_count == 1 else f"{PROJECT_NAME}-s{shard_index}"
+    if workers is None:
+        return [prefix]
+    return [f"{prefix}-{i}" for i in range(workers)]
+
+
+def run_sequential(plan, repeat=1, shard_index=0, shard_count=1):
+    """Run every planned test class, one after the other, in one project."""
+    pool = ProjectPool(project_names(None, shard_index, shard_count))
+    pool.warm()
+    records = []
+    with pool.lease() as p:
+        for test_class, class_name, test_methods in plan:
+            records.extend(
+                run_test_class(test_class, class_name, p, test_methods, repeat)
+            )
+    return records
+
+
+def run_parallel(plan, workers, repeat=1, shard_index=0, shard_count=1):
+    """Run planned test classes concurrently, each in an isolated project."""
+    pool = ProjectPool(project_names(workers, shard_index, shard_count))
+    pool.warm()
+    records = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_isolated, pool, tc, cn, methods, repeat): cn
+            for tc, cn, methods in plan
+        }
+        for future in as_completed(futures):
+            try:
+                records.extend(future.result())
+            except Exception:
+                class_name = futures[future]
+                logger.exception("✗ FAILED to run %s", class_name)
+                records.append(failure_record(class_name, traceback.format_exc()))
+    return records
+
+
+def run_async(
+    plan,
+    workers,
+    repeat=1,
+    max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+    shard_index=0,
+    shard_count=1,
+):
+    """Run planned test classes under the asyncio runner."""
+    pool = ProjectPool(project_names(workers, shard_index, shard_count))
+    pool.warm()
+    calls = [
+        partial(run_isolated, pool, tc, cn, methods, repeat)
+        for tc, cn, methods in plan
+    ]
+    results = run_concurrently(calls, workers, max_in_flight)
+    records = []
+    for (_, class_name, _), result in zip(plan, results):
+        if isinstance(result, BaseException):
+            error = "".join(traceback.format_exception(result))
+            logger.error("✗ FAILED to run %s\n%s", class_name, error)
+            records.append(failure_record(class_name, error))
+        else:
+            records.extend(result)
+    return records
+
+
+def main(argv=None):
     """Run all CRUD tests."""
+    args = parse_args(argv)
     logger.info("DIGITALHUB SDK - CRUD TESTS")
+    install_from_env("s0-crud")
+
+    core = None
+    class_names = [class_name for _, class_name in TEST_CLASSES]
+    if args.fake_core:
+        # The SDK reads the endpoint when its client is first built
+        core = FakeCore(profile=args.fake_core_profile).start()
+        os.environ["DHCORE_ENDPOINT"] = core.endpoint
+        class_names = [n for n in class_names if n not in REQUIRES_STORAGE]
+        logger.info("Using fake Core at %s", core.endpoint)
 
-    dh.delete_project(PROJECT_NAME)
-    time.sleep(2)
-    p = dh.get_or_create_project(PROJECT_NAME)
-    p.share("*")
+    selection = select_tests(
+        [(class_name, test_methods(class_name)) for class_name in class_names],
+        keyword=args.keyword,
+        shard_index=args.shard_index,
+        shard_count=args.shard_count,
+        durations=load_durations(args.durations),
+    )
+    # Only the modules of selected classes are imported
+    plan = [
+        (load_test_class(class_name), class_name, methods)
+        for class_name, methods in selection
+    ]
+    logger.info(
+        "Selected %s tests in %s classes (shard %s/%s)",
+        sum(len(methods) for _, _, methods in plan),
+        len(plan),
+        args.shard_index + 1,
+        args.shard_count,
+    )
+
+    shard = {"shard_index": args.shard_index, "shard_count": args.shard_count}
+    if args.use_async:
+        records = run_async(
+            plan, args.workers, args.repeat, args.max_in_flight, **shard
+        )
+    elif args.workers > 1:
+        records = run_parallel(plan, args.workers, args.repeat, **shard)
+    else:
+        records = run_sequential(plan, args.repeat, **shard)
 
-    total_passed = 0
-    total_failed = 0
+    if args.report_json is not None:
+        write_json(records, args.report_json)
+        logger.info("JSON report written to %s", args.report_json)
+    if args.report_junit is not None:
+        write_junit(records, args.report_junit)
+        logger.info("JUnit report written to %s", args.report_junit)
 
-    for test_class, class_name in TEST_CLASSES:
-        passed, failed = run_test_class(test_class, class_name, p)
-        total_passed += passed
-        total_failed += failed
+    total_passed = sum(r["passed"] for r in records)
+    total_failed = len(records) - total_passed
 
     # Final summary
     logger.info("FINAL SUMMARY")
     logger.info("Total tests: %s", total_passed + total_failed)
     logger.info("Passed: %s", total_passed)
     logger.info("Failed: %s", total_failed)
+    if core is not None:
+        stats = core.stats
+        logger.info(
+            "Fake Core: %s requests, %s injected errors, %.1fs injected latency",
+            stats["requests"],
+            stats["injected_errors"],
+            stats["injected_latency_s"],
+        )
 
     if total_failed > 0:
         sys.exit(1)
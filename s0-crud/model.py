@@ -7,12 +7,13 @@ Unit tests for the entity Models
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.model._base.entity import Model
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -41,26 +42,28 @@ class TestModelCRUD:
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
-        for i in MODEL_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             d = dh.new_model(self.project.name, **i)
             assert isinstance(d, Model)
             assert d.name == i["name"]
             assert d.kind == i["kind"]
             dh.delete_model(d.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_models, entity_id=d.id)
 
             # Test module-level create + delete by name and id
             d = dh.new_model(self.project.name, **i)
             dh.delete_model(
                 d.name, project=self.project.name, entity_id=d.id, cascade=False
             )
-            time.sleep(2)
+            wait_until_absent(self.project.list_models, entity_id=d.id)
 
             # Test project-level create + delete
             d = self.project.new_model(**i)
             self.project.delete_model(d.key, cascade=False)
-            time.sleep(2)
+            wait_until_absent(self.project.list_models, entity_id=d.id)
+
+        map_items(_create_and_delete, MODEL_DICTS)
 
         assert dh.list_models(self.project.name) == []
 
@@ -69,8 +72,7 @@ class TestModelCRUD:
 
         assert dh.list_models(self.project.name) == []
 
-        for i in MODEL_DICTS:
-            dh.new_model(self.project.name, **i)
+        map_items(lambda i: dh.new_model(self.project.name, **i), MODEL_DICTS)
 
         l_obj = dh.list_models(self.project.name)
         assert isinstance(l_obj, list)
@@ -78,21 +80,23 @@ class TestModelCRUD:
         for i in l_obj:
             assert isinstance(i, Model)
 
-        for obj in l_obj:
-            dh.delete_model(
+        map_items(
+            lambda obj: dh.delete_model(
                 obj.name,
                 project=self.project.name,
                 delete_all_versions=True,
                 cascade=False,
-            )
-            time.sleep(2)
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_models)
 
         assert len(dh.list_models(self.project.name)) == 0
 
     def test_get(self):
         """Test getting models by different identifiers."""
 
-        for i in MODEL_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_model(self.project.name, **i)
             assert isinstance(o1, Model)
 
@@ -106,10 +110,11 @@ class TestModelCRUD:
             assert isinstance(o3, Model)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, MODEL_DICTS)
+
         l_obj = dh.list_models(self.project.name)
-        for obj in l_obj:
-            dh.delete_model(obj.key, cascade=False)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_model(obj.key, cascade=False), l_obj)
+        wait_until_absent(self.project.list_models)
 
         assert len(dh.list_models(self.project.name)) == 0
 
@@ -138,7 +143,7 @@ class TestModelCRUD:
 
         # Cleanup
         dh.delete_model(mdl.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, entity_id=mdl.id)
 
     def test_versions(self):
         """Test versioning functionality."""
@@ -173,7 +178,7 @@ class TestModelCRUD:
             delete_all_versions=True,
             cascade=False,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, name=name)
         assert len(dh.list_models(self.project.name)) == 0
 
     def test_import_export(self):
@@ -193,7 +198,7 @@ class TestModelCRUD:
         assert Path(export_path).exists()
 
         dh.delete_model(mdl.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, entity_id=mdl.id)
         assert len(dh.list_models(self.project.name)) == 0
 
         imported = dh.import_model(file=export_path)
@@ -203,7 +208,7 @@ class TestModelCRUD:
         assert imported.metadata.description == description
 
         dh.delete_model(imported.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -226,5 +231,5 @@ class TestModelCRUD:
         assert updated.metadata.description == description
 
         self.project.delete_model(mdl.key, cascade=False)
-        time.sleep(2)
+        wait_until_absent(self.project.list_models, entity_id=mdl.id)
         assert len(self.project.list_models()) == 0
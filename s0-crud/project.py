@@ -7,11 +7,11 @@ Unit tests for the entity Project
 
 from __future__ import annotations
 
-import time
 from pathlib import Path
 
 import digitalhub as dh
 from digitalhub.entities.project._base.entity import Project
+from waiter import wait_until_absent
 
 PROJECT_DICTS = [
     {
@@ -66,7 +66,7 @@ class TestProjectCRUD:
         for project_name in ("test-project-1", "test-project-2", "test-project-3"):
             if project_name in existing_projects:
                 dh.delete_project(project_name)
-                time.sleep(2)
+                wait_until_absent(dh.list_projects, name=project_name)
 
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
@@ -78,7 +78,7 @@ class TestProjectCRUD:
             assert isinstance(p, Project)
             assert p.name == i["name"]
             dh.delete_project(p.name)
-            time.sleep(2)
+            wait_until_absent(dh.list_projects, name=p.name)
 
             # Test get_or_create
             p = dh.get_or_create_project(**i)
@@ -86,7 +86,7 @@ class TestProjectCRUD:
             assert isinstance(p, Project)
             assert p.name == i["name"]
             dh.delete_project(p.name)
-            time.sleep(2)
+            wait_until_absent(dh.list_projects, name=p.name)
 
     def test_get_list(self):
         """Test get and list operations."""
@@ -107,7 +107,8 @@ class TestProjectCRUD:
         # Cleanup
         for proj in projects:
             dh.delete_project(proj.name)
-            time.sleep(2)
+        for proj in projects:
+            wait_until_absent(dh.list_projects, name=proj.name)
 
     def test_update_refresh(self):
         """Test update and refresh operations."""
@@ -140,7 +141,7 @@ class TestProjectCRUD:
 
         # Cleanup
         dh.delete_project(p.name)
-        time.sleep(2)
+        wait_until_absent(dh.list_projects, name=p.name)
 
     def test_export_import(self):
         """Test export and import operations."""
@@ -159,7 +160,7 @@ class TestProjectCRUD:
 
         # Delete project
         dh.delete_project(p.name)
-        time.sleep(2)
+        wait_until_absent(dh.list_projects, name=p.name)
 
         # Import project back
         p2 = dh.import_project(export_path, reset_id=False)
@@ -177,7 +178,7 @@ class TestProjectCRUD:
 
         # Cleanup
         dh.delete_project(p2.name)
-        time.sleep(2)
+        wait_until_absent(dh.list_projects, name=p2.name)
         Path(export_path).unlink(missing_ok=True)
 
     def test_load(self):
@@ -204,5 +205,5 @@ class TestProjectCRUD:
 
         # Cleanup
         dh.delete_project(p.name)
-        time.sleep(2)
+        wait_until_absent(dh.list_projects, name=p.name)
         Path(export_path).unlink(missing_ok=True)
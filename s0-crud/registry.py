@@ -1,27 +1,56 @@
-from artifact import TestArtifactCRUD
-from containerimage import TestContainerimageCRUD
-from dataitem import TestDataitemCRUD
-from function import TestFunctionCRUD
-from log_test import TestLogCRUD
-from model import TestModelCRUD
-from project import TestProjectCRUD
-from run import TestRunCRUD
-from secret import TestSecretCRUD
-from task import TestTaskCRUD
-from trigger import TestTriggerCRUD
-from workflow import TestWorkflowCRUD
+"""
+Registry of the CRUD test classes.
 
+Test modules are not imported here: test methods are discovered by
+parsing the module sources, and a module is only imported, together with
+digitalhub and any dataframe library it needs, when one of its tests is
+selected to run.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import importlib
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# (module, class name) in execution order
 TEST_CLASSES = [
-    (TestProjectCRUD, "TestProjectCRUD"),
-    (TestArtifactCRUD, "TestArtifactCRUD"),
-    (TestDataitemCRUD, "TestDataitemCRUD"),
-    (TestContainerimageCRUD, "TestContainerimageCRUD"),
-    (TestModelCRUD, "TestModelCRUD"),
-    (TestSecretCRUD, "TestSecretCRUD"),
-    (TestFunctionCRUD, "TestFunctionCRUD"),
-    (TestRunCRUD, "TestRunCRUD"),
-    (TestTaskCRUD, "TestTaskCRUD"),
-    (TestWorkflowCRUD, "TestWorkflowCRUD"),
-    (TestTriggerCRUD, "TestTriggerCRUD"),
-    (TestLogCRUD, "TestLogCRUD"),
+    ("project", "TestProjectCRUD"),
+    ("artifact", "TestArtifactCRUD"),
+    ("dataitem", "TestDataitemCRUD"),
+    ("containerimage", "TestContainerimageCRUD"),
+    ("model", "TestModelCRUD"),
+    ("secret", "TestSecretCRUD"),
+    ("function", "TestFunctionCRUD"),
+    ("run", "TestRunCRUD"),
+    ("task", "TestTaskCRUD"),
+    ("workflow", "TestWorkflowCRUD"),
+    ("trigger", "TestTriggerCRUD"),
+    ("log_test", "TestLogCRUD"),
 ]
+_MODULES = {class_name: module for module, class_name in TEST_CLASSES}
+
+# Test classes that upload files and cannot run against the fake Core
+REQUIRES_STORAGE = {"TestLogCRUD"}
+
+
+@functools.cache
+def test_methods(class_name: str) -> list[str]:
+    """Return the sorted test method names of a class without importing it."""
+    source = (BASE_DIR / f"{_MODULES[class_name]}.py").read_text()
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            return sorted(
+                item.name
+                for item in node.body
+                if isinstance(item, ast.FunctionDef) and item.name.startswith("test_")
+            )
+    raise LookupError(f"{class_name} not found in {_MODULES[class_name]}.py")
+
+
+def load_test_class(class_name: str) -> type:
+    """Import the module of a test class and return the class."""
+    return getattr(importlib.import_module(_MODULES[class_name]), class_name)
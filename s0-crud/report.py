@@ -0,0 +1,110 @@
+"""
+Latency report for the CRUD test runner.
+
+Each executed test method produces a record with its wall-clock duration
+split into time spent waiting for the backend (inside the waiter helpers)
+and the remaining time, spent in SDK calls and local checks. Records are
+aggregated per test and per class and written as JSON and JUnit XML.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import typing
+import xml.etree.ElementTree as ET
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+METRICS = ("duration_s", "sdk_s", "wait_s")
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of values, linearly interpolated."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: list[float]) -> dict:
+    """Return count, mean, p50, p95 and max of values."""
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4) if values else 0.0,
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "max": round(max(values), 4) if values else 0.0,
+    }
+
+
+def _aggregate(records: list[dict], key: typing.Callable[[dict], str]) -> dict:
+    groups: dict[str, list[dict]] = {}
+    for record in records:
+        groups.setdefault(key(record), []).append(record)
+    return {
+        name: {
+            "passed": sum(r["passed"] for r in group),
+            "failed": sum(not r["passed"] for r in group),
+            **{m: summarize([r[m] for r in group]) for m in METRICS},
+        }
+        for name, group in groups.items()
+    }
+
+
+def build_report(records: list[dict]) -> dict:
+    """Aggregate test records per test method and per class."""
+    return {
+        "tests": _aggregate(records, lambda r: f"{r['class']}.{r['method']}"),
+        "classes": _aggregate(records, lambda r: r["class"]),
+        "records": records,
+    }
+
+
+def write_json(records: list[dict], path: Path) -> None:
+    """Write the aggregated report as JSON."""
+    path.write_text(json.dumps(build_report(records), indent=2))
+
+
+def write_junit(records: list[dict], path: Path) -> None:
+    """Write the records as a JUnit XML document, one suite per class."""
+    root = ET.Element("testsuites")
+    suites: dict[str, ET.Element] = {}
+    for record in records:
+        suite = suites.get(record["class"])
+        if suite is None:
+            suite = ET.SubElement(root, "testsuite", name=record["class"])
+            suites[record["class"]] = suite
+        name = record["method"]
+        if record.get("repeat", 0):
+            name = f"{name}[{record['repeat']}]"
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=record["class"],
+            name=name,
+            time=f"{record['duration_s']:.3f}",
+        )
+        props = ET.SubElement(case, "properties")
+        for metric in ("sdk_s", "wait_s"):
+            ET.SubElement(
+                props, "property", name=metric, value=f"{record[metric]:.3f}"
+            )
+        if not record["passed"]:
+            failure = ET.SubElement(
+                case, "failure", message=record["error"].splitlines()[-1]
+            )
+            failure.text = record["error"]
+
+    for class_name, suite in suites.items():
+        group = [r for r in records if r["class"] == class_name]
+        suite.set("tests", str(len(group)))
+        suite.set("failures", str(sum(not r["passed"] for r in group)))
+        suite.set("time", f"{sum(r['duration_s'] for r in group):.3f}")
+
+    ET.indent(root)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
@@ -7,12 +7,14 @@ Unit tests for the entity Run
 
 from __future__ import annotations
 
-import time
 import typing
+from functools import partial
 from pathlib import Path
 
 import digitalhub as dh
+from cleanup import bulk_delete
 from digitalhub.entities.run._base.entity import Run
+from waiter import wait_until_absent, wait_until_state
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.function._base.entity import Function
@@ -25,15 +27,17 @@ RUN_DICTS = [
     }
 ]
 
+# States a run reaches once the backend has picked it up
+RUN_STARTED_STATES = ("BUILT", "READY", "RUNNING", "COMPLETED", "ERROR", "STOPPED")
+
 
 class TestRunCRUD:
     def __init__(self, project: Project):
         self.project = project
 
     def _cleanup_runs(self) -> None:
-        for obj in self.project.list_runs():
-            dh.delete_run(obj.key)
-            time.sleep(2)
+        keys = [obj.key for obj in self.project.list_runs()]
+        bulk_delete(dh.delete_run, keys, self.project.list_runs)
 
     def _get_function(self) -> Function:
         return dh.new_function(
@@ -57,21 +61,21 @@ class TestRunCRUD:
             run_dict["run_kind"] = f"python+{action}:run"
 
             r = task.run(**run_dict)
-            time.sleep(2)
+            wait_until_state(partial(dh.get_run, r.key), RUN_STARTED_STATES)
             assert isinstance(r, Run)
             assert r.kind == f"python+{action}:run"
             dh.delete_run(r.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_runs, entity_id=r.id)
 
             r = task.run(**RUN_DICTS[0])
-            time.sleep(2)
+            wait_until_state(partial(dh.get_run, r.key), RUN_STARTED_STATES)
             dh.delete_run(r.id, project=self.project.name, entity_id=r.id)
-            time.sleep(2)
+            wait_until_absent(self.project.list_runs, entity_id=r.id)
 
             f.delete_task(action=action)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_runs()
         assert dh.list_runs(self.project.name) == []
 
@@ -92,14 +96,14 @@ class TestRunCRUD:
         for i in l_obj:
             assert isinstance(i, Run)
 
-        time.sleep(2)
         for obj in l_obj:
+            wait_until_state(partial(dh.get_run, obj.key), RUN_STARTED_STATES)
             dh.delete_run(obj.key)
-            time.sleep(2)
+        wait_until_absent(self.project.list_runs)
 
         f.delete_task(action="job")
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_runs()
         assert len(dh.list_runs(self.project.name)) == 0
 
@@ -123,16 +127,16 @@ class TestRunCRUD:
 
         l_obj = dh.list_runs(self.project.name)
 
-        time.sleep(2)
         for obj in l_obj:
+            wait_until_state(partial(dh.get_run, obj.key), RUN_STARTED_STATES)
             dh.delete_run(obj.key)
-            time.sleep(2)
+        wait_until_absent(self.project.list_runs)
 
         f.delete_task(action="job")
-        time.sleep(2)
+        wait_until_absent(self.project.list_tasks, entity_id=task.id)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_runs()
         assert dh.list_runs(self.project.name) == []
 
@@ -144,7 +148,7 @@ class TestRunCRUD:
         assert dh.list_runs(self.project.name) == []
 
         run = task.run(**RUN_DICTS[0])
-        time.sleep(2)
+        wait_until_state(partial(dh.get_run, run.key), RUN_STARTED_STATES)
 
         description = "Test update"
         run.metadata.description = description
@@ -161,10 +165,10 @@ class TestRunCRUD:
         assert run.metadata.description == description
 
         dh.delete_run(run.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_runs, entity_id=run.id)
         f.delete_task(action="job")
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_runs()
 
     def test_import_load(self):
@@ -174,13 +178,13 @@ class TestRunCRUD:
         task = f.new_task(action="job")
 
         run = task.run(**RUN_DICTS[0])
-        time.sleep(2)
+        wait_until_state(partial(dh.get_run, run.key), RUN_STARTED_STATES)
 
         export_path = run.export()
         assert Path(export_path).exists()
 
         dh.delete_run(run.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_runs, entity_id=run.id)
         assert len(dh.list_runs(self.project.name)) == 0
 
         imported = dh.import_run(file=export_path)
@@ -192,10 +196,10 @@ class TestRunCRUD:
         assert loaded.kind == "python+job:run"
 
         dh.delete_run(loaded.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_runs, entity_id=loaded.id)
         self._cleanup_runs()
         Path(export_path).unlink()
 
         f.delete_task(action="job")
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
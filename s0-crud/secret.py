@@ -7,12 +7,13 @@ Unit tests for the entity Secret
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.secret._base.entity import Secret
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -32,36 +33,38 @@ class TestSecretCRUD:
             for secret in self.project.list_secrets():
                 if secret.name == i["name"]:
                     dh.delete_secret(secret.key)
-                    time.sleep(2)
+                    wait_until_absent(self.project.list_secrets, entity_id=secret.id)
 
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
-        for i in SECRET_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             s = dh.new_secret(self.project.name, **i)
             assert isinstance(s, Secret)
             assert s.name == i["name"]
             assert s.read_secret_value() == i["secret_value"]
             dh.delete_secret(s.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_secrets, entity_id=s.id)
 
             # Test module-level create + delete by name and id
             s = dh.new_secret(self.project.name, **i)
             dh.delete_secret(s.name, project=self.project.name, entity_id=s.id)
-            time.sleep(2)
+            wait_until_absent(self.project.list_secrets, entity_id=s.id)
 
             # Test project-level create + delete
             s = self.project.new_secret(**i)
             self.project.delete_secret(s.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_secrets, entity_id=s.id)
+
+        map_items(_create_and_delete, SECRET_DICTS)
 
         assert dh.list_secrets(self.project.name) == []
 
     def test_get(self):
         """Test getting secrets by different identifiers."""
 
-        for i in SECRET_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_secret(self.project.name, **i)
             assert isinstance(o1, Secret)
 
@@ -76,7 +79,9 @@ class TestSecretCRUD:
             assert o1.id == o3.id
 
             dh.delete_secret(o1.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_secrets, entity_id=o1.id)
+
+        map_items(_create_and_get, SECRET_DICTS)
 
     def test_update_refresh(self):
         """Test update and refresh operations."""
@@ -103,7 +108,7 @@ class TestSecretCRUD:
 
         # Cleanup
         dh.delete_secret(secret.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_secrets, entity_id=secret.id)
 
     def test_import_export(self):
         """Test import/export functionality."""
@@ -121,7 +126,7 @@ class TestSecretCRUD:
         assert Path(export_path).exists()
 
         dh.delete_secret(secret.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_secrets, entity_id=secret.id)
 
         imported = dh.import_secret(file=export_path)
         assert isinstance(imported, Secret)
@@ -130,7 +135,7 @@ class TestSecretCRUD:
         assert imported.metadata.description == description
 
         dh.delete_secret(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_secrets, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -149,7 +154,7 @@ class TestSecretCRUD:
         assert updated.metadata.description == description
 
         self.project.delete_secret(secret.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_secrets, entity_id=secret.id)
 
     def test_secret_value_operations(self):
         """Test secret value read/write operations."""
@@ -169,4 +174,4 @@ class TestSecretCRUD:
         assert value == new_value
 
         dh.delete_secret(secret.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_secrets, entity_id=secret.id)
@@ -0,0 +1,131 @@
+"""
+Test selection and deterministic sharding for the CRUD runner.
+
+Test methods are identified as "<class>.<method>". A -k expression selects
+a subset of them, and the selection is split into shards balanced by the
+historical durations found in a previous JSON report. Every node that uses
+the same inputs computes the same assignment.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import statistics
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+DEFAULT_DURATION = 1.0
+_OPERATORS = {"and", "or", "not", "(", ")"}
+
+
+def collect_tests(test_classes: list[tuple[str, list[str]]]) -> list[str]:
+    """Return the ids of every test method of the given (class, methods)."""
+    return [
+        f"{class_name}.{method}"
+        for class_name, methods in test_classes
+        for method in methods
+    ]
+
+
+def keyword_matcher(expression: str) -> Callable[[str], bool]:
+    """
+    Compile a -k expression into a predicate over test ids.
+
+    Words match case-insensitive substrings of the id and can be combined
+    with and, or, not and parentheses, e.g. "artifact and not versions".
+    Raise ValueError if the expression is malformed.
+    """
+    parts = []
+    previous = None
+    for token in re.findall(r"\(|\)|[^\s()]+", expression):
+        operand = token not in _OPERATORS
+        # Juxtaposed terms, e.g. "a b" or "(a) b", would compile to a call
+        if (operand or token in ("(", "not")) and previous in ("operand", ")"):
+            raise ValueError(
+                f"Invalid -k expression: {expression!r}, missing operator "
+                f"before {token!r}"
+            )
+        if operand:
+            parts.append(f"({token.lower()!r} in test_id)")
+        else:
+            parts.append(token)
+        previous = "operand" if operand else token
+    try:
+        code = compile(" ".join(parts) or "True", "<-k>", "eval")
+        # Surface any remaining evaluation error here rather than mid-selection
+        eval(code, {"__builtins__": {}}, {"test_id": ""})
+    except Exception as e:
+        raise ValueError(f"Invalid -k expression: {expression!r}") from e
+    return lambda test_id: bool(
+        eval(code, {"__builtins__": {}}, {"test_id": test_id.lower()})
+    )
+
+
+def load_durations(path: Path | None) -> dict[str, float]:
+    """
+    Read mean durations per test id from a JSON report written by
+    report.write_json. Return an empty mapping if there is no report.
+    """
+    if path is None or not path.exists():
+        return {}
+    tests = json.loads(path.read_text()).get("tests", {})
+    return {test_id: stats["duration_s"]["mean"] for test_id, stats in tests.items()}
+
+
+def assign_shards(
+    test_ids: list[str],
+    shard_count: int,
+    durations: dict[str, float],
+) -> list[list[str]]:
+    """
+    Split test ids into shard_count shards of similar expected duration.
+
+    Uses the longest-processing-time-first heuristic: tests are sorted by
+    decreasing duration (ties broken by id) and each one goes to the
+    currently lightest shard (ties broken by shard index). Tests without
+    history are assumed to take the median known duration.
+    """
+    known = [durations[t] for t in test_ids if t in durations]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+    expected = {t: durations.get(t, default) for t in test_ids}
+
+    shards: list[list[str]] = [[] for _ in range(shard_count)]
+    loads = [0.0] * shard_count
+    for test_id in sorted(test_ids, key=lambda t: (-expected[t], t)):
+        index = min(range(shard_count), key=lambda i: (loads[i], i))
+        shards[index].append(test_id)
+        loads[index] += expected[test_id]
+    return shards
+
+
+def select_tests(
+    test_classes: list[tuple[str, list[str]]],
+    keyword: str | None = None,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    durations: dict[str, float] | None = None,
+) -> list[tuple[str, list[str]]]:
+    """
+    Return (class_name, methods) for the tests selected by the keyword
+    expression and belonging to the given shard, in registry order.
+    """
+    test_ids = collect_tests(test_classes)
+    if keyword:
+        matcher = keyword_matcher(keyword)
+        test_ids = [t for t in test_ids if matcher(t)]
+    if shard_count > 1:
+        shards = assign_shards(test_ids, shard_count, durations or {})
+        in_shard = set(shards[shard_index])
+        test_ids = [t for t in test_ids if t in in_shard]
+
+    selected = set(test_ids)
+    plan = []
+    for class_name, methods in test_classes:
+        methods = [m for m in methods if f"{class_name}.{m}" in selected]
+        if methods:
+            plan.append((class_name, methods))
+    return plan
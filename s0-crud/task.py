@@ -7,11 +7,12 @@ Unit tests for the entity Task
 
 from __future__ import annotations
 
-import time
 import typing
 
 import digitalhub as dh
+from cleanup import bulk_delete
 from digitalhub.entities.task._base.entity import Task
+from waiter import wait_until_absent, wait_until_present
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.function._base.entity import Function
@@ -23,9 +24,8 @@ class TestTaskCRUD:
         self.project = project
 
     def _cleanup_tasks(self) -> None:
-        for obj in self.project.list_tasks():
-            dh.delete_task(obj.key)
-            time.sleep(2)
+        keys = [obj.key for obj in self.project.list_tasks()]
+        bulk_delete(dh.delete_task, keys, self.project.list_tasks)
 
     def _get_function(self) -> Function:
         return dh.new_function(
@@ -45,17 +45,17 @@ class TestTaskCRUD:
             assert isinstance(t, Task)
             assert t.kind == f"container+{action}"
             assert t.spec.function == f._get_executable_string()
-            time.sleep(2)
+            wait_until_present(self.project.list_tasks, entity_id=t.id)
             dh.delete_task(t.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_tasks, entity_id=t.id)
 
             t = f.new_task(action=action)
-            time.sleep(2)
+            wait_until_present(self.project.list_tasks, entity_id=t.id)
             dh.delete_task(t.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_tasks, entity_id=t.id)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_tasks()
         assert dh.list_tasks(self.project.name) == []
 
@@ -77,10 +77,10 @@ class TestTaskCRUD:
 
         for obj in l_obj:
             dh.delete_task(obj.key)
-            time.sleep(2)
+        wait_until_absent(self.project.list_tasks)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_tasks()
         assert dh.list_tasks(self.project.name) == []
 
@@ -104,9 +104,9 @@ class TestTaskCRUD:
         l_obj = dh.list_tasks(self.project.name)
         for obj in l_obj:
             dh.delete_task(obj.key)
-            time.sleep(2)
+        wait_until_absent(self.project.list_tasks)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         self._cleanup_tasks()
         assert dh.list_tasks(self.project.name) == []
@@ -7,12 +7,13 @@ Unit tests for the entity Trigger
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.trigger._base.entity import Trigger
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.function._base.entity import Function
@@ -49,7 +50,7 @@ class TestTriggerCRUD:
         for trigger in self.project.list_triggers():
             if trigger.name in names:
                 dh.delete_trigger(trigger.key)
-                time.sleep(2)
+                wait_until_absent(self.project.list_triggers, entity_id=trigger.id)
 
     def _get_function(self) -> Function:
         return dh.new_function(
@@ -66,7 +67,7 @@ class TestTriggerCRUD:
         f = self._get_function()
         task = f.new_task(action="job")
 
-        for i in TRIGGER_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             t = dh.new_trigger(
                 project=self.project.name,
@@ -78,7 +79,7 @@ class TestTriggerCRUD:
             assert t.name == i["name"]
             assert t.kind == i["kind"]
             dh.delete_trigger(t.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_triggers, entity_id=t.id)
 
             # Test module-level create + delete by name and id
             t = dh.new_trigger(
@@ -88,15 +89,17 @@ class TestTriggerCRUD:
                 **i,
             )
             dh.delete_trigger(t.name, project=self.project.name, entity_id=t.id)
-            time.sleep(2)
+            wait_until_absent(self.project.list_triggers, entity_id=t.id)
 
             # Test function-level create + delete
             t = f.trigger(action="job", **i)
             dh.delete_trigger(t.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_triggers, entity_id=t.id)
+
+        map_items(_create_and_delete, TRIGGER_DICTS)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         assert dh.list_triggers(self.project.name) == []
 
     def test_list(self):
@@ -120,12 +123,11 @@ class TestTriggerCRUD:
         for i in l_obj:
             assert isinstance(i, Trigger)
 
-        for obj in l_obj:
-            dh.delete_trigger(obj.key)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_trigger(obj.key), l_obj)
+        wait_until_absent(self.project.list_triggers)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         assert len(dh.list_triggers(self.project.name)) == 0
 
     def test_get(self):
@@ -133,7 +135,7 @@ class TestTriggerCRUD:
         f = self._get_function()
         task = f.new_task(action="job")
 
-        for i in TRIGGER_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_trigger(
                 project=self.project.name,
                 task=task._get_task_string(),
@@ -152,13 +154,14 @@ class TestTriggerCRUD:
             assert isinstance(o3, Trigger)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, TRIGGER_DICTS)
+
         l_obj = dh.list_triggers(self.project.name)
-        for obj in l_obj:
-            dh.delete_trigger(obj.key)
-            time.sleep(2)
+        map_items(lambda obj: dh.delete_trigger(obj.key), l_obj)
+        wait_until_absent(self.project.list_triggers)
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
         assert dh.list_triggers(self.project.name) == []
 
     def test_update_refresh(self):
@@ -190,9 +193,9 @@ class TestTriggerCRUD:
 
         # Cleanup
         dh.delete_trigger(trigger.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_triggers, entity_id=trigger.id)
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
 
     def test_import_export(self):
         """Test import/export functionality."""
@@ -215,7 +218,7 @@ class TestTriggerCRUD:
         assert Path(export_path).exists()
 
         dh.delete_trigger(trigger.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_triggers, entity_id=trigger.id)
         assert len(dh.list_triggers(self.project.name)) == 0
 
         imported = dh.import_trigger(file=export_path)
@@ -225,8 +228,8 @@ class TestTriggerCRUD:
         assert imported.metadata.description == description
 
         dh.delete_trigger(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_triggers, entity_id=imported.id)
         Path(export_path).unlink()
 
         dh.delete_function(f.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_functions, entity_id=f.id)
@@ -7,12 +7,13 @@ Unit tests for the entity Workflow
 
 from __future__ import annotations
 
-import time
 import typing
 from pathlib import Path
 
 import digitalhub as dh
+from async_runner import map_items
 from digitalhub.entities.workflow._base.entity import Workflow
+from waiter import wait_until_absent
 
 if typing.TYPE_CHECKING:
     from digitalhub.entities.project._base.entity import Project
@@ -43,24 +44,26 @@ class TestWorkflowCRUD:
     def test_create_delete(self):
         """Test creation and deletion via different methods."""
 
-        for i in WORKFLOW_DICTS:
+        def _create_and_delete(i):
             # Test module-level create + delete by key
             w = dh.new_workflow(self.project.name, **i)
             assert isinstance(w, Workflow)
             assert w.name == i["name"]
             assert w.kind == i["kind"]
             dh.delete_workflow(w.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_workflows, entity_id=w.id)
 
             # Test module-level create + delete by name and id
             w = dh.new_workflow(self.project.name, **i)
             dh.delete_workflow(w.name, project=self.project.name, entity_id=w.id)
-            time.sleep(2)
+            wait_until_absent(self.project.list_workflows, entity_id=w.id)
 
             # Test project-level create + delete
             w = self.project.new_workflow(**i)
             self.project.delete_workflow(w.key)
-            time.sleep(2)
+            wait_until_absent(self.project.list_workflows, entity_id=w.id)
+
+        map_items(_create_and_delete, WORKFLOW_DICTS)
 
         assert dh.list_workflows(self.project.name) == []
 
@@ -69,8 +72,7 @@ class TestWorkflowCRUD:
 
         assert dh.list_workflows(self.project.name) == []
 
-        for i in WORKFLOW_DICTS:
-            dh.new_workflow(self.project.name, **i)
+        map_items(lambda i: dh.new_workflow(self.project.name, **i), WORKFLOW_DICTS)
 
         l_obj = dh.list_workflows(self.project.name)
         assert isinstance(l_obj, list)
@@ -78,19 +80,22 @@ class TestWorkflowCRUD:
         for i in l_obj:
             assert isinstance(i, Workflow)
 
-        for obj in l_obj:
-            dh.delete_workflow(
-                obj.name, project=self.project.name, delete_all_versions=True
-            )
-            time.sleep(2)
-        time.sleep(2)
+        map_items(
+            lambda obj: dh.delete_workflow(
+                obj.name,
+                project=self.project.name,
+                delete_all_versions=True,
+            ),
+            l_obj,
+        )
+        wait_until_absent(self.project.list_workflows)
 
         assert len(dh.list_workflows(self.project.name)) == 0
 
     def test_get(self):
         """Test getting workflows by different identifiers."""
 
-        for i in WORKFLOW_DICTS:
+        def _create_and_get(i):
             o1 = dh.new_workflow(self.project.name, **i)
             assert isinstance(o1, Workflow)
 
@@ -104,13 +109,12 @@ class TestWorkflowCRUD:
             assert isinstance(o3, Workflow)
             assert o1.id == o3.id
 
+        map_items(_create_and_get, WORKFLOW_DICTS)
+
         l_obj = dh.list_workflows(self.project.name)
 
-        time.sleep(2)
-        for obj in l_obj:
-            dh.delete_workflow(obj.key)
-            time.sleep(2)
-        time.sleep(2)
+        map_items(lambda obj: dh.delete_workflow(obj.key), l_obj)
+        wait_until_absent(self.project.list_workflows)
 
         assert len(dh.list_workflows(self.project.name)) == 0
 
@@ -139,7 +143,7 @@ class TestWorkflowCRUD:
 
         # Cleanup
         dh.delete_workflow(wf.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_workflows, entity_id=wf.id)
 
     def test_versions(self):
         """Test versioning functionality."""
@@ -175,7 +179,7 @@ class TestWorkflowCRUD:
             project=self.project.name,
             delete_all_versions=True,
         )
-        time.sleep(2)
+        wait_until_absent(self.project.list_workflows, name=name)
         assert len(dh.list_workflows(self.project.name)) == 0
 
     def test_import_export(self):
@@ -195,7 +199,7 @@ class TestWorkflowCRUD:
         assert Path(export_path).exists()
 
         dh.delete_workflow(wf.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_workflows, entity_id=wf.id)
         assert len(dh.list_workflows(self.project.name)) == 0
 
         imported = dh.import_workflow(file=export_path)
@@ -205,7 +209,7 @@ class TestWorkflowCRUD:
         assert imported.metadata.description == description
 
         dh.delete_workflow(imported.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_workflows, entity_id=imported.id)
         Path(export_path).unlink()
 
     def test_project_integration(self):
@@ -228,5 +232,5 @@ class TestWorkflowCRUD:
         assert updated.metadata.description == description
 
         self.project.delete_workflow(wf.key)
-        time.sleep(2)
+        wait_until_absent(self.project.list_workflows, entity_id=wf.id)
         assert len(self.project.list_workflows()) == 0
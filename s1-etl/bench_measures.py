@@ -0,0 +1,142 @@
+"""
+Benchmark of the process_measures reshape on synthetic spire data.
+
+The wide sensor table (one row per sensor and day, 24 hourly columns) is
+turned into the long measures table (one row per sensor and hour) by the
+former loop, which copies a sub-frame per hourly slot and concatenates
+them, and by the vectorized measures_long used by process_measures now.
+For every size each path runs in a fresh process that builds the input
+and is timed, while its RSS is sampled from /proc, so the peak increase
+covers numpy, pandas and Arrow-backed string buffers alike.
+
+    python bench_measures.py --rows 10000,182500,1000000 --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.path.append(str(Path(__file__).resolve().parent / "src"))
+from bench_utils import RssSampler
+from functions import COLUMNS, KEYS, measures_long
+from logging_utils import configure_logging
+from synthetic_data import spire_columns
+
+# A year of readings from 500 sensors
+DEFAULT_ROWS = "10000,182500,1000000"
+logger = configure_logging(__name__)
+
+
+def measures_loop(df: pd.DataFrame) -> pd.DataFrame:
+    """The former process_measures: one copied sub-frame per hourly slot."""
+    rdf = df[COLUMNS + KEYS]
+    ls = []
+    for key in KEYS:
+        k = key.split("-")[0]
+        xdf = rdf[COLUMNS + [key]].copy()
+        xdf["time"] = xdf["data"] + " " + k
+        xdf["value"] = xdf[key]
+        ls.append(xdf[["time", "codice spira", "value"]])
+    return pd.concat(ls)
+
+
+PATHS = {"loop": measures_loop, "vectorized": measures_long}
+
+
+def run_case(
+    path: str, rows: int, seed: int, keep: bool
+) -> tuple[dict, pd.DataFrame | None]:
+    """
+    Reshape a synthetic table with a path and return its measurements, and
+    the result if keep is set. Runs in a worker process.
+    """
+    df = pd.DataFrame(spire_columns(rows, seed))
+    with RssSampler() as rss:
+        start = time.monotonic()
+        result = PATHS[path](df)
+        elapsed = max(time.monotonic() - start, 1e-9)
+    return {
+        "path": path,
+        "rows": len(df),
+        "elapsed_s": round(elapsed, 4),
+        "rows_per_s": round(len(df) / elapsed),
+        "output_rows_per_s": round(len(result) / elapsed),
+        "peak_rss_bytes": rss.peak,
+        "rss_increase_bytes": rss.peak - rss.baseline,
+        "output_bytes": int(result.memory_usage(deep=True).sum()),
+    }, (result if keep else None)
+
+
+def check(loop: pd.DataFrame, vectorized: pd.DataFrame) -> None:
+    """Check that both paths produce the same measures in the same order."""
+    expected = loop.reset_index(drop=True)
+    expected["time"] = pd.to_datetime(expected["time"])
+    pd.testing.assert_frame_equal(expected, vectorized, check_dtype=False)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark process_measures.")
+    parser.add_argument(
+        "--rows",
+        default=DEFAULT_ROWS,
+        help=f"Comma-separated input sizes (default: {DEFAULT_ROWS}).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed.")
+    parser.add_argument(
+        "--check", action="store_true", help="Check that both paths agree."
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    try:
+        args.rows = [int(r) for r in args.rows.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the process_measures benchmark."""
+    args = parse_args(argv)
+    context = multiprocessing.get_context("spawn")
+    records = []
+    for rows in args.rows:
+        results = {}
+        for path in PATHS:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                record, results[path] = executor.submit(
+                    run_case, path, rows, args.seed, args.check
+                ).result()
+            records.append(record)
+            logger.info(
+                "%-10s %9s rows: %.3fs, %.0f rows/s, peak RSS +%.0f MiB "
+                "(output %.0f MiB)",
+                path,
+                rows,
+                record["elapsed_s"],
+                record["rows_per_s"],
+                record["rss_increase_bytes"] / 2**20,
+                record["output_bytes"] / 2**20,
+            )
+        if args.check:
+            check(results["loop"], results["vectorized"])
+            logger.info("✓ %s rows: both paths agree", rows)
+        del results
+
+    if args.report is not None:
+        report = {"seed": args.seed, "records": records}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
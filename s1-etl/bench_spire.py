@@ -0,0 +1,138 @@
+"""
+Benchmark of the process_spire sensor metadata stage on synthetic data.
+
+A synthetic spire table is written to parquet, as the downloader output
+is, and the sensor metadata is extracted by the former path, which reads
+every column and groups the whole table by sensor, and by the current
+one, which reads the metadata columns only, stores repeated strings as
+categories and keeps the first row of each sensor. Each run happens in a
+fresh process that only reads the parquet file, and its RSS is sampled
+from /proc around the extraction, so the increase covers the Arrow
+buffers as well.
+
+    python bench_spire.py --rows 182500,1000000 --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+sys.path.append(str(Path(__file__).resolve().parent / "src"))
+from bench_utils import RssSampler
+from functions import CATEGORIES, COLS, spire_metadata
+from logging_utils import configure_logging
+from synthetic_data import spire_columns
+
+# A year of readings from 500 sensors
+DEFAULT_ROWS = "182500,1000000"
+logger = configure_logging(__name__)
+
+
+def spire_groupby(path: Path) -> pd.DataFrame:
+    """The former process_spire: full read and groupby first."""
+    df = pd.read_parquet(path)
+    return df.groupby(["codice spira"]).first().reset_index()[COLS]
+
+
+def spire_projected(path: Path) -> pd.DataFrame:
+    """The current process_spire on a parquet file."""
+    return spire_metadata(pd.read_parquet(path, columns=COLS))
+
+
+PATHS = {"groupby": spire_groupby, "projected": spire_projected}
+
+
+def run_case(path_name: str, source: Path) -> tuple[dict, pd.DataFrame]:
+    """Extract the metadata with a path. Runs in a worker process."""
+    with RssSampler() as rss:
+        start = time.monotonic()
+        result = PATHS[path_name](source)
+        elapsed = max(time.monotonic() - start, 1e-9)
+    return {
+        "path": path_name,
+        "elapsed_s": round(elapsed, 4),
+        "peak_rss_bytes": rss.peak,
+        "rss_increase_bytes": rss.peak - rss.baseline,
+        "sensors": len(result),
+    }, result
+
+
+def check(groupby: pd.DataFrame, projected: pd.DataFrame) -> None:
+    """Check that both paths extract the same sensors and metadata."""
+    expected = groupby.sort_values("codice spira", ignore_index=True)
+    actual = projected.astype({c: object for c in CATEGORIES}).sort_values(
+        "codice spira", ignore_index=True
+    )
+    # Strings are object or StringDtype depending on the pandas version
+    pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark process_spire.")
+    parser.add_argument(
+        "--rows",
+        default=DEFAULT_ROWS,
+        help=f"Comma-separated input sizes (default: {DEFAULT_ROWS}).",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed.")
+    parser.add_argument(
+        "--check", action="store_true", help="Check that both paths agree."
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    args = parser.parse_args(argv)
+    try:
+        args.rows = [int(r) for r in args.rows.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None) -> None:
+    """Run the process_spire benchmark."""
+    args = parse_args(argv)
+    context = multiprocessing.get_context("spawn")
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            source = Path(tmp) / f"spire-{rows}.parquet"
+            pd.DataFrame(spire_columns(rows, args.seed)).to_parquet(source)
+            results = {}
+            for path_name in PATHS:
+                with ProcessPoolExecutor(1, mp_context=context) as executor:
+                    record, results[path_name] = executor.submit(
+                        run_case, path_name, source
+                    ).result()
+                record["rows"] = rows
+                records.append(record)
+                logger.info(
+                    "%-9s %9s rows: %.3fs, %.0f rows/s, peak RSS +%.0f MiB",
+                    path_name,
+                    rows,
+                    record["elapsed_s"],
+                    rows / record["elapsed_s"],
+                    record["rss_increase_bytes"] / 2**20,
+                )
+            if args.check:
+                check(results["groupby"], results["projected"])
+                logger.info("✓ %s rows: both paths agree", rows)
+            source.unlink()
+
+    if args.report is not None:
+        report = {"seed": args.seed, "records": records}
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,18 +7,32 @@ import typing
 from pathlib import Path
 
 import digitalhub as dh
+import pyarrow as pa
 
 if typing.TYPE_CHECKING:
     from digitalhub_runtime_python.entities.run._base.entity import RunPythonRun
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+from cassette import install_from_env
 from logging_utils import configure_logging
+from project_pool import prepare_project
 
 p_name = os.environ.get("PROJECT_NAME", "digitalhub-tests")
 py_ver = "PYTHON3_10"
 BASE_DIR = (Path(__file__).parent).relative_to(Path.cwd())
 f_src = str(BASE_DIR / "src" / "functions.py")
 w_src = str(BASE_DIR / "src" / "pipeline.py")
+export_url = (
+    "https://opendata.comune.bologna.it/api/explore/v2.1/catalog/datasets/"
+    "rilevazione-flusso-veicoli-tramite-spire-anno-2023/exports/csv"
+)
+# SPIRE_LIMIT=-1 exports the whole year. The stream downloader writes it to
+# parquet in bounded memory, but the processing steps and the api still
+# load their whole input, so the bounded default is kept
+export_limit = os.environ.get("SPIRE_LIMIT", "10000")
+download_handler = {"stream": "stream_downloader", "memory": "downloader"}[
+    os.environ.get("SPIRE_DOWNLOAD", "stream")
+]
 logger = configure_logging(__name__)
 
 
@@ -26,10 +40,13 @@ def main() -> None:
     """
     Run a test pipeline.
     """
-    project = dh.get_or_create_project(p_name)
-    project.share("*")
+    install_from_env("s1-etl")
+    project = prepare_project(p_name)
 
-    url = "https://opendata.comune.bologna.it/api/explore/v2.1/catalog/datasets/rilevazione-flusso-veicoli-tramite-spire-anno-2023/exports/csv?limit=10000&lang=it&timezone=Europe%2FRome&use_labels=true&delimiter=%3B"
+    url = (
+        f"{export_url}?limit={export_limit}&lang=it&timezone=Europe%2FRome"
+        "&use_labels=true&delimiter=%3B"
+    )
     di = project.new_dataitem(
         name="url-data-item",
         kind="table",
@@ -40,7 +57,7 @@ def main() -> None:
         kind="python",
         python_version=py_ver,
         code_src=f_src,
-        handler="downloader",
+        handler=download_handler,
     )
     _ = project.new_function(
         name="process-spire",
@@ -85,8 +102,16 @@ def main() -> None:
     try:
         result = serve_run.invoke(url=svc_url)
         result.raise_for_status()
-        dh.delete_run(serve_run.key)
         logger.info("Request succeeded: %s", result.json())
+        result = serve_run.invoke(url=f"{svc_url}&format=arrow")
+        result.raise_for_status()
+        table = pa.ipc.open_stream(result.content).read_all()
+        dh.delete_run(serve_run.key)
+        logger.info(
+            "Arrow request succeeded: %s rows of %s",
+            table.num_rows,
+            ", ".join(table.column_names),
+        )
     except Exception:
         logger.exception("Request failed")
         if result is not None:
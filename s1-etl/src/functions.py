@@ -1,4 +1,17 @@
+import csv
+import json
+import os
+import tempfile
+import threading
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from digitalhub_runtime_python import handler
 
 COLS = [
@@ -44,6 +57,31 @@ KEYS = [
     "23:00-24:00",
 ]
 COLUMNS = ["data", "codice spira"]
+# Sensor metadata strings repeated on every row, kept as categories
+CATEGORIES = ["tipologia", "Nome via", "stato", "direzione"]
+# Column types of the streamed export. The streaming reader infers types
+# from the first block only, so every column the pipeline uses is pinned
+# to keep a later block from failing the cast; codes are identifiers. Any
+# other column of the export is read as a string, see stream_column_types
+STREAM_TYPES = {
+    **{key: pa.int64() for key in KEYS},
+    **{c: pa.string() for c in COLUMNS + CATEGORIES + ["geopoint"]},
+    **{c: pa.string() for c in ["codice", "codice arco", "codice via"]},
+    **{c: pa.float64() for c in ["longitudine", "latitudine", "angolo"]},
+    "Livello": pa.int64(),
+}
+STREAM_BLOCK_MB = 16
+# Start of each hourly slot, as an offset from midnight
+HOURS = np.array([int(key[:2]) for key in KEYS], dtype="timedelta64[h]")
+PAGE_CACHE_BYTES = int(os.environ.get("PAGE_CACHE_MB", "64")) * 2**20
+# Response formats of the mock REST api: JSON records (the default), JSON
+# with one array per column, or an Arrow IPC stream
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+MEDIA_TYPES = {
+    "records": "application/json",
+    "columns": "application/json",
+    "arrow": ARROW_STREAM,
+}
 
 
 @handler(outputs=["dataset"])
@@ -51,30 +89,147 @@ def downloader(url):
     return url.as_df(file_format="csv", sep=";")
 
 
+def stream_column_types(header):
+    # Every column named in the header line gets a type, so a sparse column
+    # that is empty in the first block is not inferred as null
+    names = next(csv.reader([header.decode("utf-8-sig")], delimiter=";"))
+    return names, {name: STREAM_TYPES.get(name, pa.string()) for name in names}
+
+
+@handler(outputs=["dataset"])
+def stream_downloader(project, url, block_mb=STREAM_BLOCK_MB):
+    # The export is parsed block by block on pyarrow's thread pool and each
+    # block is written as a parquet row group, so memory does not grow with
+    # the export size. The header line is read first to type every column
+    parse_options = pa_csv.ParseOptions(delimiter=";")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dataset.parquet"
+        with urllib.request.urlopen(url.spec.path) as response:
+            names, column_types = stream_column_types(response.readline())
+            read_options = pa_csv.ReadOptions(
+                column_names=names, block_size=block_mb * 2**20, use_threads=True
+            )
+            convert_options = pa_csv.ConvertOptions(column_types=column_types)
+            with (
+                pa_csv.open_csv(
+                    response,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                ) as reader,
+                pq.ParquetWriter(path, reader.schema) as writer,
+            ):
+                for batch in reader:
+                    writer.write_batch(batch)
+        return project.log_dataitem(name="dataset", kind="table", source=str(path))
+
+
 @handler(outputs=["dataset-spire"])
 def process_spire(di):
-    df = di.as_df()
-    return df.groupby(["codice spira"]).first().reset_index()[COLS]
+    return spire_metadata(di.as_df(columns=COLS))
+
+
+def spire_metadata(df):
+    # First row of every sensor, found by hashing the sensor code once
+    # instead of grouping every column
+    for column in CATEGORIES:
+        df[column] = df[column].astype("category")
+    first = ~df["codice spira"].duplicated()
+    return df.loc[first, COLS].reset_index(drop=True)
 
 
 @handler(outputs=["dataset-measures"])
 def process_measures(di):
-    df = di.as_df()
-    rdf = df[COLUMNS + KEYS]
-    ls = []
-    for key in KEYS:
-        k = key.split("-")[0]
-        xdf = rdf[COLUMNS + [key]].copy()
-        xdf["time"] = xdf["data"] + " " + k
-        xdf["value"] = xdf[key]
-        ls.append(xdf[["time", "codice spira", "value"]])
-    return pd.concat(ls)
+    return measures_long(di.as_df())
+
+
+def measures_long(df):
+    # One output block per hourly slot: each column is copied once into
+    # the result, the time is the day plus the slot offset. The sensor
+    # codes are concatenated as a Series so they keep their string storage
+    # instead of going through an object array
+    days = pd.to_datetime(df["data"]).to_numpy()
+    return pd.DataFrame(
+        {
+            "time": np.add.outer(HOURS, days).ravel(),
+            "codice spira": pd.concat(
+                [df["codice spira"]] * len(KEYS), ignore_index=True
+            ),
+            "value": np.concatenate([df[key].to_numpy() for key in KEYS]),
+        },
+        copy=False,
+    )
+
+
+class PageCache:
+    # Serialized response bodies keyed by (page, size, format), built on
+    # first request; least recently used pages are evicted past max_bytes
+    def __init__(self, df, max_bytes=PAGE_CACHE_BYTES):
+        self.df = df
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.pages = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, page, size, fmt="records"):
+        key = (page, size, fmt)
+        with self.lock:
+            body = self.pages.get(key)
+            if body is not None:
+                self.pages.move_to_end(key)
+                return body
+        body = self.render(page, size, fmt)
+        with self.lock:
+            if key not in self.pages:
+                self.pages[key] = body
+                self.bytes += len(body)
+                while self.bytes > self.max_bytes and len(self.pages) > 1:
+                    _, evicted = self.pages.popitem(last=False)
+                    self.bytes -= len(evicted)
+        return body
+
+    def render(self, page, size, fmt):
+        start = page * size
+        total = len(self.df)
+        ds = self.df.iloc[start : min(start + size, total)]
+        if fmt == "arrow":
+            # Page metadata travels in the schema and in the response headers
+            table = pa.Table.from_pandas(ds, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {"page": str(page), "size": str(size), "total": str(total)}
+            )
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().to_pybytes()
+        meta = f'"page": {page}, "size": {size}, "total": {total}'
+        if fmt == "columns":
+            columns = ", ".join(
+                f"{json.dumps(str(c))}: "
+                f'{ds[c].to_json(orient="records", date_format="iso")}'
+                for c in ds.columns
+            )
+            return f'{{"data": {{{columns}}}, {meta}}}'.encode()
+        data = ds.to_json(orient="records", date_format="iso")
+        return f'{{"data": {json.dumps(data)}, {meta}}}'.encode()
+
+
+def negotiate(event):
+    # An explicit format field wins over the Accept header
+    fmt = event.fields.get("format")
+    if fmt in MEDIA_TYPES:
+        return fmt
+    headers = {k.lower(): v for k, v in (event.headers or {}).items()}
+    if ARROW_STREAM in headers.get("accept", ""):
+        return "arrow"
+    return "records"
 
 
 def init_context(context, dataitem):
     di = context.project.get_dataitem(dataitem)
     df = di.as_df()
     context.df = df
+    context.pages = PageCache(df)
 
 
 def serve(context, event):
@@ -102,13 +257,13 @@ def serve(context, event):
 
     pageSize = min(pageSize, 100)
 
-    start = page * pageSize
-    end = start + pageSize
-    total = len(df)
-
-    end = min(end, total)
-
-    ds = df.iloc[start:end]
-    json = ds.to_json(orient="records")
-
-    return {"data": json, "page": page, "size": pageSize, "total": total}
+    fmt = negotiate(event)
+    body = context.pages.get(page, pageSize, fmt)
+    headers = {
+        "X-Page": str(page),
+        "X-Page-Size": str(pageSize),
+        "X-Total": str(len(df)),
+    }
+    return context.Response(
+        body=body, headers=headers, content_type=MEDIA_TYPES[fmt], status_code=200
+    )
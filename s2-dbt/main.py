@@ -1,7 +1,10 @@
 import os
+import sys
 from pathlib import Path
 
-import digitalhub as dh
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from cassette import install_from_env
+from project_pool import prepare_project
 
 p_name = os.environ.get("PROJECT_NAME", "digitalhub-tests")
 BASE_DIR = (Path(__file__).parent).relative_to(Path.cwd())
@@ -13,8 +16,8 @@ def main() -> None:
     """
     Run a test pipeline.
     """
-    project = dh.get_or_create_project(p_name)
-    project.share("*")
+    install_from_env("s2-dbt")
+    project = prepare_project(p_name)
 
     url = "https://gist.githubusercontent.com/kevin336/acbb2271e66c10a5b73aacf82ca82784/raw/e38afe62e088394d61ed30884dd50a6826eee0a8/employees.csv"
     di = project.new_dataitem(
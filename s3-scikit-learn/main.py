@@ -7,7 +7,6 @@ import typing
 from pathlib import Path
 
 import digitalhub as dh
-import numpy as np
 
 if typing.TYPE_CHECKING:
     from digitalhub_runtime_modelserve.entities.run.sklearnserve_run.entity import (
@@ -15,7 +14,9 @@ if typing.TYPE_CHECKING:
     )
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+from cassette import install_from_env
 from logging_utils import configure_logging
+from project_pool import prepare_project
 
 p_name = os.environ.get("PROJECT_NAME", "digitalhub-tests")
 BASE_DIR = (Path(__file__).parent).relative_to(Path.cwd())
@@ -28,8 +29,8 @@ def main() -> None:
     """
     Run a test pipeline.
     """
-    project = dh.get_or_create_project(p_name)
-    project.share("*")
+    install_from_env("s3-scikit-learn")
+    project = prepare_project(p_name)
 
     _ = project.new_function(
         name="prepare-data",
@@ -66,6 +67,8 @@ def main() -> None:
 
     time.sleep(45)  # wait for the service to be ready
 
+    import numpy as np
+
     data = np.random.rand(2, 30).tolist()
     json_payload = {
         "inputs": [
@@ -15,7 +15,9 @@ if typing.TYPE_CHECKING:
     )
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
+from cassette import install_from_env
 from logging_utils import configure_logging
+from project_pool import prepare_project
 
 p_name = os.environ.get("PROJECT_NAME", "digitalhub-tests")
 BASE_DIR = (Path(__file__).parent).relative_to(Path.cwd())
@@ -28,8 +30,8 @@ def main() -> None:
     """
     Run a test pipeline.
     """
-    project = dh.get_or_create_project(p_name)
-    project.share("*")
+    install_from_env("s4-mlflow")
+    project = prepare_project(p_name)
 
     train_fn = project.new_function(
         name="train-mlflow-model",
@@ -0,0 +1,196 @@
+"""
+Concurrent scheduler for the test scenarios.
+
+Launches the main.py of every scenario folder (s0-crud, s1-etl, ...) as a
+subprocess, each one against its own project, and aggregates the outcome
+into a single exit code and report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from logging_utils import configure_logging
+from project_pool import ProjectPool
+
+BASE_DIR = Path(__file__).resolve().parent
+PROJECT_NAME = os.environ.get("PROJECT_NAME", "digitalhub-tests")
+DEFAULT_PARALLELISM = int(os.environ.get("SCHEDULER_PARALLELISM", "0"))
+logger = configure_logging(__name__)
+_output_lock = threading.Lock()
+
+
+def discover_scenarios() -> list[str]:
+    """Return the scenario folders that contain a main.py, sorted by name."""
+    return sorted(
+        p.parent.name for p in BASE_DIR.glob("s*/main.py") if p.parent.is_dir()
+    )
+
+
+def run_scenario(folder: str, log_dir: Path | None = None) -> dict:
+    """
+    Run a scenario in a subprocess, streaming its output prefixed by the
+    folder name, and return a result record.
+    """
+    project_name = f"{PROJECT_NAME}-{folder}"
+    env = {**os.environ, "PROJECT_NAME": project_name, "PYTHONUNBUFFERED": "1"}
+    log_file = None
+    if log_dir is not None:
+        log_file = open(log_dir / f"{folder}.log", "w")
+
+    logger.info("▶ %s started (project %s)", folder, project_name)
+    start = time.monotonic()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, "main.py"],
+            cwd=BASE_DIR / folder,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in proc.stdout:
+            with _output_lock:
+                sys.stdout.write(f"[{folder}] {line}")
+                sys.stdout.flush()
+            if log_file is not None:
+                log_file.write(line)
+        returncode = proc.wait()
+    finally:
+        if log_file is not None:
+            log_file.close()
+    elapsed = time.monotonic() - start
+
+    return {
+        "scenario": folder,
+        "project": project_name,
+        "returncode": returncode,
+        "passed": returncode == 0,
+        "duration_s": round(elapsed, 3),
+    }
+
+
+def run_all(scenarios: list[str], parallelism: int, log_dir: Path | None) -> list:
+    """Run scenarios concurrently, at most parallelism at a time."""
+    results = []
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = {executor.submit(run_scenario, s, log_dir): s for s in scenarios}
+        for future in as_completed(futures):
+            folder = futures[future]
+            try:
+                result = future.result()
+            except Exception:
+                logger.exception("✗ %s could not be started", folder)
+                result = {
+                    "scenario": folder,
+                    "project": f"{PROJECT_NAME}-{folder}",
+                    "returncode": None,
+                    "passed": False,
+                    "duration_s": None,
+                }
+            results.append(result)
+            logger.info(
+                "%s %s finished in %ss (%s/%s done)",
+                "✓" if result["passed"] else "✗",
+                folder,
+                result["duration_s"],
+                len(results),
+                len(scenarios),
+            )
+    return sorted(results, key=lambda r: r["scenario"])
+
+
+def main(argv=None) -> None:
+    """Schedule the scenarios and exit with the aggregated status."""
+    parser = argparse.ArgumentParser(description="Run the test scenarios.")
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        help="Scenario folders to run (default: every s*/ folder with a main.py).",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLELISM,
+        help="Maximum number of scenarios running at once (default: all).",
+    )
+    parser.add_argument("--report", type=Path, help="Write a JSON report here.")
+    parser.add_argument(
+        "--no-warm",
+        action="store_true",
+        help="Do not pre-create and reset the scenario projects before starting.",
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        action="store_const",
+        const="record",
+        dest="cassette_mode",
+        help="Record the SDK HTTP traffic of each scenario into a cassette.",
+    )
+    cassette.add_argument(
+        "--replay",
+        action="store_const",
+        const="replay",
+        dest="cassette_mode",
+        help="Serve the SDK HTTP traffic from recorded cassettes (implies --no-warm).",
+    )
+    parser.add_argument(
+        "--log-dir", type=Path, help="Also write each scenario output to a file."
+    )
+    args = parser.parse_args(argv)
+
+    scenarios = args.scenarios or discover_scenarios()
+    missing = [s for s in scenarios if not (BASE_DIR / s / "main.py").is_file()]
+    if missing:
+        parser.error(f"no main.py found for: {', '.join(missing)}")
+    parallelism = args.parallel if args.parallel > 0 else len(scenarios)
+    if args.log_dir is not None:
+        args.log_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.cassette_mode is not None:
+        # Inherited by the scenario subprocesses, see cassette.install_from_env
+        os.environ["CASSETTE_MODE"] = args.cassette_mode
+
+    start = time.monotonic()
+    if not args.no_warm and args.cassette_mode != "replay":
+        ProjectPool([f"{PROJECT_NAME}-{s}" for s in scenarios]).warm()
+    logger.info("Running %s scenarios, %s at a time", len(scenarios), parallelism)
+    results = run_all(scenarios, parallelism, args.log_dir)
+    elapsed = time.monotonic() - start
+
+    failed = [r["scenario"] for r in results if not r["passed"]]
+    logger.info("FINAL SUMMARY")
+    for r in results:
+        mark = "✓" if r["passed"] else "✗"
+        logger.info("  %s %-20s %8ss", mark, r["scenario"], r["duration_s"])
+    logger.info("Wall-clock time: %.1fs", elapsed)
+
+    if args.report is not None:
+        report = {
+            "duration_s": round(elapsed, 3),
+            "parallelism": parallelism,
+            "passed": not failed,
+            "scenarios": results,
+        }
+        args.report.write_text(json.dumps(report, indent=2))
+        logger.info("Report written to %s", args.report)
+
+    if failed:
+        logger.info("Failed scenarios: %s", ", ".join(failed))
+        sys.exit(1)
+    logger.info("✓ All scenarios passed!")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""
+Deterministic synthetic tables shaped like s0-crud/data/sample.csv.
+
+Columns are id, name, age, city, salary and department, with values drawn
+from the same domains as the sample file. Every block of rows is generated
+from a random generator seeded with (seed, first row), so a table is
+reproducible and any part of it can be generated on its own.
+
+Tables shaped like the Bologna traffic sensor (spire) export read by
+s1-etl are generated the same way: one row per sensor and day, with the
+sensor metadata and 24 hourly vehicle counts.
+
+Tables are written to disk one chunk at a time, as CSV, as parquet with
+one row group per chunk, or as a croissant dataset whose records are
+spread over a set of parquet files. Only one chunk is held in memory, so
+memory use does not grow with the output size. Every parquet part of a
+croissant dataset is also listed as a FileObject with its checksum, since
+log_croissant only uploads FileObject distributions.
+
+    python synthetic_data.py csv /tmp/sample.csv --rows 10000000
+    python synthetic_data.py croissant /tmp/croissant --rows 100000000 --files 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import resource
+import time
+import typing
+from pathlib import Path
+
+import numpy as np
+
+from logging_utils import configure_logging
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import pyarrow as pa
+
+COLUMNS = ("id", "name", "age", "city", "salary", "department")
+NAMES = (
+    "Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry", "Ivy",
+    "Jack", "Kate", "Leo", "Mia", "Noah", "Olivia", "Paul", "Quinn", "Rose",
+    "Sam", "Tina",
+)  # fmt: skip
+CITIES = (
+    "Austin", "Boston", "Charlotte", "Chicago", "Columbus", "Dallas", "Denver",
+    "Fort Worth", "Houston", "Indianapolis", "Jacksonville", "Los Angeles",
+    "Nashville", "New York", "Philadelphia", "Phoenix", "San Antonio",
+    "San Diego", "San Jose", "Seattle",
+)  # fmt: skip
+DEPARTMENTS = ("Engineering", "Finance", "Marketing", "Sales")
+AGE_RANGE = (22, 66)
+SALARY_RANGE = (40_000, 150_000)
+DEFAULT_CHUNK_ROWS = 1_000_000
+SPIRE_KEYS = tuple(f"{h:02d}:00-{h + 1:02d}:00" for h in range(24))
+SPIRE_STREETS = (
+    "Via Emilia Levante", "Via Emilia Ponente", "Via Stalingrado",
+    "Via San Donato", "Via Saragozza", "Via Massarenti", "Via Mazzini",
+    "Viale Masini", "Viale Pietramellara", "Via Irnerio", "Via Marco Polo",
+    "Via della Beverara",
+)  # fmt: skip
+SPIRE_DIRECTIONS = ("N", "NE", "E", "SE", "S", "SO", "O", "NO")
+SPIRE_TYPES = ("Principale", "Accessoria")
+SPIRE_FIRST_DAY = np.datetime64("2023-01-01")
+SPIRE_SENSORS = 500
+FIELD_TYPES = {
+    "id": "sc:Integer",
+    "name": "sc:Text",
+    "age": "sc:Integer",
+    "city": "sc:Text",
+    "salary": "sc:Integer",
+    "department": "sc:Text",
+}
+# The croissant JSON-LD context is taken from the checked-in example
+CROISSANT_EXAMPLE = (
+    Path(__file__).resolve().parent / "s0-crud" / "data" / "croissant" / "metadata.json"
+)
+logger = configure_logging(__name__)
+
+
+def sample_columns(rows: int, seed: int = 0, start: int = 0) -> dict[str, np.ndarray]:
+    """
+    Return rows rows of the synthetic table starting at row start, as
+    numpy arrays keyed by column name. ids are 1-based row numbers.
+    """
+    rng = np.random.default_rng([seed, start])
+    return {
+        "id": np.arange(start + 1, start + rows + 1, dtype=np.int64),
+        "name": np.asarray(NAMES, dtype=object)[rng.integers(0, len(NAMES), rows)],
+        "age": rng.integers(*AGE_RANGE, rows, dtype=np.int64),
+        "city": np.asarray(CITIES, dtype=object)[rng.integers(0, len(CITIES), rows)],
+        "salary": rng.integers(*SALARY_RANGE, rows, dtype=np.int64) // 1000 * 1000,
+        "department": np.asarray(DEPARTMENTS, dtype=object)[
+            rng.integers(0, len(DEPARTMENTS), rows)
+        ],
+    }
+
+
+def spire_columns(
+    rows: int, seed: int = 0, start: int = 0, sensors: int = SPIRE_SENSORS
+) -> dict[str, np.ndarray]:
+    """
+    Return rows rows of the synthetic spire table starting at row start, as
+    numpy arrays keyed by column name. Row i holds sensor i % sensors on
+    day i // sensors from 2023-01-01; the sensor metadata only depends on
+    the seed, the hourly counts on (seed, start).
+    """
+    sensor_rng = np.random.default_rng([seed, sensors])
+    longitude = 11.34 + sensor_rng.normal(0, 0.03, sensors).round(6)
+    latitude = 44.49 + sensor_rng.normal(0, 0.02, sensors).round(6)
+    metadata = {
+        "codice spira": np.asarray(
+            [f"0.{i:03d} 4.{i % 97:02d} 1" for i in range(sensors)], dtype=object
+        ),
+        "longitudine": longitude,
+        "latitudine": latitude,
+        "Livello": sensor_rng.integers(0, 3, sensors),
+        "tipologia": np.asarray(SPIRE_TYPES, dtype=object)[
+            sensor_rng.integers(0, len(SPIRE_TYPES), sensors)
+        ],
+        "codice": np.arange(1, sensors + 1),
+        "codice arco": sensor_rng.integers(100_000, 999_999, sensors),
+        "codice via": sensor_rng.integers(1_000, 99_999, sensors),
+        "Nome via": np.asarray(SPIRE_STREETS, dtype=object)[
+            sensor_rng.integers(0, len(SPIRE_STREETS), sensors)
+        ],
+        "stato": np.full(sensors, "A", dtype=object),
+        "direzione": np.asarray(SPIRE_DIRECTIONS, dtype=object)[
+            sensor_rng.integers(0, len(SPIRE_DIRECTIONS), sensors)
+        ],
+        "angolo": sensor_rng.integers(0, 360, sensors).astype(np.float64),
+        "geopoint": np.asarray(
+            [f"{lat}, {lon}" for lat, lon in zip(latitude, longitude)], dtype=object
+        ),
+    }
+
+    index = np.arange(start, start + rows)
+    sensor = index % sensors
+    days = SPIRE_FIRST_DAY + index // sensors
+    rng = np.random.default_rng([seed, start])
+    # Traffic peaks around midday, few vehicles at night
+    volume = 20 + 400 * np.sin(np.pi * np.arange(24) / 24) ** 2
+    counts = rng.poisson(volume, (rows, len(SPIRE_KEYS)))
+    columns = {"data": np.datetime_as_string(days, unit="D").astype(object)}
+    columns.update((name, values[sensor]) for name, values in metadata.items())
+    columns.update((key, counts[:, i]) for i, key in enumerate(SPIRE_KEYS))
+    return columns
+
+
+def iter_chunks(
+    rows: int,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    start: int = 0,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Yield rows rows starting at row start in chunks of at most chunk_rows."""
+    for offset in range(start, start + rows, chunk_rows):
+        yield sample_columns(min(chunk_rows, start + rows - offset), seed, offset)
+
+
+def _record_batches(
+    rows: int, seed: int, chunk_rows: int, start: int = 0
+) -> Iterator[pa.RecordBatch]:
+    import pyarrow as pa
+
+    schema = arrow_schema()
+    for chunk in iter_chunks(rows, seed, chunk_rows, start):
+        yield pa.record_batch([chunk[c] for c in COLUMNS], schema=schema)
+
+
+def arrow_schema() -> pa.Schema:
+    """Return the Arrow schema of the synthetic table."""
+    import pyarrow as pa
+
+    return pa.schema(
+        (c, pa.int64() if FIELD_TYPES[c] == "sc:Integer" else pa.string())
+        for c in COLUMNS
+    )
+
+
+def write_csv(
+    path: str | Path,
+    rows: int,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Path:
+    """Write the synthetic table as a CSV file with a header, chunk by chunk."""
+    import pyarrow.csv as pa_csv
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unquoted like sample.csv, no value contains a separator
+    options = pa_csv.WriteOptions(include_header=False, quoting_style="none")
+    with open(path, "wb") as f:
+        f.write((",".join(COLUMNS) + "\n").encode())
+        with pa_csv.CSVWriter(f, arrow_schema(), write_options=options) as writer:
+            for batch in _record_batches(rows, seed, chunk_rows):
+                writer.write_batch(batch)
+    return path
+
+
+def write_parquet(
+    path: str | Path,
+    rows: int,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    start: int = 0,
+) -> Path:
+    """
+    Write rows rows of the synthetic table starting at row start as a
+    parquet file with one row group per chunk.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(str(path), arrow_schema()) as writer:
+        for batch in _record_batches(rows, seed, chunk_rows, start):
+            table = pa.Table.from_batches([batch])
+            writer.write_table(table, row_group_size=len(batch))
+    return path
+
+
+def sha256sum(path: str | Path, block_size: int = 2**20) -> str:
+    """Return the hex SHA-256 digest of a file, read one block at a time."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def croissant_metadata(
+    name: str,
+    includes: str,
+    record_set: str = "persons",
+    parts: dict[str, str] | None = None,
+) -> dict[str, typing.Any]:
+    """
+    Return croissant metadata describing parquet files matched by the
+    includes glob as a fileSet, with a record set over every column.
+
+    parts maps the contentUrl of each file to its SHA-256 digest. Each one
+    is also listed as a FileObject, so that log_croissant uploads it; the
+    record set reads the fileSet, so no record is counted twice.
+    """
+    context = json.loads(CROISSANT_EXAMPLE.read_text())["@context"]
+    file_set = f"{name}-files"
+    file_objects = [
+        {
+            "@type": "cr:FileObject",
+            "@id": Path(url).stem,
+            "name": Path(url).stem,
+            "contentUrl": url,
+            "encodingFormat": "application/x-parquet",
+            "sha256": digest,
+        }
+        for url, digest in (parts or {}).items()
+    ]
+    return {
+        "@context": context,
+        "@type": "sc:Dataset",
+        "name": name,
+        "description": "Synthetic persons split over partitioned parquet files.",
+        "conformsTo": "http://mlcommons.org/croissant/1.0",
+        "license": "https://creativecommons.org/licenses/by/4.0/",
+        "url": "http://whataever.com",
+        "distribution": [
+            *file_objects,
+            {
+                "@type": "cr:FileSet",
+                "@id": file_set,
+                "name": file_set,
+                "encodingFormat": "application/x-parquet",
+                "includes": includes,
+            }
+        ],
+        "recordSet": [
+            {
+                "@type": "cr:RecordSet",
+                "@id": record_set,
+                "name": record_set,
+                "description": "List of persons.",
+                "field": [
+                    {
+                        "@type": "cr:Field",
+                        "@id": f"{record_set}/{column}",
+                        "name": f"{record_set}/{column}",
+                        "dataType": data_type,
+                        "source": {
+                            "fileSet": {"@id": file_set},
+                            "extract": {"column": column},
+                        },
+                    }
+                    for column, data_type in FIELD_TYPES.items()
+                ],
+            }
+        ],
+    }
+
+
+def write_croissant(
+    directory: str | Path,
+    rows: int,
+    files: int = 1,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Path:
+    """
+    Write the synthetic table as files parquet files under directory/data
+    and a metadata.json describing them as a croissant fileSet and as one
+    FileObject each. Return the path of metadata.json.
+    """
+    directory = Path(directory)
+    (directory / "data").mkdir(parents=True, exist_ok=True)
+    rows_per_file = max(-(-rows // max(files, 1)), 1)
+    # An empty table still gets one part, so the fileSet matches a file
+    starts = range(0, rows, rows_per_file) or [0]
+    parts = {}
+    for index, start in enumerate(starts):
+        url = f"data/part-{index:05d}.parquet"
+        write_parquet(
+            directory / url,
+            min(rows_per_file, rows - start),
+            seed,
+            chunk_rows,
+            start,
+        )
+        parts[url] = sha256sum(directory / url)
+    metadata = croissant_metadata(
+        f"synthetic-{rows}", "data/*.parquet", parts=parts
+    )
+    path = directory / "metadata.json"
+    path.write_text(json.dumps(metadata, indent=2))
+    return path
+
+
+def write_fixtures(
+    directory: str | Path, rows: int, files: int = 1, seed: int = 0
+) -> Path:
+    """
+    Write scaled-up copies of s0-crud/data under directory: sample.csv and
+    croissant/metadata.json with its parquet files. Return directory.
+    """
+    directory = Path(directory)
+    write_csv(directory / "sample.csv", rows, seed)
+    write_croissant(directory / "croissant", rows, files, seed)
+    return directory
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Write synthetic sample tables.")
+    parser.add_argument("format", choices=("csv", "parquet", "croissant"))
+    parser.add_argument(
+        "dest", type=Path, help="Output file, or directory for croissant."
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Table size.")
+    parser.add_argument(
+        "--files", type=int, default=1, help="Parquet files of a croissant dataset."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help="Rows generated and written at a time, and parquet row group size.",
+    )
+    args = parser.parse_args(argv)
+    if args.rows < 0 or args.files < 1 or args.chunk_rows < 1:
+        parser.error("--rows must be >= 0, --files and --chunk-rows >= 1")
+    return args
+
+
+def main(argv=None) -> None:
+    """Write a synthetic table and report the write throughput."""
+    args = parse_args(argv)
+    start = time.monotonic()
+    if args.format == "csv":
+        path = write_csv(args.dest, args.rows, args.seed, args.chunk_rows)
+    elif args.format == "parquet":
+        path = write_parquet(args.dest, args.rows, args.seed, args.chunk_rows)
+    else:
+        path = write_croissant(
+            args.dest, args.rows, args.files, args.seed, args.chunk_rows
+        )
+    elapsed = time.monotonic() - start
+    written = sum(
+        p.stat().st_size
+        for p in ([path] if path.suffix != ".json" else path.parent.rglob("*"))
+        if p.is_file()
+    )
+    logger.info(
+        "Wrote %s rows (%.1f MB) to %s in %.2fs, %.0f rows/s, peak RSS %.0f MiB",
+        args.rows,
+        written / 1e6,
+        path,
+        elapsed,
+        args.rows / elapsed if elapsed else 0.0,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    )
+
+
+if __name__ == "__main__":
+    main()
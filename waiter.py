@@ -0,0 +1,150 @@
+"""
+Polling helpers for eventually consistent backend operations.
+
+Instead of sleeping a fixed amount of time after a create or delete, the
+helpers below poll the real get/list calls with exponential backoff until
+the expected condition holds or a deadline expires.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+DEFAULT_TIMEOUT = float(os.environ.get("WAITER_TIMEOUT", "60"))
+INITIAL_INTERVAL = 0.1
+MAX_INTERVAL = 2.0
+BACKOFF_FACTOR = 2.0
+
+# Seconds spent in waiters, in a mutable cell so that work run in another
+# thread with a copy of the caller's context adds to the caller's total
+_waited: contextvars.ContextVar[list[float]] = contextvars.ContextVar("waited")
+_waited_lock = threading.Lock()
+
+
+def _waited_cell() -> list[float]:
+    cell = _waited.get(None)
+    if cell is None:
+        cell = [0.0]
+        _waited.set(cell)
+    return cell
+
+
+def waited_time() -> float:
+    """
+    Return the total seconds the current context has spent inside waiters,
+    including waiters run on other threads with a copy of this context.
+
+    Callers take the difference between two readings to attribute waiting
+    time to a block of code.
+    """
+    return _waited_cell()[0]
+
+
+def wait_until(
+    condition: Callable[[], typing.Any],
+    timeout: float = DEFAULT_TIMEOUT,
+    description: str = "condition",
+) -> typing.Any:
+    """
+    Poll condition until it returns a truthy value and return that value.
+
+    Raises TimeoutError if the condition still does not hold once the
+    deadline has expired.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = INITIAL_INTERVAL
+    try:
+        while True:
+            result = condition()
+            if result:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Timed out after {timeout}s waiting for {description}"
+                )
+            time.sleep(min(interval, remaining))
+            interval = min(interval * BACKOFF_FACTOR, MAX_INTERVAL)
+    finally:
+        cell = _waited_cell()
+        with _waited_lock:
+            cell[0] += time.monotonic() - start
+
+
+def _matching(
+    entities: Iterable[typing.Any],
+    name: str | None,
+    entity_id: str | None,
+) -> list[typing.Any]:
+    return [
+        e
+        for e in entities
+        if (name is None or e.name == name) and (entity_id is None or e.id == entity_id)
+    ]
+
+
+def wait_until_absent(
+    list_fn: Callable[[], Iterable[typing.Any]],
+    name: str | None = None,
+    entity_id: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> None:
+    """
+    Wait until list_fn returns no entity matching name and entity_id.
+
+    With no filter, wait until the listing is empty.
+    """
+    wait_until(
+        lambda: not _matching(list_fn(), name, entity_id),
+        timeout=timeout,
+        description=f"absence of name={name} id={entity_id}",
+    )
+
+
+def wait_until_present(
+    list_fn: Callable[[], Iterable[typing.Any]],
+    name: str | None = None,
+    entity_id: str | None = None,
+    count: int = 1,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[typing.Any]:
+    """
+    Wait until list_fn returns at least count entities matching name and
+    entity_id, and return them.
+    """
+
+    def _check() -> list[typing.Any] | None:
+        found = _matching(list_fn(), name, entity_id)
+        return found if len(found) >= count else None
+
+    return wait_until(
+        _check,
+        timeout=timeout,
+        description=f"{count} entities with name={name} id={entity_id}",
+    )
+
+
+def wait_until_state(
+    get_fn: Callable[[], typing.Any],
+    states: Iterable[str],
+    timeout: float = DEFAULT_TIMEOUT,
+) -> typing.Any:
+    """
+    Wait until the entity returned by get_fn reaches one of states, and
+    return it.
+    """
+    states = set(states)
+
+    def _check() -> typing.Any:
+        entity = get_fn()
+        return entity if entity.status.state in states else None
+
+    return wait_until(_check, timeout=timeout, description=f"state in {sorted(states)}")